@@ -0,0 +1,76 @@
+#   benchmarks/bench_cli_startup.py
+"""Compare `dev-platform --help` startup with and without eager engine creation.
+
+Usage: python benchmarks/bench_cli_startup.py [--runs N] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src" / "dev_platform"
+
+#   The lazy path is the real CLI. The eager path reproduces the old behaviour:
+#   import SQLAlchemy and every layer, and build the engine, before parsing args.
+LAZY = "import sys; sys.argv = ['dev-platform', '--help']; import main; main.main()"
+EAGER = (
+    "import sys; sys.argv = ['dev-platform', '--help'];"
+    "import infrastructure.database.repositories, application.user.usecases;"
+    "from infrastructure.database.session import get_engine; get_engine();"
+    "import main; main.main()"
+)
+
+
+def _time_run(code: str, env: dict) -> float:
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC,
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return (time.perf_counter() - started) * 1000
+
+
+def run(runs: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{Path(tmp) / 'startup.db'}")
+        results = {}
+        for name, code in (("lazy", LAZY), ("eager", EAGER)):
+            _time_run(code, env)  #   Warm the OS file cache and .pyc files
+            samples = [_time_run(code, env) for _ in range(runs)]
+            results[name] = {
+                "median_ms": statistics.median(samples),
+                "min_ms": min(samples),
+                "runs": runs,
+            }
+    results["speedup"] = results["eager"]["median_ms"] / results["lazy"]["median_ms"]
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--json", action="store_true", help="print machine-readable JSON"
+    )
+    args = parser.parse_args()
+    results = run(args.runs)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name in ("lazy", "eager"):
+        print(
+            f"{name:>5}: median {results[name]['median_ms']:.1f} ms, min {results[name]['min_ms']:.1f} ms"
+        )
+    print(f"speedup: {results['speedup']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
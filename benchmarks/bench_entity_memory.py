@@ -0,0 +1,101 @@
+#   benchmarks/bench_entity_memory.py
+"""Compare the memory held by N users as dict-based dataclasses, slotted User
+entities and a columnar UserBatch.
+
+Usage: python benchmarks/bench_entity_memory.py [--sizes 100000 1000000] [--output results.json]
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from support import metadata, write_report
+
+from domain.user.batch import UserBatch
+from domain.user.entities import User
+
+
+@dataclass
+class DictUser:
+    #   The entity as it was before slots, kept here as the reference point
+    id: Optional[int]
+    name: str
+    email: str
+
+
+def _rows(size: int):
+    #   Fresh strings per row, as the database driver would produce them
+    return ((i, f"User {i}", f"user{i}@bench.example") for i in range(1, size + 1))
+
+
+def _strings_only(size: int) -> List[Any]:
+    #   Just the name and email strings in two lists: the floor any approach pays
+    names, emails = [], []
+    for _, name, email in _rows(size):
+        names.append(name)
+        emails.append(email)
+    return [names, emails]
+
+
+APPROACHES: Dict[str, Callable[[int], Any]] = {
+    "strings_only": _strings_only,
+    "dict_dataclass": lambda size: [
+        DictUser(i, name, email) for i, name, email in _rows(size)
+    ],
+    "slotted_user": lambda size: [
+        User(i, name, email) for i, name, email in _rows(size)
+    ],
+    "user_batch": lambda size: UserBatch.from_rows(_rows(size)),
+}
+
+
+def measure(build: Callable[[int], Any], size: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        held = build(size)
+        current = tracemalloc.get_traced_memory()[0]
+        del held
+        return current
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument(
+        "--output", default=None, help="JSON file to write (default: table on stdout)"
+    )
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        baseline = measure(_strings_only, size)
+        for name, build in APPROACHES.items():
+            held = measure(build, size)
+            results.append(
+                {
+                    "name": f"entity_memory.{name}",
+                    "size": size,
+                    "bytes": held,
+                    "bytes_per_user": held / size,
+                    #   What the container itself costs on top of the name/email strings
+                    "overhead_bytes_per_user": (held - baseline) / size,
+                }
+            )
+    if args.output:
+        write_report(args.output, {"meta": metadata(), "results": results})
+        return 0
+    for entry in results:
+        print(
+            f"{entry['size']:>9}  {entry['name']:<30} {entry['bytes_per_user']:8.1f} B/user "
+            f"({entry['overhead_bytes_per_user']:+.1f} over strings)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#   benchmarks/bench_read_path.py
+"""Compare the repository's Core read path with ORM entity loading.
+
+Usage: python benchmarks/bench_read_path.py [--sizes 100000 1000000] [--output results.json]
+
+For listing, export and point lookups, the "orm" variant loads UserModel
+instances through the session (identity map, instance state) and copies them
+into User, which is what SQLUserRepository used to do. The "core" variant is
+the repository as it is now. Each is reported as rows per second and peak
+traced memory on an SQLite file database, timed as the median of --runs
+runs after --warmup untimed ones.
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from support import (
+    make_engine,
+    metadata,
+    peak_memory,
+    result,
+    sample,
+    sample_ids,
+    seed_email,
+    seed_users,
+    write_report,
+)
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+from domain.user.entities import User
+from infrastructure.database.models import UserModel
+from infrastructure.database.repositories import SQLUserRepository
+
+
+def _orm_find_all(session: Session) -> List[User]:
+    return [
+        User(id=u.id, name=u.name, email=u.email)
+        for u in session.query(UserModel).all()
+    ]
+
+
+def _orm_export(session: Session, batch_size: int) -> int:
+    count = 0
+    stmt = (
+        select(UserModel).order_by(UserModel.id).execution_options(yield_per=batch_size)
+    )
+    for models in session.scalars(stmt).partitions():
+        count += len([User(id=u.id, name=u.name, email=u.email) for u in models])
+    return count
+
+
+def _orm_find_by_id(session: Session, user_id: int) -> User:
+    u = session.get(UserModel, user_id)
+    return User(id=u.id, name=u.name, email=u.email)
+
+
+def _orm_find_by_email(session: Session, email: str) -> User:
+    u = session.scalars(
+        select(UserModel).where(func.lower(UserModel.email) == email.lower())
+    ).first()
+    return User(id=u.id, name=u.name, email=u.email)
+
+
+def bench(size: int, workdir: Path, args) -> List[Dict[str, Any]]:
+    engine = make_engine("sqlite-file", workdir, size)
+    seed_users(engine, size)
+    factory = sessionmaker(autoflush=False, bind=engine)
+    ids = sample_ids(size, args.lookup_ops)
+    emails = [seed_email(i - 1) for i in ids]
+    cases: Dict[str, tuple] = {
+        "find_all.orm": (size, _orm_find_all),
+        "find_all.core": (size, lambda s: SQLUserRepository(s).find_all()),
+        "export.orm": (size, lambda s: _orm_export(s, args.batch_size)),
+        "export.core": (
+            size,
+            lambda s: sum(
+                len(b) for b in SQLUserRepository(s).stream_batches(args.batch_size)
+            ),
+        ),
+        "find_by_id.orm": (len(ids), lambda s: [_orm_find_by_id(s, i) for i in ids]),
+        "find_by_id.core": (
+            len(ids),
+            lambda s: [SQLUserRepository(s).find_by_id(i) for i in ids],
+        ),
+        "find_by_email.orm": (
+            len(emails),
+            lambda s: [_orm_find_by_email(s, e) for e in emails],
+        ),
+        "find_by_email.core": (
+            len(emails),
+            lambda s: [SQLUserRepository(s).find_by_email(e) for e in emails],
+        ),
+    }
+    results = []
+    for name, (rows, fn) in cases.items():
+        #   A fresh session per pass so the ORM identity map starts empty
+        def run(fn: Callable[[Session], Any] = fn) -> Any:
+            with factory() as session:
+                return fn(session)
+
+        samples = sample(run, args.runs, args.warmup)
+        results.append(
+            result(
+                f"read_path.{name}",
+                "sqlite-file",
+                size,
+                rows,
+                samples,
+                peak_memory(run),
+            )
+        )
+    engine.dispose()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument(
+        "--lookup-ops", type=int, default=5000, help="point lookups per run"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=10000, help="rows per export batch"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="timed runs per case; the median is reported",
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="untimed runs before the timed ones"
+    )
+    parser.add_argument(
+        "--output", default=None, help="JSON file to write (default: table on stdout)"
+    )
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            print(f"running with {size} users", file=sys.stderr)
+            results.extend(bench(size, Path(tmp), args))
+    if args.output:
+        write_report(args.output, {"meta": metadata(), "results": results})
+        return 0
+    for entry in results:
+        print(
+            f"{entry['size']:>9}  {entry['name']:<30} {entry['ops_per_sec']:>12,.0f} rows/s "
+            f"{entry['peak_memory_bytes'] / 2**20:9.1f} MiB peak"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#   benchmarks/bench_repository.py
+"""Benchmark the user use cases and SQLUserRepository on seeded SQLite databases.
+
+Usage:
+    python benchmarks/bench_repository.py --output results.json
+    python benchmarks/bench_repository.py --sizes 10000 --baseline results.json
+
+Each backend (SQLite file, SQLite in-memory) is seeded with every requested
+size (10k, 100k and 1M users by default). Every benchmark runs --warmup
+untimed passes and then --runs timed ones. Results are written as JSON; with
+--baseline the run exits with status 1 if any benchmark's median time per
+operation regressed by more than --threshold.
+"""
+import argparse
+import itertools
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from support import (
+    BACKENDS,
+    compare,
+    make_engine,
+    metadata,
+    peak_memory,
+    result,
+    sample,
+    sample_ids,
+    seed_email,
+    seed_users,
+    write_report,
+)
+
+from sqlalchemy.orm import sessionmaker
+from application.user.dtos import UserCreateDTO
+from application.user.usecases import CreateUserUseCase, ListUsersUseCase
+from domain.user.entities import User
+from infrastructure.database.repositories import SQLUserRepository
+
+
+def bench_backend(backend: str, size: int, workdir: Path, args) -> List[Dict[str, Any]]:
+    engine = make_engine(backend, workdir, size)
+    seed_users(engine, size)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    results = []
+
+    def record(name, ops, fn, memory=False):
+        def run():
+            with factory() as session:
+                return fn(SQLUserRepository(session))
+
+        samples = sample(run, args.runs, args.warmup)
+        results.append(
+            result(
+                name, backend, size, ops, samples, peak_memory(run) if memory else None
+            )
+        )
+
+    ids = sample_ids(size, args.lookup_ops)
+    emails = [seed_email(i - 1) for i in ids]
+
+    #   Read paths first so every read sees exactly `size` rows
+    record(
+        "usecase.list_users.execute",
+        1,
+        lambda repo: ListUsersUseCase(repo).execute(),
+        memory=True,
+    )
+    record(
+        "usecase.list_users.stream",
+        1,
+        lambda repo: sum(
+            1 for _ in ListUsersUseCase(repo).stream(page_size=args.page_size)
+        ),
+        memory=True,
+    )
+    record("repository.find_all", 1, lambda repo: repo.find_all())
+    record(
+        "repository.find_all_batch", 1, lambda repo: repo.find_all_batch(), memory=True
+    )
+    record(
+        "repository.iter_all.page",
+        args.lookup_ops,
+        lambda repo: [
+            list(repo.iter_all(page_size=100, after_id=i, limit=100)) for i in ids
+        ],
+    )
+    record(
+        "repository.find_by_id",
+        args.lookup_ops,
+        lambda repo: [repo.find_by_id(i) for i in ids],
+    )
+    record(
+        "repository.find_by_email",
+        args.lookup_ops,
+        lambda repo: [repo.find_by_email(e) for e in emails],
+    )
+    probe = emails + [f"missing{i}@bench.example" for i in range(args.lookup_ops)]
+    record("repository.exists_many", len(probe), lambda repo: repo.exists_many(probe))
+
+    #   Write paths add rows with fresh emails; every pass uses new ones
+    passes = itertools.count()
+
+    def create_users(repo):
+        use_case = CreateUserUseCase(repo)
+        k = next(passes)
+        for i in range(args.create_ops):
+            use_case.execute(
+                UserCreateDTO(name=f"New User {i}", email=f"new{k}.{i}@bench.example")
+            )
+
+    def save_many(repo):
+        k = next(passes)
+        return repo.save_many(
+            (
+                User(id=None, name=f"Bulk User {i}", email=f"bulk{k}.{i}@bench.example")
+                for i in range(args.bulk_ops)
+            ),
+            batch_size=args.batch_size,
+        )
+
+    record("usecase.create_user.execute", args.create_ops, create_users)
+    record("repository.save_many", args.bulk_ops, save_many)
+    engine.dispose()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10000, 100000, 1000000]
+    )
+    parser.add_argument(
+        "--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS)
+    )
+    parser.add_argument(
+        "--create-ops", type=int, default=500, help="CreateUserUseCase calls per run"
+    )
+    parser.add_argument(
+        "--lookup-ops", type=int, default=1000, help="point lookups per run"
+    )
+    parser.add_argument(
+        "--bulk-ops", type=int, default=10000, help="users inserted by save_many"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="timed runs per benchmark; the median is reported",
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="untimed runs before the timed ones"
+    )
+    parser.add_argument(
+        "--output", default="-", help="JSON file to write ('-' for stdout)"
+    )
+    parser.add_argument("--baseline", help="previous JSON report to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%"
+    )
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in args.backends:
+            for size in args.sizes:
+                print(f"running {backend} with {size} users", file=sys.stderr)
+                results.extend(bench_backend(backend, size, Path(tmp), args))
+    report = {"meta": metadata(), "results": results}
+    write_report(args.output, report)
+
+    if args.baseline:
+        regressions = compare(
+            json.loads(Path(args.baseline).read_text(encoding="utf-8")),
+            report,
+            args.threshold,
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
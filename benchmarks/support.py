@@ -0,0 +1,170 @@
+#   benchmarks/support.py
+"""Shared helpers for the benchmark scripts: import path, seeding, timing, JSON."""
+import json
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src" / "dev_platform"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))  #   Same layout main.py runs with
+
+import sqlalchemy  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from infrastructure.database.models import Base, UserModel  # noqa: E402
+from infrastructure.database.session import build_engine  # noqa: E402
+
+SEED_CHUNK = 10000
+BACKENDS = ("sqlite-file", "sqlite-memory")
+
+
+def make_engine(backend: str, workdir: Path, size: int):
+    if backend == "sqlite-file":
+        path = workdir / f"bench_{size}.db"
+        path.unlink(missing_ok=True)
+        return build_engine(f"sqlite:///{path}")
+    if backend == "sqlite-memory":
+        return build_engine("sqlite://")  #   One shared connection for the whole run
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def seed_email(i: int) -> str:
+    return f"user{i}@bench.example"
+
+
+def seed_users(engine, size: int) -> None:
+    #   Core executemany: seeding is setup, not something we measure
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for start in range(0, size, SEED_CHUNK):
+            stop = min(start + SEED_CHUNK, size)
+            conn.execute(
+                insert(UserModel),
+                [
+                    {"name": f"Bench User {i}", "email": seed_email(i)}
+                    for i in range(start, stop)
+                ],
+            )
+
+
+def sample_ids(size: int, count: int, seed: int = 42) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.randint(1, size) for _ in range(count)]
+
+
+def timed(fn: Callable[[], Any]) -> Tuple[float, Any]:
+    started = time.perf_counter()
+    value = fn()
+    return time.perf_counter() - started, value
+
+
+def sample(fn: Callable[[], Any], runs: int, warmup: int = 1) -> List[float]:
+    #   Warm-up passes fill the SQLite page cache and SQLAlchemy's statement
+    #   cache and are not kept; the timed runs are reported by their median
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+    for _ in range(warmup):
+        fn()
+    return [timed(fn)[0] for _ in range(runs)]
+
+
+def peak_memory(fn: Callable[[], Any]) -> int:
+    #   Separate pass: tracemalloc slows Python down too much to time under it
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def result(
+    name: str,
+    backend: str,
+    size: int,
+    ops: int,
+    samples: Sequence[float],
+    peak_bytes: Optional[int] = None,
+) -> Dict[str, Any]:
+    #   samples are seconds per run of `ops` operations; the *_ms figures are per operation
+    seconds = statistics.median(samples)
+    entry = {
+        "name": name,
+        "backend": backend,
+        "size": size,
+        "ops": ops,
+        "runs": len(samples),
+        "seconds": seconds,
+        "ops_per_sec": ops / seconds if seconds else None,
+        "median_ms": seconds * 1000 / ops if ops else None,
+        "min_ms": min(samples) * 1000 / ops if ops else None,
+        "mean_ms": statistics.fmean(samples) * 1000 / ops if ops else None,
+    }
+    if peak_bytes is not None:
+        entry["peak_memory_bytes"] = peak_bytes
+    return entry
+
+
+def metadata() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+    }
+
+
+def write_report(path: Optional[str], report: Dict[str, Any]) -> None:
+    text = json.dumps(report, indent=2)
+    if path in (None, "-"):
+        print(text)
+    else:
+        Path(path).write_text(text + "\n", encoding="utf-8")
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[str]:
+    #   A regression is a median time per operation (or peak memory) more than
+    #   `threshold` above the baseline for the same benchmark, backend and size.
+    #   Reports written before runs were repeated only have mean_ms, a single run.
+    def key(entry):
+        return entry["name"], entry["backend"], entry["size"]
+
+    previous = {key(entry): entry for entry in baseline.get("results", [])}
+    regressions = []
+    for entry in current.get("results", []):
+        old = previous.get(key(entry))
+        if old is None:
+            continue
+        timing = (
+            "median_ms" if "median_ms" in old and "median_ms" in entry else "mean_ms"
+        )
+        for metric in (timing, "peak_memory_bytes"):
+            before, after = old.get(metric), entry.get(metric)
+            if before and after and after > before * (1 + threshold):
+                regressions.append(
+                    f"{entry['name']} [{entry['backend']}, {entry['size']}] {metric}: "
+                    f"{before:.4g} -> {after:.4g} ({(after / before - 1) * 100:+.0f}%)"
+                )
+    return regressions
@@ -0,0 +1,169 @@
+#   migrations/backfill.py
+"""Chunked, resumable data backfills for Alembic revision scripts.
+
+A backfill walks a table in primary-key ranges and commits each range on its
+own, so no lock is held for the whole run. Progress is checkpointed in the
+``backfill_checkpoints`` table; running the migration again after an
+interruption continues from the last committed range. Example::
+
+    from migrations.backfill import run_backfill
+
+    def upgrade() -> None:
+        run_backfill(
+            'users_email_domain', 'users',
+            "email_domain = substr(email, instr(email, '@') + 1)",
+            where='email_domain IS NULL',
+        )
+
+Each range may be re-run after a crash (the range and its checkpoint are
+committed separately), so the update must be idempotent; a ``where`` that
+skips finished rows is the easiest way to get that.
+
+Starting a backfill commits the schema changes made before it. Put the
+backfill in its own revision, after the one that changes the schema, so that
+rerunning an interrupted upgrade only repeats the backfill.
+
+In offline mode (``alembic upgrade --sql``) the backfill is rendered as a
+single UPDATE in the script, since there is no database to chunk against.
+"""
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Optional, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger("alembic.backfill")
+
+CHECKPOINT_TABLE = "backfill_checkpoints"
+
+_metadata = sa.MetaData()
+checkpoints = sa.Table(
+    CHECKPOINT_TABLE,
+    _metadata,
+    sa.Column("name", sa.String(200), primary_key=True),
+    sa.Column("last_key", sa.BigInteger, nullable=True),
+    sa.Column("rows", sa.BigInteger, nullable=False, default=0),
+    sa.Column("completed", sa.Boolean, nullable=False, default=False),
+    sa.Column("updated_at", sa.DateTime, nullable=False),
+)
+
+#   A SET clause (str) or a callable that updates one key range and returns the row count
+ChunkUpdate = Union[str, Callable[[Connection, int, int], int]]
+
+
+def run_backfill(
+    name: str,
+    table: str,
+    update: ChunkUpdate,
+    *,
+    key: str = "id",
+    where: Optional[str] = None,
+    chunk_size: int = 10000,
+    pause: float = 0.0,
+    progress_every: float = 5.0,
+) -> int:
+    """Backfill ``table`` in ``key`` ranges of ``chunk_size``, sleeping ``pause``
+    seconds between ranges. Returns the number of rows updated by this run."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    condition = f" AND ({where})" if where else ""
+    if context.is_offline_mode():
+        if callable(update):
+            raise RuntimeError(
+                f"Backfill {name!r} runs Python code and cannot be rendered offline"
+            )
+        op.execute(
+            f"UPDATE {table} SET {update}" + (f" WHERE {where}" if where else "")
+        )
+        return 0
+
+    if isinstance(update, str):
+        statement = sa.text(
+            f"UPDATE {table} SET {update} WHERE {key} BETWEEN :low AND :high{condition}"
+        )
+
+        def apply(connection: Connection, low: int, high: int) -> int:
+            return connection.execute(statement, {"low": low, "high": high}).rowcount
+
+    else:
+        apply = update
+
+    #   Commit the schema changes made so far, then let every statement commit
+    #   on its own so each range is durable as soon as it is written.
+    with context.get_context().autocommit_block():
+        connection = op.get_bind()
+        _metadata.create_all(connection, checkfirst=True)
+        state = connection.execute(
+            sa.select(checkpoints).where(checkpoints.c.name == name)
+        ).first()
+        if state is not None and state.completed:
+            logger.info("%s: already completed, skipping", name)
+            return 0
+        if state is None:
+            connection.execute(
+                checkpoints.insert().values(
+                    name=name,
+                    last_key=None,
+                    rows=0,
+                    completed=False,
+                    updated_at=datetime.now(),
+                )
+            )
+        low, high = connection.execute(
+            sa.text(f"SELECT min({key}), max({key}) FROM {table}")
+        ).one()
+        rows_total = state.rows if state is not None else 0
+        if state is not None and state.last_key is not None:
+            low = state.last_key + 1
+            logger.info("%s: resuming after %s=%s", name, key, state.last_key)
+
+        updated = 0
+        started = last_report = time.monotonic()
+        start = low
+        while high is not None and start <= high:
+            end = min(start + chunk_size - 1, high)
+            count = apply(connection, start, end)
+            updated += max(count, 0)
+            rows_total += max(count, 0)
+            connection.execute(
+                checkpoints.update()
+                .where(checkpoints.c.name == name)
+                .values(last_key=end, rows=rows_total, updated_at=datetime.now())
+            )
+            now = time.monotonic()
+            if now - last_report >= progress_every or end == high:
+                done = (end - low + 1) / (high - low + 1)
+                logger.info(
+                    "%s: %s %s/%s (%.1f%%), %d rows updated, %.0f rows/s",
+                    name,
+                    key,
+                    end,
+                    high,
+                    done * 100,
+                    updated,
+                    updated / max(now - started, 1e-9),
+                )
+                last_report = now
+            start = end + 1
+            if pause and start <= high:
+                time.sleep(pause)
+
+        connection.execute(
+            checkpoints.update()
+            .where(checkpoints.c.name == name)
+            .values(completed=True, updated_at=datetime.now())
+        )
+        logger.info("%s: completed, %d rows updated", name, updated)
+        return updated
+
+
+def reset_backfill(name: str) -> None:
+    """Forget the checkpoint of ``name`` (call from ``downgrade``) so it runs again."""
+    if context.is_offline_mode():
+        return  #   Offline scripts never write checkpoints
+    connection = op.get_bind()
+    if sa.inspect(connection).has_table(CHECKPOINT_TABLE):
+        connection.execute(checkpoints.delete().where(checkpoints.c.name == name))
@@ -6,115 +6,63 @@ from src.dev_platform.infrastructure.database.models import Base
 from src.dev_platform.infrastructure.config import DATABASE_URL  #   Corrected import
 
 config = context.config
-config.set_main_option("sqlalchemy.url", DATABASE_URL)
+if DATABASE_URL:
+    config.set_main_option("sqlalchemy.url", DATABASE_URL.replace("%", "%%"))
 
-fileConfig(config.config_file_name)
-connectable = engine_from_config(
-    config.get_section(config.config_ini_section), prefix="sqlalchemy.", poolclass=pool.NullPool
-)
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
 
-with connectable.connect() as connection:
-    context.configure(
-        connection=connection,
-        target_metadata=Base.metadata
-    )
-
-    with context.begin_transaction():
-        context.run_migrations()
-
-# >> CONFIGURAR <<
-# # No topo do arquivo, após as importações existentes
-# import os
-# import sys
-# from sqlalchemy import engine_from_config, pool, MetaData
-
-# # Adicione o caminho do projeto ao sys.path
-# sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-# # Importe seus modelos SQLAlchemy aqui
-# from seu_projeto.domain.models import Base
-
-# # Substitua a linha existente "target_metadata = None" por:
-# target_metadata = Base.metadata
-# ===================================================================================
-
-# ===================================================================================
-# ORIGINAL
-# from logging.config import fileConfig
-
-# from sqlalchemy import engine_from_config
-# from sqlalchemy import pool
-
-# from alembic import context
+target_metadata = Base.metadata
 
-# # this is the Alembic Config object, which provides
-# # access to the values within the .ini file in use.
-# config = context.config
 
-# # Interpret the config file for Python logging.
-# # This line sets up loggers basically.
-# if config.config_file_name is not None:
-#     fileConfig(config.config_file_name)
+def include_object(obj, name, type_, reflected, compare_to):
+    #   backfill_checkpoints belongs to migrations/backfill.py, not to the models;
+    #   the users search index (FTS5 tables or trigram indexes) is hand-written DDL
+    if type_ == "table":
+        return not (name == "backfill_checkpoints" or name.startswith("users_search"))
+    return not (type_ == "index" and name.endswith("_trgm"))
 
-# # add your model's MetaData object here
-# # for 'autogenerate' support
-# # from myapp import mymodel
-# # target_metadata = mymodel.Base.metadata
-# target_metadata = None
 
-# # other values from the config, defined by the needs of env.py,
-# # can be acquired:
-# # my_important_option = config.get_main_option("my_important_option")
-# # ... etc.
-
-
-# def run_migrations_offline() -> None:
-#     """Run migrations in 'offline' mode.
-
-#     This configures the context with just a URL
-#     and not an Engine, though an Engine is acceptable
-#     here as well.  By skipping the Engine creation
-#     we don't even need a DBAPI to be available.
-
-#     Calls to context.execute() here emit the given string to the
-#     script output.
-
-#     """
-#     url = config.get_main_option("sqlalchemy.url")
-#     context.configure(
-#         url=url,
-#         target_metadata=target_metadata,
-#         literal_binds=True,
-#         dialect_opts={"paramstyle": "named"},
-#     )
-
-#     with context.begin_transaction():
-#         context.run_migrations()
+def run_migrations_offline() -> None:
+    """Render the migrations as a SQL script (``alembic upgrade --sql``)."""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
 
+    with context.begin_transaction():
+        context.run_migrations()
 
-# def run_migrations_online() -> None:
-#     """Run migrations in 'online' mode.
 
-#     In this scenario we need to create an Engine
-#     and associate a connection with the context.
+def run_migrations_online() -> None:
+    """Run the migrations against the database.
 
-#     """
-#     connectable = engine_from_config(
-#         config.get_section(config.config_ini_section, {}),
-#         prefix="sqlalchemy.",
-#         poolclass=pool.NullPool,
-#     )
+    Backfills started with ``migrations.backfill.run_backfill`` commit the
+    pending schema changes and then commit each chunk on their own.
+    """
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
 
-#     with connectable.connect() as connection:
-#         context.configure(
-#             connection=connection, target_metadata=target_metadata
-#         )
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            #   A failed revision keeps the ones before it
+            transaction_per_migration=True,
+        )
 
-#         with context.begin_transaction():
-#             context.run_migrations()
+        with context.begin_transaction():
+            context.run_migrations()
 
 
-# if context.is_offline_mode():
-#     run_migrations_offline()
-# else:
-#     run_migrations_online()
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
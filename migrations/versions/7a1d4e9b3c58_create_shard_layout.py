@@ -0,0 +1,38 @@
+"""create shard_layout table
+
+Revision ID: 7a1d4e9b3c58
+Revises: d2f7a4c19e63
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a1d4e9b3c58"
+down_revision: Union[str, None] = "d2f7a4c19e63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    layout = op.create_table(
+        "shard_layout",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("shards", sa.Integer(), nullable=True),
+        sa.Column(
+            "resharding", sa.Boolean(), server_default=sa.false(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    #   The single row ShardedUserRepository checks before every write
+    op.bulk_insert(layout, [{"id": 1, "shards": None, "resharding": False}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("shard_layout")
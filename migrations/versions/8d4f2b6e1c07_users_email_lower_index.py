@@ -0,0 +1,68 @@
+"""case-insensitive index on users.email
+
+Adds a unique functional index on lower(email), used by find_by_email and
+exists_many. Stops before creating it if the table already holds emails
+differing only by case, listing the conflicting rows; merge those accounts
+before upgrading.
+
+Revision ID: 8d4f2b6e1c07
+Revises: 5b1e0c3a9f21
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4f2b6e1c07"
+down_revision: Union[str, None] = "5b1e0c3a9f21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LISTED_CONFLICTS = 50
+
+
+def check_case_duplicates() -> None:
+    """Fail with the rows whose emails differ only by case, if there are any."""
+    if context.is_offline_mode():
+        return  # The rendered CREATE UNIQUE INDEX fails on its own in that case
+    rows = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT id, email FROM users WHERE lower(email) IN "
+                "(SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1) "
+                "ORDER BY lower(email), id"
+            )
+        )
+        .all()
+    )
+    if rows:
+        listed = "\n".join(
+            f"  id={row.id} email={row.email}" for row in rows[:LISTED_CONFLICTS]
+        )
+        more = (
+            f"\n  ... and {len(rows) - LISTED_CONFLICTS} more"
+            if len(rows) > LISTED_CONFLICTS
+            else ""
+        )
+        raise RuntimeError(
+            f"{len(rows)} users share an email with another user ignoring case; merge or rename them "
+            f"before creating ix_users_email_lower:\n{listed}{more}"
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    check_case_duplicates()
+    op.create_index(
+        "ix_users_email_lower", "users", [sa.text("lower(email)")], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_email_lower", table_name="users")
@@ -0,0 +1,74 @@
+"""users search index
+
+Revision ID: a4c9e27d5b18
+Revises: f81b6d3e2a47
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c9e27d5b18"
+down_revision: Union[str, None] = "f81b6d3e2a47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_context().dialect.name
+    if dialect == "sqlite":
+        #   External-content FTS5 table: only the trigram index is stored, the text
+        #   stays in users. Triggers keep it in sync inside the writing statement;
+        #   updates that do not touch name or email (ultimo_acesso, ativo) skip it.
+        op.execute(
+            "CREATE VIRTUAL TABLE users_search USING fts5("
+            "name, email, content='users', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER users_search_ai AFTER INSERT ON users BEGIN "
+            "INSERT INTO users_search(rowid, name, email) VALUES (new.id, new.name, new.email); END"
+        )
+        op.execute(
+            "CREATE TRIGGER users_search_ad AFTER DELETE ON users BEGIN "
+            "INSERT INTO users_search(users_search, rowid, name, email) "
+            "VALUES ('delete', old.id, old.name, old.email); END"
+        )
+        op.execute(
+            "CREATE TRIGGER users_search_au AFTER UPDATE OF name, email ON users BEGIN "
+            "INSERT INTO users_search(users_search, rowid, name, email) "
+            "VALUES ('delete', old.id, old.name, old.email); "
+            "INSERT INTO users_search(rowid, name, email) VALUES (new.id, new.name, new.email); END"
+        )
+        op.execute("INSERT INTO users_search(users_search) VALUES ('rebuild')")
+    elif dialect == "postgresql":
+        #   GIN trigram indexes serve the LIKE '%...%' fallback query
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_users_name_trgm",
+            "users",
+            [sa.text("lower(name) gin_trgm_ops")],
+            postgresql_using="gin",
+        )
+        op.create_index(
+            "ix_users_email_trgm",
+            "users",
+            [sa.text("lower(email) gin_trgm_ops")],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_context().dialect.name
+    if dialect == "sqlite":
+        for trigger in ("users_search_au", "users_search_ad", "users_search_ai"):
+            op.execute(f"DROP TRIGGER {trigger}")
+        op.execute("DROP TABLE users_search")
+    elif dialect == "postgresql":
+        op.drop_index("ix_users_email_trgm", table_name="users")
+        op.drop_index("ix_users_name_trgm", table_name="users")
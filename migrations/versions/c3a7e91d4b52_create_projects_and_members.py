@@ -0,0 +1,68 @@
+"""create projects and project_members tables
+
+Revision ID: c3a7e91d4b52
+Revises: 8d4f2b6e1c07
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a7e91d4b52"
+down_revision: Union[str, None] = "8d4f2b6e1c07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "projects",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("nome", sa.String(length=100), nullable=False),
+        sa.Column("descricao", sa.Text(), nullable=False),
+        sa.Column("data_criacao", sa.DateTime(), nullable=False),
+        sa.Column("responsavel_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["responsavel_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_projects_responsavel_id"), "projects", ["responsavel_id"], unique=False
+    )
+    op.create_table(
+        "project_members",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "project_id", "user_id", name="uq_project_members_project_user"
+        ),
+    )
+    op.create_index(
+        "ix_project_members_project_order",
+        "project_members",
+        ["project_id", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_project_members_user_project",
+        "project_members",
+        ["user_id", "project_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_project_members_user_project", table_name="project_members")
+    op.drop_index("ix_project_members_project_order", table_name="project_members")
+    op.drop_table("project_members")
+    op.drop_index(op.f("ix_projects_responsavel_id"), table_name="projects")
+    op.drop_table("projects")
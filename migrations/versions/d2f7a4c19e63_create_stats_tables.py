@@ -0,0 +1,271 @@
+"""create stats tables
+
+Revision ID: d2f7a4c19e63
+Revises: b6e3d18f0c74
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f7a4c19e63"
+down_revision: Union[str, None] = "b6e3d18f0c74"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+#   Must match STATS_SLOTS in infrastructure/database/stats.py
+SLOTS = 8
+COUNTERS = ("users_active", "users_inactive", "projects", "project_members")
+
+SQLITE_TRIGGERS = {
+    "stats_users_ai": f"""
+        CREATE TRIGGER stats_users_ai AFTER INSERT ON users BEGIN
+            UPDATE stats_counters SET value = value + 1
+             WHERE name = CASE WHEN new.ativo THEN 'users_active' ELSE 'users_inactive' END
+               AND slot = new.id % {SLOTS};
+            INSERT INTO user_access_days (day, active_users)
+            SELECT date(new.ultimo_acesso), 1 WHERE new.ativo AND new.ultimo_acesso IS NOT NULL
+            ON CONFLICT (day) DO UPDATE SET active_users = active_users + 1;
+        END""",
+    "stats_users_ad": f"""
+        CREATE TRIGGER stats_users_ad AFTER DELETE ON users BEGIN
+            UPDATE stats_counters SET value = value - 1
+             WHERE name = CASE WHEN old.ativo THEN 'users_active' ELSE 'users_inactive' END
+               AND slot = old.id % {SLOTS};
+            UPDATE user_access_days SET active_users = active_users - 1
+             WHERE old.ativo AND day = date(old.ultimo_acesso);
+        END""",
+    #   Repeated accesses on the same day (most updates of ultimo_acesso) change nothing
+    "stats_users_au": f"""
+        CREATE TRIGGER stats_users_au AFTER UPDATE OF ativo, ultimo_acesso ON users
+        WHEN old.ativo IS NOT new.ativo OR date(old.ultimo_acesso) IS NOT date(new.ultimo_acesso) BEGIN
+            UPDATE stats_counters SET value = value - 1
+             WHERE old.ativo IS NOT new.ativo
+               AND name = CASE WHEN old.ativo THEN 'users_active' ELSE 'users_inactive' END
+               AND slot = old.id % {SLOTS};
+            UPDATE stats_counters SET value = value + 1
+             WHERE old.ativo IS NOT new.ativo
+               AND name = CASE WHEN new.ativo THEN 'users_active' ELSE 'users_inactive' END
+               AND slot = new.id % {SLOTS};
+            UPDATE user_access_days SET active_users = active_users - 1
+             WHERE old.ativo AND day = date(old.ultimo_acesso);
+            INSERT INTO user_access_days (day, active_users)
+            SELECT date(new.ultimo_acesso), 1 WHERE new.ativo AND new.ultimo_acesso IS NOT NULL
+            ON CONFLICT (day) DO UPDATE SET active_users = active_users + 1;
+        END""",
+    "stats_projects_ai": f"""
+        CREATE TRIGGER stats_projects_ai AFTER INSERT ON projects BEGIN
+            UPDATE stats_counters SET value = value + 1 WHERE name = 'projects' AND slot = new.id % {SLOTS};
+        END""",
+    "stats_projects_ad": f"""
+        CREATE TRIGGER stats_projects_ad AFTER DELETE ON projects BEGIN
+            UPDATE stats_counters SET value = value - 1 WHERE name = 'projects' AND slot = old.id % {SLOTS};
+        END""",
+    "stats_project_members_ai": f"""
+        CREATE TRIGGER stats_project_members_ai AFTER INSERT ON project_members BEGIN
+            UPDATE stats_counters SET value = value + 1 WHERE name = 'project_members' AND slot = new.id % {SLOTS};
+            INSERT INTO project_member_counts (project_id, members) VALUES (new.project_id, 1)
+            ON CONFLICT (project_id) DO UPDATE SET members = members + 1;
+        END""",
+    "stats_project_members_ad": f"""
+        CREATE TRIGGER stats_project_members_ad AFTER DELETE ON project_members BEGIN
+            UPDATE stats_counters SET value = value - 1 WHERE name = 'project_members' AND slot = old.id % {SLOTS};
+            UPDATE project_member_counts SET members = members - 1 WHERE project_id = old.project_id;
+        END""",
+}
+
+POSTGRESQL_FUNCTIONS = {
+    "stats_users": f"""
+        CREATE FUNCTION stats_users() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.ativo IS DISTINCT FROM NEW.ativo) THEN
+                UPDATE stats_counters SET value = value - 1
+                 WHERE name = CASE WHEN OLD.ativo THEN 'users_active' ELSE 'users_inactive' END
+                   AND slot = OLD.id % {SLOTS};
+            END IF;
+            IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND OLD.ativo IS DISTINCT FROM NEW.ativo) THEN
+                UPDATE stats_counters SET value = value + 1
+                 WHERE name = CASE WHEN NEW.ativo THEN 'users_active' ELSE 'users_inactive' END
+                   AND slot = NEW.id % {SLOTS};
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.ativo AND OLD.ultimo_acesso IS NOT NULL THEN
+                UPDATE user_access_days SET active_users = active_users - 1 WHERE day = OLD.ultimo_acesso::date;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.ativo AND NEW.ultimo_acesso IS NOT NULL THEN
+                INSERT INTO user_access_days AS d (day, active_users) VALUES (NEW.ultimo_acesso::date, 1)
+                ON CONFLICT (day) DO UPDATE SET active_users = d.active_users + 1;
+            END IF;
+            RETURN NULL;
+        END $$""",
+    "stats_projects": f"""
+        CREATE FUNCTION stats_projects() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE stats_counters SET value = value + 1 WHERE name = 'projects' AND slot = NEW.id % {SLOTS};
+            ELSE
+                UPDATE stats_counters SET value = value - 1 WHERE name = 'projects' AND slot = OLD.id % {SLOTS};
+            END IF;
+            RETURN NULL;
+        END $$""",
+    "stats_project_members": f"""
+        CREATE FUNCTION stats_project_members() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE stats_counters SET value = value + 1 WHERE name = 'project_members' AND slot = NEW.id % {SLOTS};
+                INSERT INTO project_member_counts AS c (project_id, members) VALUES (NEW.project_id, 1)
+                ON CONFLICT (project_id) DO UPDATE SET members = c.members + 1;
+            ELSE
+                UPDATE stats_counters SET value = value - 1 WHERE name = 'project_members' AND slot = OLD.id % {SLOTS};
+                UPDATE project_member_counts SET members = members - 1 WHERE project_id = OLD.project_id;
+            END IF;
+            RETURN NULL;
+        END $$""",
+}
+
+POSTGRESQL_TRIGGERS = {
+    "stats_users_aid": "CREATE TRIGGER stats_users_aid AFTER INSERT OR DELETE ON users "
+    "FOR EACH ROW EXECUTE FUNCTION stats_users()",
+    "stats_users_au": "CREATE TRIGGER stats_users_au AFTER UPDATE OF ativo, ultimo_acesso ON users FOR EACH ROW "
+    "WHEN (OLD.ativo IS DISTINCT FROM NEW.ativo "
+    "OR OLD.ultimo_acesso::date IS DISTINCT FROM NEW.ultimo_acesso::date) "
+    "EXECUTE FUNCTION stats_users()",
+    "stats_projects_aid": "CREATE TRIGGER stats_projects_aid AFTER INSERT OR DELETE ON projects "
+    "FOR EACH ROW EXECUTE FUNCTION stats_projects()",
+    "stats_project_members_aid": "CREATE TRIGGER stats_project_members_aid AFTER INSERT OR DELETE ON project_members "
+    "FOR EACH ROW EXECUTE FUNCTION stats_project_members()",
+}
+
+TRIGGER_TABLES = {
+    "stats_users_aid": "users",
+    "stats_users_au": "users",
+    "stats_projects_aid": "projects",
+    "stats_project_members_aid": "project_members",
+}
+
+
+#   What each counter counts: table and condition
+COUNTED = {
+    "users_active": ("users", "ativo"),
+    "users_inactive": ("users", "NOT ativo"),
+    "projects": ("projects", None),
+    "project_members": ("project_members", None),
+}
+
+
+def _count_slots(values) -> None:
+    bind = op.get_bind()
+    for slot, ativo, count in bind.execute(
+        sa.text(
+            f"SELECT id % {SLOTS}, ativo, count(*) FROM users GROUP BY id % {SLOTS}, ativo"
+        )
+    ):
+        values["users_active" if ativo else "users_inactive", slot] += count
+    for name, table in (
+        ("projects", "projects"),
+        ("project_members", "project_members"),
+    ):
+        for slot, count in bind.execute(
+            sa.text(f"SELECT id % {SLOTS}, count(*) FROM {table} GROUP BY id % {SLOTS}")
+        ):
+            values[name, slot] += count
+
+
+def _populate() -> None:
+    #   Counts as of now; the triggers created before this keep them current
+    values = {(name, slot): 0 for name in COUNTERS for slot in range(SLOTS)}
+    offline = context.is_offline_mode()
+    if not offline:
+        _count_slots(values)
+    op.bulk_insert(
+        sa.table(
+            "stats_counters",
+            sa.column("name", sa.String),
+            sa.column("slot", sa.Integer),
+            sa.column("value", sa.Integer),
+        ),
+        [
+            {"name": name, "slot": slot, "value": value}
+            for (name, slot), value in values.items()
+        ],
+    )
+    if offline:
+        #   No database to count from while rendering: the script counts itself
+        for name, (table, condition) in COUNTED.items():
+            where = f" AND {condition}" if condition else ""
+            op.execute(
+                f"UPDATE stats_counters SET value = (SELECT count(*) FROM {table} "
+                f"WHERE {table}.id % {SLOTS} = stats_counters.slot{where}) "
+                f"WHERE name = '{name}'"
+            )
+    op.execute(
+        "INSERT INTO user_access_days (day, active_users) "
+        "SELECT date(ultimo_acesso), count(*) FROM users "
+        "WHERE ativo AND ultimo_acesso IS NOT NULL GROUP BY date(ultimo_acesso)"
+    )
+    op.execute(
+        "INSERT INTO project_member_counts (project_id, members) "
+        "SELECT project_id, count(*) FROM project_members GROUP BY project_id"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "stats_counters",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("slot", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("name", "slot"),
+    )
+    op.create_table(
+        "user_access_days",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("active_users", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day"),
+    )
+    op.create_table(
+        "project_member_counts",
+        sa.Column("project_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("members", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("project_id"),
+    )
+    op.create_index(
+        "ix_project_member_counts_members",
+        "project_member_counts",
+        ["members", "project_id"],
+        unique=False,
+    )
+    dialect = op.get_context().dialect.name
+    if dialect == "sqlite":
+        for ddl in SQLITE_TRIGGERS.values():
+            op.execute(ddl)
+    elif dialect == "postgresql":
+        for ddl in POSTGRESQL_FUNCTIONS.values():
+            op.execute(ddl)
+        for ddl in POSTGRESQL_TRIGGERS.values():
+            op.execute(ddl)
+    #   Other databases get no triggers: run rebuild-stats to refresh the tables
+    _populate()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_context().dialect.name
+    if dialect == "sqlite":
+        for trigger in SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER {trigger}")
+    elif dialect == "postgresql":
+        for trigger, table in TRIGGER_TABLES.items():
+            op.execute(f"DROP TRIGGER {trigger} ON {table}")
+        for function in POSTGRESQL_FUNCTIONS:
+            op.execute(f"DROP FUNCTION {function}()")
+    op.drop_index(
+        "ix_project_member_counts_members", table_name="project_member_counts"
+    )
+    op.drop_table("project_member_counts")
+    op.drop_table("user_access_days")
+    op.drop_table("stats_counters")
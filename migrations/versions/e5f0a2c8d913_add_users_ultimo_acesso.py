@@ -0,0 +1,28 @@
+"""add users.ultimo_acesso
+
+Revision ID: e5f0a2c8d913
+Revises: c3a7e91d4b52
+Create Date: 2026-10-16 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f0a2c8d913"
+down_revision: Union[str, None] = "c3a7e91d4b52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("users", sa.Column("ultimo_acesso", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "ultimo_acesso")
@@ -0,0 +1,38 @@
+"""add users.ativo and inactivity index
+
+Revision ID: f81b6d3e2a47
+Revises: e5f0a2c8d913
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f81b6d3e2a47"
+down_revision: Union[str, None] = "e5f0a2c8d913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("ativo", sa.Boolean(), server_default=sa.true(), nullable=False),
+    )
+    op.create_index(
+        "ix_users_ativo_ultimo_acesso",
+        "users",
+        ["ativo", "ultimo_acesso"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_ativo_ultimo_acesso", table_name="users")
+    op.drop_column("users", "ativo")
@@ -0,0 +1,28 @@
+#   src/application/stats/dtos.py
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class InactivityBucketDTO:
+    min_days: int
+    max_days: Optional[int]  #   None: no upper bound
+    users: int  #   Active users whose last access was this many calendar days ago
+
+
+@dataclass
+class ProjectSizeDTO:
+    id: int
+    nome: str
+    members: int
+
+
+@dataclass
+class StatsDTO:
+    active_users: int
+    inactive_users: int
+    never_accessed: int  #   Active users with no recorded access
+    projects: int
+    memberships: int
+    inactivity: List[InactivityBucketDTO] = field(default_factory=list)
+    largest_projects: List[ProjectSizeDTO] = field(default_factory=list)
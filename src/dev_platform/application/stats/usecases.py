@@ -0,0 +1,74 @@
+#   src/application/stats/usecases.py
+from datetime import date, timedelta
+from typing import Optional, Sequence, Tuple
+from domain.stats.interfaces import StatsRepository
+from application.stats.dtos import InactivityBucketDTO, ProjectSizeDTO, StatsDTO
+from shared.exceptions import DomainException
+from shared.profiling import profiled
+
+#   Days since last access, as in Usuario.dias_desde_ultimo_acesso but counted
+#   in calendar days: near a bucket edge the two can differ by one
+INACTIVITY_BUCKETS: Tuple[Tuple[int, Optional[int]], ...] = (
+    (0, 7),
+    (8, 30),
+    (31, 90),
+    (91, 365),
+    (366, None),
+)
+
+
+class GetStatsUseCase:
+    def __init__(self, stats_repository: StatsRepository):
+        self.stats_repository = stats_repository
+
+    @profiled
+    def execute(
+        self,
+        top_projects: int = 10,
+        today: Optional[date] = None,
+        buckets: Sequence[Tuple[int, Optional[int]]] = INACTIVITY_BUCKETS,
+    ) -> StatsDTO:
+        if top_projects < 0:
+            raise DomainException("top_projects must be >= 0")
+        today = today or date.today()
+        active, inactive = self.stats_repository.user_totals()
+        projects, memberships = self.stats_repository.project_totals()
+        #   A bucket starting at 0 days has no upper date bound, so accesses
+        #   stamped in the future (clock skew) still count as recent. The last
+        #   range counts every active user with an access.
+        ranges = [
+            (
+                None if max_days is None else today - timedelta(days=max_days),
+                None if min_days == 0 else today - timedelta(days=min_days),
+            )
+            for min_days, max_days in buckets
+        ]
+        *counts, accessed = self.stats_repository.active_users_by_access_day(
+            ranges + [(None, None)]
+        )
+        largest = (
+            self.stats_repository.largest_projects(top_projects) if top_projects else []
+        )
+        return StatsDTO(
+            active_users=active,
+            inactive_users=inactive,
+            never_accessed=active - accessed,
+            projects=projects,
+            memberships=memberships,
+            inactivity=[
+                InactivityBucketDTO(min_days, max_days, users)
+                for (min_days, max_days), users in zip(buckets, counts)
+            ],
+            largest_projects=[ProjectSizeDTO(*row) for row in largest],
+        )
+
+
+class RebuildStatsUseCase:
+    #   Repairs the summaries after writes that bypassed the triggers (bulk
+    #   loads, restores, databases without trigger support)
+    def __init__(self, stats_repository: StatsRepository):
+        self.stats_repository = stats_repository
+
+    @profiled
+    def execute(self) -> None:
+        self.stats_repository.rebuild()
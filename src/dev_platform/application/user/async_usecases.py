@@ -0,0 +1,56 @@
+#   src/application/user/async_usecases.py
+from typing import AsyncIterator, List, Optional
+from domain.outbox.interfaces import AsyncEventOutbox
+from domain.user.entities import User
+from domain.user.events import UserCreated
+from domain.user.interfaces import AsyncUserRepository
+from application.user.dtos import UserCreateDTO
+from shared.exceptions import DomainException
+from shared.profiling import profiled
+
+
+class AsyncCreateUserUseCase:
+    #   As with CreateUserUseCase, pass the outbox of the same unit of work as
+    #   the repository so that the event commits together with the user
+    def __init__(
+        self,
+        user_repository: AsyncUserRepository,
+        outbox: Optional[AsyncEventOutbox] = None,
+    ):
+        self.user_repository = user_repository
+        self.outbox = outbox
+
+    @profiled
+    async def execute(self, user_create_dto: UserCreateDTO) -> User:
+        user = User(id=None, name=user_create_dto.name, email=user_create_dto.email)
+        try:
+            user.validate()
+        except ValueError as e:
+            raise DomainException(str(e))
+        if await self.user_repository.exists_many([user.email]):
+            #   Checked before any write
+            raise DomainException("Email already registered")
+        user = await self.user_repository.save(user)
+        if self.outbox is not None:
+            await self.outbox.add(UserCreated.from_user(user))
+        return user
+
+
+class AsyncListUsersUseCase:
+    def __init__(self, user_repository: AsyncUserRepository):
+        self.user_repository = user_repository
+
+    @profiled
+    async def execute(self) -> List[User]:
+        return await self.user_repository.find_all()
+
+    @profiled
+    def stream(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[User]:
+        return self.user_repository.iter_all(
+            page_size=page_size, after_id=after_id, limit=limit
+        )
@@ -1,7 +1,48 @@
 #   src/application/user/dtos.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Tuple, Union
+
 
 @dataclass
 class UserCreateDTO:
     name: str
-    email: str
\ No newline at end of file
+    email: str
+
+
+@dataclass
+class ImportFailureDTO:
+    line: int  #   Line number in the source file
+    email: Optional[str]
+    reason: str
+
+
+#   A source line and what was read from it; a line that could not be read at
+#   all (malformed JSON, say) comes as its failure
+UserRowDTO = Tuple[int, Union[UserCreateDTO, ImportFailureDTO]]
+
+
+@dataclass
+class ImportReportDTO:
+    imported: int = 0
+    failures: List[ImportFailureDTO] = field(default_factory=list)
+
+
+@dataclass
+class ValidationReportDTO:
+    checked: int = 0
+    #   One per invalid row, in line order
+    failures: List[ImportFailureDTO] = field(default_factory=list)
+
+
+@dataclass
+class DeactivationReportDTO:
+    cutoff: datetime  #   Users whose last access is older than this are inactive
+    dry_run: bool
+    matched: int = 0  #   Deactivated, or would be in a dry run
+    last_id: Optional[int] = None  #   Highest id processed
+
+    @property
+    def next_id(self) -> Optional[int]:
+        #   start_id that resumes an interrupted run without redoing a chunk
+        return None if self.last_id is None else self.last_id + 1
@@ -1,26 +1,279 @@
 #   src/application/user/usecases.py
-from typing import List
+from array import array
+from itertools import islice
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
+from domain.outbox.interfaces import EventOutbox
+from domain.user.batch import UserBatch
 from domain.user.entities import User
-from domain.user.interfaces import UserRepository
-from application.user.dtos import UserCreateDTO  #   New DTO
+from domain.user.events import UserCreated
+from domain.user.interfaces import AccessRecorder, UserRepository
+from domain.user.validation import CHUNK_SIZE, validate_batch
+from domain.unit_of_work import UnitOfWork
+
+#   New DTO
+from application.user.dtos import (
+    DeactivationReportDTO,
+    ImportFailureDTO,
+    ImportReportDTO,
+    UserCreateDTO,
+    UserRowDTO,
+    ValidationReportDTO,
+)
 from shared.exceptions import DomainException
+from shared.profiling import profiled
+
 
 class CreateUserUseCase:
-    def __init__(self, user_repository: UserRepository):
+    #   Pass the outbox of the same unit of work as the repository so that the
+    #   event commits (or rolls back) together with the user
+    def __init__(
+        self, user_repository: UserRepository, outbox: Optional[EventOutbox] = None
+    ):
         self.user_repository = user_repository
+        self.outbox = outbox
 
+    @profiled
     def execute(self, user_create_dto: UserCreateDTO) -> User:  #   Using DTO
         try:
             user = User(id=None, name=user_create_dto.name, email=user_create_dto.email)
             user.validate()
-            return self.user_repository.save(user)
         except ValueError as e:
             raise DomainException(str(e))
+        if self.user_repository.exists_many([user.email]):
+            #   Checked before any write
+            raise DomainException("Email already registered")
+        user = self.user_repository.save(user)
+        if self.outbox is not None:
+            self.outbox.add(UserCreated.from_user(user))
+        return user
+
+
+class FindUserUseCase:
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    @profiled
+    def execute(
+        self, user_id: Optional[int] = None, email: Optional[str] = None
+    ) -> Optional[User]:
+        if (user_id is None) == (email is None):
+            raise DomainException("Give either a user id or an email")
+        if user_id is not None:
+            return self.user_repository.find_by_id(user_id)
+        return self.user_repository.find_by_email(email)
+
+
+class RecordAccessUseCase:
+    #   Looks the user up and records the access; the recorder decides when
+    #   ultimo_acesso is written, so this is as cheap as a lookup
+    def __init__(self, user_repository: UserRepository, recorder: AccessRecorder):
+        self.user_repository = user_repository
+        self.recorder = recorder
+
+    @profiled
+    def execute(
+        self,
+        user_id: Optional[int] = None,
+        email: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> Optional[User]:
+        user = FindUserUseCase(self.user_repository).execute(user_id, email)
+        if user is not None:
+            self.recorder.record(user.id, now or datetime.now())
+        return user
+
 
 class ListUsersUseCase:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
+    @profiled
     def execute(self) -> List[User]:
         return self.user_repository.find_all()
-    
\ No newline at end of file
+
+    @profiled
+    def stream(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        page_size: int = 1000,
+    ) -> Iterator[User]:
+        return self.user_repository.iter_all(
+            page_size=page_size, after_id=after_id, limit=limit
+        )
+
+
+class SearchUsersUseCase:
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    @profiled
+    def execute(self, query: str, page: int = 1, page_size: int = 20) -> List[User]:
+        if not query.strip():
+            raise DomainException("Search query must not be empty")
+        if page < 1 or page_size < 1:
+            raise DomainException("page and page_size must be at least 1")
+        return self.user_repository.search(
+            query, limit=page_size, offset=(page - 1) * page_size
+        )
+
+
+class ExportUsersUseCase:
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    @profiled
+    def execute(self, batch_size: int = 10000) -> Iterator[UserBatch]:
+        return self.user_repository.stream_batches(batch_size=batch_size)
+
+
+class ImportUsersUseCase:
+    def __init__(
+        self, user_repository: UserRepository, outbox: Optional[EventOutbox] = None
+    ):
+        self.user_repository = user_repository
+        self.outbox = outbox
+
+    @profiled
+    def execute(
+        self, rows: Iterable[UserRowDTO], batch_size: int = 1000
+    ) -> ImportReportDTO:
+        #   One batch at a time: rows are validated (so a row reports every
+        #   problem it has), saved and their events written, and then only the
+        #   failures are kept, so memory does not grow with the file
+        report = ImportReportDTO()
+        source = iter(rows)
+        while True:
+            chunk = list(islice(source, batch_size))
+            if not chunk:
+                break
+            lines, users = self._validate(chunk, report)
+            if not users:
+                continue
+            result = self.user_repository.save_many(users, batch_size=batch_size)
+            report.imported += result.saved
+            for failure in result.failures:
+                report.failures.append(
+                    ImportFailureDTO(
+                        lines[failure.index], failure.user.email, failure.reason
+                    )
+                )
+            if self.outbox is not None:
+                failed = {failure.index for failure in result.failures}
+                self.outbox.add_many(
+                    UserCreated.from_user(user)
+                    for index, user in enumerate(users)
+                    if index not in failed
+                )
+        report.failures.sort(key=lambda f: f.line)
+        return report
+
+    @staticmethod
+    def _validate(
+        chunk: List[UserRowDTO], report: ImportReportDTO
+    ) -> Tuple[List[int], List[User]]:
+        #   Failing rows go to the report; the rest come back as users along
+        #   with their source lines
+        readable: List[Tuple[int, UserCreateDTO]] = []
+        for line, row in chunk:
+            if isinstance(row, ImportFailureDTO):
+                report.failures.append(row)
+            else:
+                readable.append((line, row))
+        errors = validate_batch(
+            [dto.name for _, dto in readable], [dto.email for _, dto in readable]
+        ).by_row()
+        lines: List[int] = []
+        users: List[User] = []
+        for index, (line, dto) in enumerate(readable):
+            if index in errors:
+                report.failures.append(
+                    ImportFailureDTO(line, dto.email, "; ".join(errors[index]))
+                )
+            else:
+                lines.append(line)
+                users.append(User(id=None, name=dto.name, email=dto.email))
+        return lines, users
+
+
+class ValidateUsersUseCase:
+    #   Checks a whole file without saving anything. Rows are read batch_size at
+    #   a time (by default a chunk per worker) and held as two columns so that
+    #   the checks can be split across worker processes; only the failures and
+    #   the emails seen so far, for the duplicate check, outlive a batch.
+    @profiled
+    def execute(
+        self,
+        rows: Iterable[UserRowDTO],
+        workers: int = 1,
+        batch_size: Optional[int] = None,
+    ) -> ValidationReportDTO:
+        if workers < 1 or (batch_size is not None and batch_size < 1):
+            raise DomainException("workers and batch_size must be at least 1")
+        batch_size = batch_size or CHUNK_SIZE * workers
+        report = ValidationReportDTO()
+        seen: Set[str] = set()
+        source = iter(rows)
+        while True:
+            chunk = list(islice(source, batch_size))
+            if not chunk:
+                break
+            report.checked += len(chunk)
+            lines = array("L")
+            names: List[str] = []
+            emails: List[str] = []
+            for line, row in chunk:
+                if isinstance(row, ImportFailureDTO):
+                    report.failures.append(row)
+                    continue
+                lines.append(line)
+                names.append(row.name)
+                emails.append(row.email)
+            errors = validate_batch(names, emails, workers=workers, seen=seen)
+            for row, messages in errors.by_row().items():
+                report.failures.append(
+                    ImportFailureDTO(lines[row], emails[row], "; ".join(messages))
+                )
+        report.failures.sort(key=lambda f: f.line)
+        return report
+
+
+class DeactivateInactiveUsersUseCase:
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    @profiled
+    def execute(
+        self,
+        days: int,
+        chunk_size: int = 10000,
+        start_id: Optional[int] = None,
+        dry_run: bool = False,
+        now: Optional[datetime] = None,
+        on_progress: Optional[Callable[[DeactivationReportDTO], None]] = None,
+    ) -> DeactivationReportDTO:
+        if days < 0 or chunk_size < 1:
+            raise DomainException("days must be >= 0 and chunk_size >= 1")
+        report = DeactivationReportDTO(
+            cutoff=(now or datetime.now()) - timedelta(days=days), dry_run=dry_run
+        )
+        if dry_run:
+            report.matched = self.uow.users.count_inactive(report.cutoff)
+            return report
+
+        low, high = self.uow.users.id_range()
+        if high is None:
+            return report
+        #   Each id range is its own transaction: locks stay short, and after a
+        #   crash the run resumes from the last reported next_id.
+        for chunk_start in range(max(start_id or low, low), high + 1, chunk_size):
+            chunk_end = min(chunk_start + chunk_size - 1, high)
+            report.matched += self.uow.users.deactivate_inactive(
+                report.cutoff, chunk_start, chunk_end
+            )
+            self.uow.commit()
+            report.last_id = chunk_end
+            if on_progress is not None:
+                on_progress(report)
+        return report
@@ -1,17 +1,18 @@
 """Módulo que contém as entidades principais do domínio."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Usuario:
     """
     Representa um usuário no sistema.
-    
+
     Esta entidade encapsula as propriedades e comportamentos associados
-    a um usuário, seguindo os princípios de domínio rico.
-    
+    a um usuário, seguindo os princípios de domínio rico. As instâncias
+    usam ``__slots__`` para economizar memória em processamentos em lote.
+
     Attributes:
         id: Identificador único do usuário.
         nome: Nome completo do usuário.
@@ -20,104 +21,198 @@ class Usuario:
         ultimo_acesso: Data do último acesso do usuário ao sistema.
         ativo: Indica se o usuário está ativo no sistema.
     """
-    
+
     id: int
     nome: str
     email: str
     data_criacao: datetime
     ultimo_acesso: Optional[datetime] = None
     ativo: bool = True
-    
+
     def desativar(self) -> None:
         """
         Desativa o usuário no sistema.
-        
+
         Este método muda o estado do usuário para inativo, impedindo
         que ele faça login ou execute operações no sistema.
         """
         self.ativo = False
-    
+
     def registrar_acesso(self) -> None:
         """
         Registra um novo acesso do usuário ao sistema.
-        
+
         Atualiza o timestamp do último acesso para o momento atual.
         """
         self.ultimo_acesso = datetime.now()
-    
+
     def dias_desde_ultimo_acesso(self) -> Optional[int]:
         """
         Calcula quantos dias se passaram desde o último acesso do usuário.
-        
+
         Returns:
             int: Número de dias desde o último acesso, ou None se nunca acessou.
         """
         if not self.ultimo_acesso:
             return None
-            
+
         dias = (datetime.now() - self.ultimo_acesso).days
         return dias
 
 
-@dataclass
+class Membros:
+    """
+    Conjunto ordenado de IDs de usuários membros de um projeto.
+
+    Baseado em um ``dict`` (que preserva a ordem de inserção), oferece
+    inclusão, remoção e verificação de pertinência em O(1), mantendo
+    os membros na ordem em que foram adicionados.
+
+    Também guarda os IDs removidos desde a criação (ou desde a última
+    chamada a ``limpar_removidos``), para que o repositório apague apenas
+    essas associações, mesmo quando os membros não foram todos carregados.
+    """
+
+    __slots__ = ("_ids", "_removidos")
+
+    def __init__(self, ids: Optional[Iterable[int]] = None):
+        self._ids: Dict[int, None] = dict.fromkeys(ids or ())
+        # Criado na primeira remoção: a maioria dos conjuntos nunca remove
+        self._removidos: Optional[Dict[int, None]] = None
+
+    def adicionar(self, usuario_id: int) -> bool:
+        """Adiciona o ID; retorna False se ele já era membro."""
+        if usuario_id in self._ids:
+            return False
+        self._ids[usuario_id] = None
+        if self._removidos:
+            self._removidos.pop(usuario_id, None)
+        return True
+
+    def remover(self, usuario_id: int) -> bool:
+        """Remove o ID; retorna False se ele não era membro."""
+        if usuario_id not in self._ids:
+            return False
+        del self._ids[usuario_id]
+        if self._removidos is None:
+            self._removidos = {}
+        self._removidos[usuario_id] = None
+        return True
+
+    def removidos(self) -> List[int]:
+        """IDs removidos e não adicionados de novo, na ordem da remoção."""
+        return list(self._removidos or ())
+
+    def limpar_removidos(self) -> None:
+        """Esquece as remoções, depois que elas foram persistidas."""
+        self._removidos = None
+
+    def __contains__(self, usuario_id: object) -> bool:
+        return usuario_id in self._ids
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Membros):
+            return list(self._ids) == list(other._ids)
+        if isinstance(other, (list, tuple)):
+            return list(self._ids) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Membros({list(self._ids)!r})"
+
+
+@dataclass(slots=True)
 class Projeto:
     """
     Representa um projeto no sistema.
-    
+
     Um projeto é uma unidade organizacional que contém tarefas
     e pode ter vários usuários associados a ele.
-    
+
+    Assim como ``Usuario``, usa ``__slots__`` em vez de um ``__dict__``
+    por instância, reduzindo a memória quando há muitas entidades carregadas.
+
     Attributes:
         id: Identificador único do projeto.
         nome: Nome do projeto.
         descricao: Descrição detalhada do projeto.
         data_criacao: Data em que o projeto foi criado.
         responsavel_id: ID do usuário responsável pelo projeto.
-        membros: Lista de IDs dos usuários que são membros do projeto.
+        membros: IDs dos usuários que são membros do projeto, na ordem
+            em que foram adicionados. Aceita qualquer iterável de IDs,
+            convertido em ``Membros``.
     """
-    
+
     id: int
     nome: str
     descricao: str
     data_criacao: datetime
     responsavel_id: int
-    membros: List[int] = None
-    
+    membros: Optional[Membros] = None
+
     def __post_init__(self):
-        """Inicializa membros como lista vazia se não fornecido."""
-        if self.membros is None:
-            self.membros = []
-            
+        """Converte membros em ``Membros``, vazio se não fornecido."""
+        if not isinstance(self.membros, Membros):
+            self.membros = Membros(self.membros)
+
         # Garantir que o responsável está na lista de membros
-        if self.responsavel_id not in self.membros:
-            self.membros.append(self.responsavel_id)
-    
+        self.membros.adicionar(self.responsavel_id)
+
     def adicionar_membro(self, usuario_id: int) -> None:
         """
         Adiciona um usuário como membro do projeto.
-        
+
         Args:
             usuario_id: ID do usuário a ser adicionado ao projeto.
         """
-        if usuario_id not in self.membros:
-            self.membros.append(usuario_id)
-    
+        self.membros.adicionar(usuario_id)
+
+    def adicionar_membros(self, usuarios_ids: Iterable[int]) -> int:
+        """
+        Adiciona vários usuários como membros do projeto.
+
+        Args:
+            usuarios_ids: IDs dos usuários a serem adicionados.
+
+        Returns:
+            int: Quantidade de usuários que ainda não eram membros.
+        """
+        return sum(
+            1 for usuario_id in usuarios_ids if self.membros.adicionar(usuario_id)
+        )
+
     def remover_membro(self, usuario_id: int) -> bool:
         """
         Remove um usuário da lista de membros do projeto.
-        
+
         Args:
             usuario_id: ID do usuário a ser removido.
-            
+
         Returns:
             bool: True se o usuário foi removido, False se não era membro
                  ou se é o responsável pelo projeto.
         """
         if usuario_id == self.responsavel_id:
             return False  # Não pode remover o responsável
-            
-        if usuario_id in self.membros:
-            self.membros.remove(usuario_id)
-            return True
-            
-        return False
+
+        return self.membros.remover(usuario_id)
+
+    def remover_membros(self, usuarios_ids: Iterable[int]) -> int:
+        """
+        Remove vários usuários da lista de membros do projeto.
+
+        O responsável pelo projeto nunca é removido.
+
+        Args:
+            usuarios_ids: IDs dos usuários a serem removidos.
+
+        Returns:
+            int: Quantidade de usuários efetivamente removidos.
+        """
+        return sum(1 for usuario_id in usuarios_ids if self.remover_membro(usuario_id))
@@ -0,0 +1,21 @@
+#   src/domain/outbox/interfaces.py
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+
+class EventOutbox(ABC):
+    #   Events added here are stored in the caller's transaction and published
+    #   only after it commits
+    @abstractmethod
+    def add(self, event: Any) -> None:
+        pass
+
+    @abstractmethod
+    def add_many(self, events: Iterable[Any]) -> int:
+        pass
+
+
+class AsyncEventOutbox(ABC):
+    @abstractmethod
+    async def add(self, event: Any) -> None:
+        pass
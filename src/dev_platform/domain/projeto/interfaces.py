@@ -0,0 +1,45 @@
+#   src/domain/projeto/interfaces.py
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+from domain.models import Projeto
+
+
+class ProjetoRepository(ABC):
+    @abstractmethod
+    def save(self, projeto: Projeto) -> Projeto:
+        pass
+
+    @abstractmethod
+    def find_by_id(
+        self, projeto_id: int, with_members: bool = True
+    ) -> Optional[Projeto]:
+        pass
+
+    @abstractmethod
+    def add_members(self, projeto_id: int, usuarios_ids: Iterable[int]) -> int:
+        pass
+
+    @abstractmethod
+    def remove_members(self, projeto_id: int, usuarios_ids: Iterable[int]) -> int:
+        pass
+
+    @abstractmethod
+    def is_member(self, projeto_id: int, usuario_id: int) -> bool:
+        pass
+
+    @abstractmethod
+    def count_members(self, projeto_id: int) -> int:
+        pass
+
+    @abstractmethod
+    def find_members(
+        self,
+        projeto_id: int,
+        after_usuario_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        pass
+
+    @abstractmethod
+    def find_projects_of_user(self, usuario_id: int) -> List[int]:
+        pass
@@ -0,0 +1,36 @@
+#   src/domain/stats/interfaces.py
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+
+class StatsRepository(ABC):
+    #   Reads precomputed summaries: the cost of a read does not grow with the
+    #   number of users, projects or memberships
+    @abstractmethod
+    def user_totals(self) -> Tuple[int, int]:
+        #   (active, inactive)
+        pass
+
+    @abstractmethod
+    def active_users_by_access_day(
+        self, ranges: Sequence[Tuple[Optional[date], Optional[date]]]
+    ) -> List[int]:
+        #   Active users whose last access fell within each (first_day, last_day)
+        #   range, both inclusive; None leaves that end open
+        pass
+
+    @abstractmethod
+    def project_totals(self) -> Tuple[int, int]:
+        #   (projects, memberships)
+        pass
+
+    @abstractmethod
+    def largest_projects(self, limit: int) -> List[Tuple[int, str, int]]:
+        #   (project id, name, members), most members first
+        pass
+
+    @abstractmethod
+    def rebuild(self) -> None:
+        #   Recomputes every summary from the source tables
+        pass
@@ -0,0 +1,79 @@
+#   src/domain/unit_of_work.py
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional, TypeVar
+from domain.outbox.interfaces import AsyncEventOutbox, EventOutbox
+from domain.projeto.interfaces import ProjetoRepository
+from domain.stats.interfaces import StatsRepository
+from domain.user.interfaces import AsyncUserRepository, UserRepository
+
+T = TypeVar("T")
+
+
+class UnitOfWork(ABC):
+    #   Repositories handed out by a unit of work share its transaction and never
+    #   commit on their own: nothing is durable until commit(). Leaving the block
+    #   without committing rolls back.
+    users: UserRepository
+    projetos: ProjetoRepository
+    outbox: Optional[EventOutbox]  #   None when events are disabled
+    stats: StatsRepository
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.rollback()  #   No-op after a successful commit
+        finally:
+            self.close()
+
+    @abstractmethod
+    def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def run(self, work: Callable[["UnitOfWork"], T]) -> T:
+        #   Runs work in a fresh transaction and commits it. Implementations may
+        #   call work again when the transaction hits a transient conflict.
+        with self:
+            result = work(self)
+            self.commit()
+            return result
+
+
+class AsyncUnitOfWork(ABC):
+    #   The asyncio counterpart of UnitOfWork, for users and their events
+    users: AsyncUserRepository
+    outbox: AsyncEventOutbox
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            await self.rollback()  #   No-op after a successful commit
+        finally:
+            await self.close()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def run(self, work: Callable[["AsyncUnitOfWork"], Awaitable[T]]) -> T:
+        async with self:
+            result = await work(self)
+            await self.commit()
+            return result
@@ -0,0 +1,63 @@
+#   src/domain/user/batch.py
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from domain.user.entities import User
+
+
+class UserBatch:
+    #   Columnar container: ids live in a typed array and names/emails in plain
+    #   lists, so millions of users cost three columns instead of millions of
+    #   objects. User instances are only built when an element is read.
+    __slots__ = ("ids", "names", "emails")
+
+    def __init__(self):
+        self.ids = array("q")
+        self.names: List[str] = []
+        self.emails: List[str] = []
+
+    @classmethod
+    def from_users(cls, users: Iterable[User]) -> "UserBatch":
+        batch = cls()
+        for user in users:
+            batch.append(user.id, user.name, user.email)
+        return batch
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[int, str, str]]) -> "UserBatch":
+        batch = cls()
+        batch.extend_rows(rows)
+        return batch
+
+    def append(self, user_id: Optional[int], name: str, email: str) -> None:
+        if user_id is None:
+            raise ValueError("UserBatch only holds persisted users")
+        self.ids.append(user_id)
+        self.names.append(name)
+        self.emails.append(email)
+
+    def extend_rows(self, rows: Iterable[Tuple[int, str, str]]) -> None:
+        for user_id, name, email in rows:
+            self.ids.append(user_id)
+            self.names.append(name)
+            self.emails.append(email)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[User, "UserBatch"]:
+        if isinstance(index, slice):
+            batch = UserBatch()
+            batch.ids = self.ids[index]
+            batch.names = self.names[index]
+            batch.emails = self.emails[index]
+            return batch
+        return User(
+            id=self.ids[index], name=self.names[index], email=self.emails[index]
+        )
+
+    def __iter__(self) -> Iterator[User]:
+        for user_id, name, email in zip(self.ids, self.names, self.emails):
+            yield User(id=user_id, name=name, email=email)
+
+    def rows(self) -> Iterator[Tuple[int, str, str]]:
+        return zip(self.ids, self.names, self.emails)
@@ -1,15 +1,39 @@
 #   src/domain/user/entities.py
+import string
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+NAME_MIN_LENGTH = 3
+NAME_TOO_SHORT = f"Name must be at least {NAME_MIN_LENGTH} characters long"
+INVALID_EMAIL = "Invalid email format"
+
+
+#   SQLite's lower() only folds A-Z, so str.lower() (which also folds "É" and
+#   expands some characters) would disagree with the unique index on lower(email)
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def normalize_email(email: str) -> str:
+    #   Emails are unique regardless of case; must match lower() in the database
+    return email.translate(_ASCII_LOWER)
+
+
+#   The field rules, shared by User.validate and the batch validator
+def name_error(name: str) -> Optional[str]:
+    return NAME_TOO_SHORT if not name or len(name) < NAME_MIN_LENGTH else None
+
+
+def email_error(email: str) -> Optional[str]:
+    return INVALID_EMAIL if not email or "@" not in email else None
+
+
+@dataclass(slots=True)  #   No per-instance __dict__: jobs hold millions of users
 class User:
     id: Optional[int]
     name: str
     email: str
 
     def validate(self):
-        if not self.name or len(self.name) < 3:
-            raise ValueError("Name must be at least 3 characters long")
-        if not self.email or "@" not in self.email:
-            raise ValueError("Invalid email format")
\ No newline at end of file
+        error = name_error(self.name) or email_error(self.email)
+        if error:
+            raise ValueError(error)
@@ -0,0 +1,16 @@
+#   src/domain/user/events.py
+from dataclasses import dataclass, field
+from datetime import datetime
+from domain.user.entities import User
+
+
+@dataclass(slots=True)
+class UserCreated:
+    user_id: int
+    name: str
+    email: str
+    occurred_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserCreated":
+        return cls(user_id=user.id, name=user.name, email=user.email)
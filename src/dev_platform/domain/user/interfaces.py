@@ -1,13 +1,115 @@
 #   src/domain/user/interfaces.py
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Set, Tuple
+from domain.user.batch import UserBatch
 from domain.user.entities import User
 
+
+@dataclass
+class BulkSaveFailure:
+    index: int  #   Position of the user in the iterable given to save_many
+    user: User
+    reason: str
+
+
+@dataclass
+class BulkSaveResult:
+    saved: int = 0
+    failures: List[BulkSaveFailure] = field(default_factory=list)
+
+
 class UserRepository(ABC):
     @abstractmethod
     def save(self, user: User) -> User:
         pass
 
+    @abstractmethod
+    def save_many(
+        self, users: Iterable[User], batch_size: int = 1000
+    ) -> BulkSaveResult:
+        pass
+
+    @abstractmethod
+    def find_by_id(self, user_id: int) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    def find_by_email(self, email: str) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    def exists_many(self, emails: Iterable[str]) -> Set[str]:
+        pass
+
     @abstractmethod
     def find_all(self) -> List[User]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_all(
+        self,
+        page_size: int = 1000,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[User]:
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> List[User]:
+        pass
+
+    @abstractmethod
+    def find_all_batch(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> UserBatch:
+        pass
+
+    @abstractmethod
+    def stream_batches(self, batch_size: int = 10000) -> Iterator[UserBatch]:
+        pass
+
+    @abstractmethod
+    def id_range(self) -> Tuple[Optional[int], Optional[int]]:
+        pass
+
+    @abstractmethod
+    def count_inactive(self, last_access_before: datetime) -> int:
+        pass
+
+    @abstractmethod
+    def deactivate_inactive(
+        self, last_access_before: datetime, start_id: int, end_id: int
+    ) -> int:
+        pass
+
+
+class AsyncUserRepository(ABC):
+    @abstractmethod
+    async def save(self, user: User) -> User:
+        pass
+
+    @abstractmethod
+    async def exists_many(self, emails: Iterable[str]) -> Set[str]:
+        pass
+
+    @abstractmethod
+    async def find_all(self) -> List[User]:
+        pass
+
+    @abstractmethod
+    def iter_all(
+        self,
+        page_size: int = 1000,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[User]:
+        pass
+
+
+class AccessRecorder(ABC):
+    #   Records that a user was active; may write later (write-behind)
+    @abstractmethod
+    def record(self, user_id: int, when: Optional[datetime] = None) -> None:
+        pass
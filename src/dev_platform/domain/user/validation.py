@@ -0,0 +1,127 @@
+#   src/domain/user/validation.py
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, count
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from domain.user.entities import email_error, name_error, normalize_email
+
+DUPLICATE_IN_BATCH = "Email appears more than once in the batch"
+CHUNK_SIZE = 50000  #   Rows per task sent to a worker process
+
+
+class ValidationReport:
+    #   Columnar like UserBatch: one entry per error, holding the row's index in
+    #   the batch, the field ("name" or "email") and the message. A row can have
+    #   several errors; entries are ordered by row.
+    __slots__ = ("rows", "fields", "messages")
+
+    def __init__(self):
+        self.rows = array("L")
+        self.fields: List[str] = []
+        self.messages: List[str] = []
+
+    def add(self, row: int, field: str, message: str) -> None:
+        self.rows.append(row)
+        self.fields.append(field)
+        self.messages.append(message)
+
+    def extend(self, other: "ValidationReport") -> None:
+        self.rows.extend(other.rows)
+        self.fields.extend(other.fields)
+        self.messages.extend(other.messages)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Tuple[int, str, str]]:
+        return zip(self.rows, self.fields, self.messages)
+
+    def invalid_rows(self) -> Set[int]:
+        return set(self.rows)
+
+    def by_row(self) -> Dict[int, List[str]]:
+        errors: Dict[int, List[str]] = {}
+        for row, _, message in self:
+            errors.setdefault(row, []).append(message)
+        return errors
+
+    def sorted(self) -> "ValidationReport":
+        #   Stable: a row's errors keep the order they were found in
+        report = ValidationReport()
+        for i in sorted(range(len(self.rows)), key=self.rows.__getitem__):
+            report.add(self.rows[i], self.fields[i], self.messages[i])
+        return report
+
+
+def check_fields(
+    names: Sequence[str], emails: Sequence[str], offset: int = 0
+) -> ValidationReport:
+    #   The rules of User.validate, but every failing rule of every row is
+    #   reported instead of only the first. Each rule is mapped over its whole
+    #   column and compress() picks out the failing rows. Module level so worker
+    #   processes can run it.
+    report = ValidationReport()
+    for field, rule, column in (
+        ("name", name_error, names),
+        ("email", email_error, emails),
+    ):
+        errors = list(map(rule, column))
+        for row, error in zip(compress(count(offset), errors), filter(None, errors)):
+            report.add(row, field, error)
+    #   Name errors were added before email errors; interleave them by row
+    return report.sorted() if len(set(report.fields)) > 1 else report
+
+
+def _check_chunk(chunk: Tuple[Sequence[str], Sequence[str], int]) -> ValidationReport:
+    return check_fields(*chunk)
+
+
+def validate_batch(
+    names: Sequence[str],
+    emails: Sequence[str],
+    workers: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+    seen: Optional[Set[str]] = None,
+) -> ValidationReport:
+    #   With workers > 1 the field rules run on chunks in a process pool. The
+    #   duplicate check needs the whole batch, so it always runs here: an email
+    #   repeats when an earlier valid row already uses it (ignoring case), which
+    #   is the row that saving the batch in order would keep. To check a file a
+    #   batch at a time, pass the same seen set to every call: it holds the
+    #   normalised emails of the valid rows of the earlier batches.
+    if len(names) != len(emails):
+        raise ValueError("names and emails must have the same length")
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("workers and chunk_size must be at least 1")
+    if workers == 1 or len(names) <= chunk_size:
+        report = check_fields(names, emails)
+    else:
+        report = ValidationReport()
+        chunks = (
+            (
+                names[start : start + chunk_size],
+                emails[start : start + chunk_size],
+                start,
+            )
+            for start in range(0, len(names), chunk_size)
+        )
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_report in executor.map(_check_chunk, chunks):
+                report.extend(chunk_report)
+
+    keys = list(map(normalize_email, emails))
+    if seen is None:
+        if len(set(keys)) == len(keys):
+            return report  #   No email repeats at all, the usual case
+        seen = set()
+    invalid = report.invalid_rows()
+    field_errors = len(report)
+    for row, key in enumerate(keys):
+        if row in invalid:
+            continue
+        if key in seen:
+            report.add(row, "email", DUPLICATE_IN_BATCH)
+        else:
+            seen.add(key)
+    #   Field errors are already in row order; duplicates were appended after them
+    return report.sorted() if len(report) > field_errors else report
@@ -0,0 +1,232 @@
+#   src/infrastructure/cache/user_cache.py
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from domain.user.batch import UserBatch
+from domain.user.entities import User, normalize_email
+from domain.user.interfaces import BulkSaveResult, UserRepository
+from infrastructure.config import get_settings
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  #   Entries dropped because the cache was full
+    expirations: int = 0  #   Entries dropped because their TTL ran out
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachedUserRepository(UserRepository):
+    #   Read-through cache in front of another UserRepository. Entries are kept in
+    #   LRU order by id; a secondary index maps emails to ids. Callers always get
+    #   copies, so mutating a returned User never corrupts the cache.
+    def __init__(
+        self,
+        inner: UserRepository,
+        max_size: int = 10000,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.inner = inner
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[int, Tuple[User, float]]" = OrderedDict()
+        self._ids_by_email: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._transactional = False
+        self._wrote = False
+
+    def view(self, inner: UserRepository) -> "CachedUserRepository":
+        #   The same cache in front of another repository, such as one bound to
+        #   a unit of work's session. That transaction's writes may still roll
+        #   back, so once it has written the view stops filling the cache.
+        view = copy.copy(self)  #   Shares entries, lock and stats
+        view.inner = inner
+        view._transactional = True
+        view._wrote = False
+        return view
+
+    def save(self, user: User) -> User:
+        saved = self.inner.save(user)
+        with self._lock:
+            self._invalidate_email(saved.email)
+            if self._transactional:
+                self._wrote = True
+            elif saved.id is not None:
+                self._put(saved)
+        return saved
+
+    def save_many(
+        self, users: Iterable[User], batch_size: int = 1000
+    ) -> BulkSaveResult:
+        #   Only inserts new rows and nothing caches misses, so no entry can go stale
+        self._wrote = self._transactional
+        return self.inner.save_many(users, batch_size=batch_size)
+
+    def find_by_id(self, user_id: int) -> Optional[User]:
+        with self._lock:
+            cached = self._get(user_id)
+        if cached is not None:
+            return cached
+        return self._load(self.inner.find_by_id(user_id))
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        with self._lock:
+            user_id = self._ids_by_email.get(normalize_email(email))
+            cached = self._get(user_id) if user_id is not None else None
+            if user_id is None:
+                self._stats.misses += 1
+        if cached is not None:
+            return cached
+        return self._load(self.inner.find_by_email(email))
+
+    def exists_many(self, emails: Iterable[str]) -> Set[str]:
+        #   Emails of live cache entries are known to exist; only the rest hit the database
+        found, unknown = set(), []
+        with self._lock:
+            now = self._clock()
+            for email in emails:
+                user_id = self._ids_by_email.get(normalize_email(email))
+                entry = self._entries.get(user_id) if user_id is not None else None
+                if entry is not None and entry[1] > now:
+                    found.add(email)
+                    self._stats.hits += 1
+                else:
+                    if entry is not None:
+                        self._remove(user_id)
+                        self._stats.expirations += 1
+                    unknown.append(email)
+                    self._stats.misses += 1
+        if unknown:
+            found |= self.inner.exists_many(unknown)
+        return found
+
+    def find_all(self) -> List[User]:
+        return self.inner.find_all()
+
+    def iter_all(
+        self,
+        page_size: int = 1000,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[User]:
+        return self.inner.iter_all(page_size=page_size, after_id=after_id, limit=limit)
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> List[User]:
+        return self.inner.search(query, limit=limit, offset=offset)
+
+    def find_all_batch(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> UserBatch:
+        return self.inner.find_all_batch(after_id=after_id, limit=limit)
+
+    def stream_batches(self, batch_size: int = 10000) -> Iterator[UserBatch]:
+        return self.inner.stream_batches(batch_size=batch_size)
+
+    def id_range(self) -> Tuple[Optional[int], Optional[int]]:
+        return self.inner.id_range()
+
+    def count_inactive(self, last_access_before: datetime) -> int:
+        return self.inner.count_inactive(last_access_before)
+
+    def deactivate_inactive(
+        self, last_access_before: datetime, start_id: int, end_id: int
+    ) -> int:
+        #   Cached User entities carry no activity state, so nothing to invalidate
+        return self.inner.deactivate_inactive(last_access_before, start_id, end_id)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._remove(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._ids_by_email.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return replace(self._stats, size=len(self._entries))
+
+    def _load(self, user: Optional[User]) -> Optional[User]:
+        if user is None or user.id is None or self._wrote:
+            return user
+        with self._lock:
+            self._put(user)
+        return replace(user)
+
+    #   The helpers below expect self._lock to be held
+    def _get(self, user_id: int) -> Optional[User]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        user, expires_at = entry
+        if expires_at <= self._clock():
+            self._remove(user_id)
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self._stats.hits += 1
+        return replace(user)
+
+    def _put(self, user: User) -> None:
+        self._remove(user.id)
+        self._entries[user.id] = (replace(user), self._clock() + self.ttl)
+        self._ids_by_email[normalize_email(user.email)] = user.id
+        while len(self._entries) > self.max_size:
+            _, (oldest, _) = self._entries.popitem(last=False)
+            self._ids_by_email.pop(normalize_email(oldest.email), None)
+            self._stats.evictions += 1
+
+    def _remove(self, user_id: int) -> None:
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            key = normalize_email(entry[0].email)
+            if self._ids_by_email.get(key) == user_id:
+                del self._ids_by_email[key]
+
+    def _invalidate_email(self, email: str) -> None:
+        user_id = self._ids_by_email.get(normalize_email(email))
+        if user_id is not None:
+            self._remove(user_id)
+
+
+def cached_user_repository(inner: UserRepository) -> CachedUserRepository:
+    #   Sized from USER_CACHE_SIZE / USER_CACHE_TTL
+    settings = get_settings()
+    return CachedUserRepository(
+        inner, max_size=settings.user_cache_size, ttl=settings.user_cache_ttl
+    )
+
+
+_shared_cache: Optional[CachedUserRepository] = None
+
+
+def with_user_cache(inner: UserRepository) -> UserRepository:
+    #   With USER_CACHE_ENABLED, inner behind a view of the process-wide cache
+    global _shared_cache
+    if not get_settings().user_cache_enabled:
+        return inner
+    if _shared_cache is None:
+        _shared_cache = cached_user_repository(inner)
+    return _shared_cache.view(inner)
+
+
+def user_cache_stats() -> Optional[CacheStats]:
+    return None if _shared_cache is None else _shared_cache.stats()
@@ -1,7 +1,97 @@
 #   src/infrastructure/config.py (similar to your config.py, but in the Infrastructure layer)
-from dotenv import load_dotenv
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
 
-load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
-#   You might want to handle the case where DATABASE_URL is not set
\ No newline at end of file
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return default if value is None or not value.strip() else int(value)
+
+
+def _env_list(name: str) -> Tuple[str, ...]:
+    return tuple(
+        item.strip() for item in os.getenv(name, "").split(",") if item.strip()
+    )
+
+
+@dataclass(frozen=True)
+class Settings:
+    database_url: Optional[str]
+    #   Read-only copies of database_url; empty disables routing
+    replica_urls: Tuple[str, ...]
+    shard_urls: Tuple[str, ...]  #   Databases of ShardedUserRepository, in shard order
+    replica_strategy: str  #   round_robin or least_connections
+    #   Seconds after a write during which reads stay on the primary
+    read_your_writes_window: float
+    replica_retry_after: float  #   Seconds a replica that failed is left out
+    async_database_url: Optional[str]  #   Derived from database_url when unset
+    pool_size: int
+    max_overflow: int
+    pool_pre_ping: bool
+    pool_recycle: int  #   Seconds; -1 never recycles
+    sqlite_journal_mode: str
+    sqlite_synchronous: str
+    #   Units of work read users through a process-wide CachedUserRepository
+    user_cache_enabled: bool
+    user_cache_size: int
+    user_cache_ttl: float  #   Seconds an entry stays fresh in the user cache
+    #   Seconds between write-behind flushes of last-access times
+    access_flush_interval: float
+    access_max_pending: int  #   Distinct users buffered before a flush is forced
+    #   Tries for a transaction that hits a lock or serialization conflict
+    db_retry_attempts: int
+    #   Seconds; first retry waits up to this, doubling each time
+    db_retry_backoff: float
+    #   Units of work record domain events in the outbox table. Cannot be
+    #   combined with shard_urls: the users would commit on a shard and the
+    #   events on the primary, in two separate transactions.
+    outbox_enabled: bool
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    #   Read once, on first use, so importing this module stays free
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return Settings(
+        database_url=os.getenv("DATABASE_URL"),
+        replica_urls=_env_list("DATABASE_REPLICA_URLS"),
+        shard_urls=_env_list("DATABASE_SHARD_URLS"),
+        replica_strategy=os.getenv("DATABASE_REPLICA_STRATEGY", "round_robin"),
+        read_your_writes_window=float(os.getenv("READ_YOUR_WRITES_WINDOW", "2")),
+        replica_retry_after=float(os.getenv("REPLICA_RETRY_AFTER", "30")),
+        async_database_url=os.getenv("ASYNC_DATABASE_URL"),
+        pool_size=_env_int("DB_POOL_SIZE", 5),
+        max_overflow=_env_int("DB_MAX_OVERFLOW", 10),
+        pool_pre_ping=_env_bool("DB_POOL_PRE_PING", True),
+        pool_recycle=_env_int("DB_POOL_RECYCLE", 1800),
+        sqlite_journal_mode=os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+        sqlite_synchronous=os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+        user_cache_enabled=_env_bool("USER_CACHE_ENABLED", False),
+        user_cache_size=_env_int("USER_CACHE_SIZE", 10000),
+        user_cache_ttl=float(os.getenv("USER_CACHE_TTL", "300")),
+        access_flush_interval=float(os.getenv("ACCESS_FLUSH_INTERVAL", "5")),
+        access_max_pending=_env_int("ACCESS_MAX_PENDING", 10000),
+        db_retry_attempts=_env_int("DB_RETRY_ATTEMPTS", 10),
+        db_retry_backoff=float(os.getenv("DB_RETRY_BACKOFF", "0.02")),
+        outbox_enabled=_env_bool("OUTBOX_ENABLED", True),
+    )
+
+
+def __getattr__(name: str):
+    #   Keeps `from infrastructure.config import DATABASE_URL` working
+    if name == "DATABASE_URL":
+        return get_settings().database_url
+    if name == "ASYNC_DATABASE_URL":
+        return get_settings().async_database_url
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,198 @@
+#   src/infrastructure/database/access_tracker.py
+import heapq
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import bindparam, or_, update
+from sqlalchemy.orm import Session
+from domain.models import Usuario
+from domain.user.interfaces import AccessRecorder
+from infrastructure.config import get_settings
+from infrastructure.database.models import UserModel
+
+logger = logging.getLogger(__name__)
+
+users = UserModel.__table__
+
+#   Only moves ultimo_acesso forward, so overlapping flushes (or several
+#   processes) can never replace a newer timestamp with an older one.
+_UPDATE_LAST_ACCESS = (
+    update(users)
+    .where(users.c.id == bindparam("b_id"))
+    .where(
+        or_(users.c.ultimo_acesso.is_(None), users.c.ultimo_acesso < bindparam("b_ts"))
+    )
+    .values(ultimo_acesso=bindparam("b_ts"))
+)
+
+
+@dataclass
+class AccessTrackerStats:
+    recorded: int = 0  #   Accesses passed to record()
+    flushed: int = 0  #   Rows sent to the database
+    flushes: int = 0
+    failed_flushes: int = 0
+    #   Timestamps discarded because the buffer was full while flushes failed
+    dropped: int = 0
+
+
+class AccessTracker(AccessRecorder):
+    #   Write-behind buffer for Usuario.registrar_acesso. Repeated accesses by the
+    #   same user collapse into one pending timestamp (the newest), which a
+    #   background thread writes in batched UPDATEs when `max_pending` users are
+    #   buffered or every `flush_interval` seconds, whichever comes first.
+    #
+    #   The buffer never holds more than `max_pending` users. A new user arriving
+    #   when it is full makes record() flush on the caller's thread first. A
+    #   failed flush puts its entries back so they are retried on the next one;
+    #   if that leaves no room, the oldest timestamps are dropped and counted in
+    #   stats.dropped. A crash loses at most the buffered accesses.
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        flush_interval: float = 5.0,
+        max_pending: int = 10000,
+        batch_size: int = 1000,
+    ):
+        if max_pending < 1 or batch_size < 1:
+            raise ValueError("max_pending and batch_size must be at least 1")
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.stats = AccessTrackerStats()
+        self._pending: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        #   One flush at a time keeps writes ordered
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def registrar_acesso(self, usuario: Usuario) -> None:
+        usuario.registrar_acesso()
+        self.record(usuario.id, usuario.ultimo_acesso)
+
+    def record(self, usuario_id: int, when: Optional[datetime] = None) -> None:
+        when = when or datetime.now()
+        with self._lock:
+            self.stats.recorded += 1
+            overflow = (
+                usuario_id not in self._pending
+                and len(self._pending) >= self.max_pending
+            )
+            if not overflow:
+                self._merge([(usuario_id, when)])
+            full = len(self._pending) >= self.max_pending
+        if overflow:
+            #   The flush thread has not caught up: write on this thread rather
+            #   than grow past max_pending
+            self.flush()
+            self._requeue([(usuario_id, when)])
+        elif full:
+            if self._thread is not None:
+                self._wakeup.set()
+            else:
+                self.flush()  #   Not started: flush inline so the bound still holds
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def start(self) -> "AccessTracker":
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="access-tracker", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        #   Stops the background thread and writes everything still buffered
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def __enter__(self) -> "AccessTracker":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            items = list(pending.items())
+            session = self.session_factory()
+            written = 0
+            try:
+                for start in range(0, len(items), self.batch_size):
+                    batch = items[start : start + self.batch_size]
+                    session.execute(
+                        _UPDATE_LAST_ACCESS,
+                        [{"b_id": i, "b_ts": ts} for i, ts in batch],
+                    )
+                    session.commit()
+                    written += len(batch)
+            except Exception:
+                session.rollback()
+                self._requeue(items[written:])
+                self.stats.failed_flushes += 1
+                logger.exception(
+                    "Failed to flush %d last-access timestamps", len(items) - written
+                )
+            finally:
+                session.close()
+                self.stats.flushed += written
+                self.stats.flushes += 1
+            return written
+
+    def _requeue(self, entries: List[Tuple[int, datetime]]) -> None:
+        with self._lock:
+            self._merge(entries)
+            excess = len(self._pending) - self.max_pending
+            if excess > 0:
+                for usuario_id, _ in heapq.nsmallest(
+                    excess, self._pending.items(), key=lambda item: item[1]
+                ):
+                    del self._pending[usuario_id]
+                self.stats.dropped += excess
+        if excess > 0:
+            logger.warning(
+                "Access buffer full: dropped the %d oldest last-access timestamps",
+                excess,
+            )
+
+    def _merge(self, entries: List[Tuple[int, datetime]]) -> None:
+        #   Expects self._lock to be held; keeps the newest timestamp per user
+        for usuario_id, when in entries:
+            current = self._pending.get(usuario_id)
+            if current is None or when > current:
+                self._pending[usuario_id] = when
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if not self._stopping.is_set():
+                self.flush()
+
+
+def access_tracker(session_factory: Callable[[], Session]) -> AccessTracker:
+    #   Thresholds from ACCESS_FLUSH_INTERVAL / ACCESS_MAX_PENDING
+    settings = get_settings()
+    return AccessTracker(
+        session_factory,
+        flush_interval=settings.access_flush_interval,
+        max_pending=settings.access_max_pending,
+    )
@@ -0,0 +1,104 @@
+#   src/infrastructure/database/async_repositories.py
+from typing import AsyncIterator, Iterable, List, Optional, Set
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.user.entities import User, normalize_email
+from domain.user.interfaces import AsyncUserRepository
+from infrastructure.database.models import UserModel
+from infrastructure.database.repositories import (
+    DUPLICATE_EMAIL,
+    EXISTS_CHUNK_SIZE,
+    is_duplicate_email,
+)
+from shared.exceptions import DatabaseException, DomainException
+
+
+class SQLAsyncUserRepository(AsyncUserRepository):
+    #   With autocommit=False (inside an AsyncUnitOfWork) save only flushes and
+    #   leaves commit and rollback to the owner of the transaction
+    def __init__(self, session: AsyncSession, autocommit: bool = True):
+        self.session = session
+        self.autocommit = autocommit
+
+    async def save(self, user: User) -> User:
+        try:
+            db_user = UserModel(name=user.name, email=user.email)
+            self.session.add(db_user)
+            await self.session.flush()  #   Populates the id without a refresh SELECT
+            user.id = db_user.id
+            if self.autocommit:
+                await self.session.commit()
+            return user
+        except IntegrityError as e:
+            await self._rollback()
+            if not is_duplicate_email(e):
+                raise DatabaseException(f"Error saving user: {e}")
+            #   Another writer registered the email after our duplicate check
+            raise DomainException(DUPLICATE_EMAIL)
+        except Exception as e:
+            await self._rollback()
+            raise DatabaseException(f"Error saving user: {e}")
+
+    async def _rollback(self) -> None:
+        if self.autocommit:
+            await self.session.rollback()
+
+    async def exists_many(self, emails: Iterable[str]) -> Set[str]:
+        spellings = {}
+        for email in emails:
+            spellings.setdefault(normalize_email(email), []).append(email)
+        keys = list(spellings)
+        lowered = func.lower(UserModel.email)
+        existing = set()
+        try:
+            for start in range(0, len(keys), EXISTS_CHUNK_SIZE):
+                chunk = keys[start : start + EXISTS_CHUNK_SIZE]
+                existing.update(
+                    await self.session.scalars(
+                        select(lowered).where(lowered.in_(chunk))
+                    )
+                )
+        except Exception as e:
+            raise DatabaseException(f"Error checking existing emails: {e}")
+        return {email for key in existing for email in spellings[key]}
+
+    async def find_all(self) -> List[User]:
+        try:
+            result = await self.session.execute(
+                select(UserModel.id, UserModel.name, UserModel.email)
+            )
+            return [User(id=row.id, name=row.name, email=row.email) for row in result]
+        except Exception as e:
+            raise DatabaseException(f"Error finding all users: {e}")
+
+    async def iter_all(
+        self,
+        page_size: int = 1000,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[User]:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        last_id = after_id
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            stmt = (
+                select(UserModel.id, UserModel.name, UserModel.email)
+                .order_by(UserModel.id)
+                .limit(size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(UserModel.id > last_id)
+            try:
+                rows = (await self.session.execute(stmt)).all()
+            except Exception as e:
+                raise DatabaseException(f"Error iterating users: {e}")
+            for row in rows:
+                yield User(id=row.id, name=row.name, email=row.email)
+            if len(rows) < size:
+                return
+            last_id = rows[-1].id
+            if remaining is not None:
+                remaining -= len(rows)
@@ -0,0 +1,53 @@
+#   src/infrastructure/database/async_session.py
+from typing import AsyncIterator, Optional
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from infrastructure.config import get_settings
+from shared.exceptions import DatabaseException
+
+#   Async DBAPI used for each synchronous backend name found in DATABASE_URL
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker] = None
+
+
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    #   Built on first use so importing this module never needs a database
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        url = settings.async_database_url or settings.database_url
+        if not url:
+            raise DatabaseException("DATABASE_URL is not set")
+        _engine = create_async_engine(to_async_url(url))
+    return _engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            bind=get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _session_factory
+
+
+async def get_async_db_session() -> AsyncIterator[AsyncSession]:
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,35 @@
+#   src/infrastructure/database/async_unit_of_work.py
+from typing import Callable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.unit_of_work import AsyncUnitOfWork
+from infrastructure.database.async_repositories import SQLAsyncUserRepository
+from infrastructure.database.async_session import get_async_sessionmaker
+from infrastructure.database.contention import database_error
+from infrastructure.database.outbox import SQLAsyncOutbox
+
+
+class SQLAsyncUnitOfWork(AsyncUnitOfWork):
+    def __init__(self, session_factory: Optional[Callable[[], AsyncSession]] = None):
+        self.session_factory = session_factory
+        self.session: Optional[AsyncSession] = None
+
+    async def __aenter__(self) -> "SQLAsyncUnitOfWork":
+        self.session = (self.session_factory or get_async_sessionmaker())()
+        self.users = SQLAsyncUserRepository(self.session, autocommit=False)
+        self.outbox = SQLAsyncOutbox(self.session)
+        return self
+
+    async def commit(self) -> None:
+        try:
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise database_error("Error committing unit of work", e)
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
@@ -0,0 +1,74 @@
+#   src/infrastructure/database/contention.py
+import random
+import time
+from typing import Callable, Optional, TypeVar
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from infrastructure.config import get_settings
+from shared.exceptions import DatabaseException, TransientDatabaseException
+
+T = TypeVar("T")
+MAX_BACKOFF = 1.0  #   Seconds; cap for a single wait between retries
+_LOCK_MESSAGES = ("database is locked", "database table is locked")  #   SQLite
+#   PostgreSQL serialization failure, deadlock
+_TRANSIENT_SQLSTATES = ("40001", "40P01")
+_TRANSIENT_MYSQL_CODES = (1205, 1213)  #   Lock wait timeout, deadlock
+_UNIQUE_SQLSTATE = "23505"  #   PostgreSQL
+_MYSQL_DUPLICATE_KEY = 1062
+
+
+def is_transient(error: BaseException) -> bool:
+    if not isinstance(error, DBAPIError):
+        return False
+    orig = error.orig
+    if (
+        getattr(orig, "sqlstate", None) in _TRANSIENT_SQLSTATES
+        or getattr(orig, "pgcode", None) in _TRANSIENT_SQLSTATES
+    ):
+        return True
+    if orig is not None and orig.args and orig.args[0] in _TRANSIENT_MYSQL_CODES:
+        return True
+    return any(message in str(orig).lower() for message in _LOCK_MESSAGES)
+
+
+def is_unique_violation(error: BaseException, *keys: str) -> bool:
+    #   A unique constraint failure on one of keys: constraint, index or
+    #   table.column names, which every driver quotes in its message. NOT NULL
+    #   and foreign key failures are IntegrityErrors too, but not this.
+    if not isinstance(error, IntegrityError):
+        return False
+    orig = error.orig
+    message = str(orig).lower()
+    unique = (
+        "unique constraint failed" in message  #   SQLite
+        or getattr(orig, "sqlstate", None) == _UNIQUE_SQLSTATE
+        or getattr(orig, "pgcode", None) == _UNIQUE_SQLSTATE
+        or bool(orig is not None and orig.args and orig.args[0] == _MYSQL_DUPLICATE_KEY)
+    )
+    return unique and any(key.lower() in message for key in keys)
+
+
+def database_error(message: str, error: Exception) -> DatabaseException:
+    cls = TransientDatabaseException if is_transient(error) else DatabaseException
+    return cls(f"{message}: {error}")
+
+
+def retry_transient(
+    operation: Callable[[], T],
+    attempts: Optional[int] = None,
+    backoff: Optional[float] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    #   The operation must be a whole transaction: after a lock conflict SQLite
+    #   may keep failing until the reading snapshot is dropped, so retrying a
+    #   single statement is not enough.
+    settings = get_settings() if attempts is None or backoff is None else None
+    attempts = attempts if attempts is not None else settings.db_retry_attempts
+    backoff = backoff if backoff is not None else settings.db_retry_backoff
+    for attempt in range(1, max(attempts, 1) + 1):
+        try:
+            return operation()
+        except TransientDatabaseException:
+            if attempt >= attempts:
+                raise
+            #   Full jitter keeps colliding writers from retrying in lockstep
+            sleep(random.uniform(0, min(MAX_BACKOFF, backoff * 2 ** (attempt - 1))))
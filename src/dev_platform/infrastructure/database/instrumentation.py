@@ -0,0 +1,65 @@
+#   src/infrastructure/database/instrumentation.py
+import time
+from functools import partial
+from typing import Callable
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from shared.profiling import Profiler
+
+
+class _CountingCursor:
+    #   Proxy for a DB-API cursor that counts the rows fetched through it. Only
+    #   the DB-API fetch methods are wrapped; everything else is the cursor's own.
+    def __init__(self, cursor, count: Callable[[int], None]):
+        self._cursor = cursor
+        self._count = count
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._count(1)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._count(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._count(len(rows))
+        return rows
+
+
+def instrument_engine(engine: Engine, profiler: Profiler) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("profiling_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["profiling_started"].pop()
+        if not cursor.description:
+            #   INSERT/UPDATE/DELETE: rowcount is the rows affected
+            profiler.record_query(statement, elapsed, cursor.rowcount)
+            return
+        profiler.record_query(statement, elapsed)
+        #   Returned rows are counted as the result fetches them, through the
+        #   public ExecutionContext.cursor the result is built from
+        if context is not None and not isinstance(context.cursor, _CountingCursor):
+            context.cursor = _CountingCursor(
+                cursor, partial(profiler.record_rows, statement)
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(exception_context):
+        started = (
+            exception_context.connection.info.get("profiling_started")
+            if exception_context.connection
+            else None
+        )
+        if started:
+            started.pop()
@@ -1,12 +1,128 @@
 #   src/infrastructure/database/models.py
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    false,
+    func,
+    true,
+)
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
+
 class UserModel(Base):
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
-    email = Column(String(100), nullable=False, unique=True)
\ No newline at end of file
+    email = Column(String(100), nullable=False, unique=True)
+    ultimo_acesso = Column(DateTime, nullable=True)
+    ativo = Column(Boolean, nullable=False, default=True, server_default=true())
+
+    __table_args__ = (
+        #   Serves the case-insensitive email lookups and keeps emails unique ignoring case
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+        #   Counts and scans of active users by last access (bulk deactivation)
+        Index("ix_users_ativo_ultimo_acesso", ativo, ultimo_acesso),
+    )
+
+
+class ProjectModel(Base):
+    __tablename__ = "projects"
+
+    id = Column(Integer, primary_key=True)
+    nome = Column(String(100), nullable=False)
+    descricao = Column(Text, nullable=False, default="")
+    data_criacao = Column(DateTime, nullable=False)
+    responsavel_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+
+class ProjectMemberModel(Base):
+    #   One row per membership. The autoincrement id records insertion order, so
+    #   members come back in the order they were added.
+    __tablename__ = "project_members"
+
+    id = Column(Integer, primary_key=True)
+    project_id = Column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id", "user_id", name="uq_project_members_project_user"
+        ),
+        #   Members of project Y
+        Index("ix_project_members_project_order", "project_id", "id"),
+        #   Projects of user X
+        Index("ix_project_members_user_project", "user_id", "project_id"),
+    )
+
+
+class OutboxModel(Base):
+    #   Events waiting to be published; rows are deleted once delivered.
+    #   AUTOINCREMENT on SQLite so ids are never reused after deletes: consumers
+    #   remember the ids they have seen to drop redelivered events.
+    __tablename__ = "outbox"
+
+    id = Column(Integer, primary_key=True)
+    event_type = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)  #   JSON
+    created_at = Column(DateTime, nullable=False)
+
+    __table_args__ = {"sqlite_autoincrement": True}
+
+
+class ShardLayoutModel(Base):
+    #   One row (id 1) per database. On the shards it records how many shards
+    #   the users are spread over (None until the first reshard) and whether a
+    #   reshard is running; ShardedUserRepository refuses to write otherwise.
+    __tablename__ = "shard_layout"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    shards = Column(Integer, nullable=True)
+    resharding = Column(Boolean, nullable=False, default=False, server_default=false())
+
+
+class StatsCounterModel(Base):
+    #   This and the next two tables summarise users and memberships for the
+    #   stats command. Triggers on users, projects and project_members keep them
+    #   current (see the stats migration). Each counter is split over a few
+    #   slots (row id % slots) so concurrent writers rarely update the same row;
+    #   its value is the sum of its slots.
+    __tablename__ = "stats_counters"
+
+    name = Column(String(50), primary_key=True)
+    slot = Column(Integer, primary_key=True, autoincrement=False)
+    value = Column(Integer, nullable=False, default=0)
+
+
+class UserAccessDayModel(Base):
+    #   Active users by the calendar day of their last access
+    __tablename__ = "user_access_days"
+
+    day = Column(Date, primary_key=True)
+    active_users = Column(Integer, nullable=False, default=0)
+
+
+class ProjectMemberCountModel(Base):
+    __tablename__ = "project_member_counts"
+
+    project_id = Column(Integer, primary_key=True, autoincrement=False)
+    members = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        #   Largest projects first
+        Index("ix_project_member_counts_members", "members", "project_id"),
+    )
@@ -0,0 +1,172 @@
+#   src/infrastructure/database/outbox.py
+import json
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from domain.outbox.interfaces import AsyncEventOutbox, EventOutbox
+from infrastructure.database.contention import database_error
+from infrastructure.database.models import OutboxModel
+from shared.exceptions import DeliveryException, TransientDatabaseException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutboxMessage:
+    #   Unique and never reused, but not in commit order on PostgreSQL (a
+    #   transaction holding a lower id can commit later), so consumers must drop
+    #   redelivered events by the set of ids they have seen, not by the highest
+    id: int
+    event_type: str
+    payload: Dict[str, Any]
+    created_at: datetime
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "id": self.id,
+                "type": self.event_type,
+                "created_at": self.created_at.isoformat(),
+                "payload": self.payload,
+            }
+        )
+
+
+def _row(event: Any) -> Dict[str, Any]:
+    return {
+        "event_type": type(event).__name__,
+        "payload": json.dumps(asdict(event), default=lambda value: value.isoformat()),
+        "created_at": datetime.now(),
+    }
+
+
+class SQLOutbox(EventOutbox):
+    #   Never commits: rows become visible with the transaction that wrote the change
+    def __init__(self, session: Session):
+        self.session = session
+
+    def add(self, event: Any) -> None:
+        self.add_many([event])
+
+    def add_many(self, events: Iterable[Any]) -> int:
+        rows = [_row(event) for event in events]
+        if rows:
+            try:
+                self.session.execute(insert(OutboxModel), rows)
+            except Exception as e:
+                raise database_error("Error writing outbox events", e)
+        return len(rows)
+
+
+class SQLAsyncOutbox(AsyncEventOutbox):
+    #   Never commits, like SQLOutbox
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, event: Any) -> None:
+        try:
+            await self.session.execute(insert(OutboxModel), [_row(event)])
+        except Exception as e:
+            raise database_error("Error writing outbox events", e)
+
+
+class OutboxRelay:
+    #   At-least-once delivery: a batch is deleted only after the sink accepted
+    #   it, in the same transaction that read it. A crash or sink error in
+    #   between leaves the batch to be delivered again.
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        sink: Callable[[List[OutboxMessage]], None],
+        batch_size: int = 500,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.session_factory = session_factory
+        self.sink = sink
+        self.batch_size = batch_size
+
+    def relay_batch(self) -> int:
+        session = self.session_factory()
+        try:
+            #   SKIP LOCKED lets several relays share the table on PostgreSQL
+            rows = session.execute(
+                select(
+                    OutboxModel.id,
+                    OutboxModel.event_type,
+                    OutboxModel.payload,
+                    OutboxModel.created_at,
+                )
+                .order_by(OutboxModel.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not rows:
+                return 0
+            try:
+                self.sink(
+                    [
+                        OutboxMessage(
+                            row.id,
+                            row.event_type,
+                            json.loads(row.payload),
+                            row.created_at,
+                        )
+                        for row in rows
+                    ]
+                )
+            except Exception as e:
+                #   Closing the session rolls back: the batch stays for the next attempt
+                raise DeliveryException(
+                    f"Sink failed on events {rows[0].id}..{rows[-1].id}: {e}"
+                ) from e
+            session.execute(
+                delete(OutboxModel).where(OutboxModel.id.in_([row.id for row in rows]))
+            )
+            session.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            raise database_error("Error relaying outbox events", e)
+        finally:
+            session.close()
+
+    def drain(self) -> int:
+        total = 0
+        while True:
+            relayed = self.relay_batch()
+            total += relayed
+            if relayed < self.batch_size:
+                return total
+
+    def run(
+        self,
+        poll_interval: float = 1.0,
+        stop: Optional[threading.Event] = None,
+        on_batch: Optional[Callable[[int], None]] = None,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+    ) -> None:
+        #   Sink failures and lock conflicts are logged and retried, waiting
+        #   twice as long after each consecutive failure, up to max_retry_delay.
+        #   Other database errors stop the relay.
+        stop = stop or threading.Event()
+        failures = 0
+        while not stop.is_set():
+            try:
+                relayed = self.drain()
+            except (DeliveryException, TransientDatabaseException) as e:
+                failures += 1
+                delay = min(retry_delay * 2 ** (failures - 1), max_retry_delay)
+                logger.warning("%s; retrying in %.1f s", e, delay)
+                stop.wait(delay)
+                continue
+            failures = 0
+            if relayed and on_batch is not None:
+                on_batch(relayed)
+            stop.wait(poll_interval)
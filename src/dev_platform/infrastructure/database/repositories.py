@@ -1,30 +1,617 @@
 #   src/infrastructure/database/repositories.py
-from typing import List
+from datetime import datetime
+from itertools import islice, starmap
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import (
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    table,
+    text,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from domain.user.entities import User
-from domain.user.interfaces import UserRepository
-from infrastructure.database.models import UserModel
-from shared.exceptions import DatabaseException  #   New DatabaseException
+from domain.models import Membros, Projeto
+from domain.projeto.interfaces import ProjetoRepository
+from domain.user.batch import UserBatch
+from domain.user.entities import User, normalize_email
+from domain.user.interfaces import BulkSaveFailure, BulkSaveResult, UserRepository
+from infrastructure.database.contention import (
+    database_error,
+    is_unique_violation,
+    retry_transient,
+)
+from infrastructure.database.models import ProjectMemberModel, ProjectModel, UserModel
 
-class SQLUserRepository(UserRepository):
-    def __init__(self, session: Session):
+#   New DatabaseException
+from shared.exceptions import DatabaseException, DomainException
+
+DUPLICATE_EMAIL = "Email already registered"
+#   How drivers name the email uniqueness: the column's own constraint (SQLite,
+#   MySQL; PostgreSQL calls it users_email_key) and the index on lower(email)
+_EMAIL_KEYS = ("users.email", "users_email_key", "ix_users_email_lower")
+FETCH_SIZE = 10000  #   Rows fetched per round trip by bulk reads
+#   Emails per IN (...) query, well under SQLite's parameter limit
+EXISTS_CHUNK_SIZE = 500
+TRIGRAM_MIN_LENGTH = 3  #   Shorter search terms cannot use the trigram index
+
+#   Reads select plain table columns, so they run as Core statements: rows come
+#   back as tuples and become User directly, with no ORM instances, identity map
+#   or ORM compile step in between.
+USERS = UserModel.__table__
+USER_COLUMNS = (USERS.c.id, USERS.c.name, USERS.c.email)
+#   Point lookups are built once; each call only binds its parameter
+_USER_BY_ID = select(*USER_COLUMNS).where(USERS.c.id == bindparam("user_id"))
+_USER_BY_EMAIL = select(*USER_COLUMNS).where(
+    func.lower(USERS.c.email) == bindparam("email")
+)
+
+
+def _inactive_since(last_access_before: datetime):
+    #   Users who never logged in have no ultimo_acesso and, as in
+    #   Usuario.dias_desde_ultimo_acesso, no inactivity to measure.
+    return (UserModel.ativo.is_(True)) & (UserModel.ultimo_acesso < last_access_before)
+
+
+def _like_escape(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _to_users(rows: Iterable[tuple]) -> List[User]:
+    #   Rows are (id, name, email), in User's field order
+    return list(starmap(User, rows))
+
+
+def is_duplicate_email(error: BaseException) -> bool:
+    #   Any other IntegrityError (a NULL name, say) is a plain database error
+    return is_unique_violation(error, *_EMAIL_KEYS)
+
+
+def user_ids_by_key(session: Session, keys: Iterable[str]) -> Dict[str, int]:
+    #   Normalized email -> id, for the keys that are registered
+    keys = list(keys)
+    lowered = func.lower(USERS.c.email)
+    ids: Dict[str, int] = {}
+    for start in range(0, len(keys), EXISTS_CHUNK_SIZE):
+        chunk = keys[start : start + EXISTS_CHUNK_SIZE]
+        ids.update(
+            session.execute(select(lowered, USERS.c.id).where(lowered.in_(chunk))).all()
+        )
+    return ids
+
+
+def insert_user_rows(session: Session, rows: List[dict]) -> List[int]:
+    #   Inserts users rows with one executemany; returns their ids in row order
+    if session.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+        return session.scalars(
+            insert(UserModel).returning(UserModel.id, sort_by_parameter_order=True),
+            rows,
+        ).all()
+    #   No ordered RETURNING for executemany (MySQL): the new ids are looked up
+    #   by their emails, which are unique
+    session.execute(insert(UserModel), rows)
+    keys = [normalize_email(row["email"]) for row in rows]
+    ids = user_ids_by_key(session, keys)
+    return [ids[key] for key in keys]
+
+
+class _SessionRepository:
+    #   With autocommit=False (inside a unit of work) writes are left in the
+    #   session's transaction and errors are not rolled back here: the owner of
+    #   the transaction commits or rolls back.
+    def __init__(self, session: Session, autocommit: bool = True):
         self.session = session
+        self.autocommit = autocommit
+
+    def _commit(self) -> None:
+        if self.autocommit:
+            self.session.commit()
+
+    def _rollback(self) -> None:
+        if self.autocommit:
+            self.session.rollback()
+
+
+class SQLUserRepository(_SessionRepository, UserRepository):
+    def __init__(self, session: Session, autocommit: bool = True):
+        super().__init__(session, autocommit)
+        self._search_index = False
 
     def save(self, user: User) -> User:
+        if not self.autocommit:
+            #   The unit of work retries the whole transaction
+            return self._insert_user(user)
+        return retry_transient(lambda: self._insert_user(user))
+
+    def _insert_user(self, user: User) -> User:
         try:
-            db_user = UserModel(name=user.name, email=user.email)
-            self.session.add(db_user)
-            self.session.commit()
-            self.session.refresh(db_user)
-            user.id = db_user.id
+            user.id = self._insert_row(user)
+            self._commit()
             return user
+        except IntegrityError as e:
+            self._rollback()
+            if not is_duplicate_email(e):
+                raise database_error("Error saving user", e)
+            #   Another writer registered the email after our duplicate check
+            raise DomainException(DUPLICATE_EMAIL)
         except Exception as e:
-            self.session.rollback()  #   Important: Rollback on error
-            raise DatabaseException(f"Error saving user: {e}")
+            self._rollback()  #   Important: Rollback on error
+            raise database_error("Error saving user", e)
+
+    def save_many(
+        self, users: Iterable[User], batch_size: int = 1000
+    ) -> BulkSaveResult:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        result = BulkSaveResult()
+        iterator = iter(users)
+        offset = 0
+        try:
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    break
+                self._insert_batch(batch, offset, result)
+                offset += len(batch)
+            self._commit()  #   Single commit for the whole import
+            return result
+        except DomainException:
+            self._rollback()  #   Malformed input raised while streaming the users
+            raise
+        except Exception as e:
+            self._rollback()
+            raise database_error("Error saving users", e)
+
+    def _insert_batch(
+        self, batch: List[User], offset: int, result: BulkSaveResult
+    ) -> None:
+        #   A few IN queries per batch find emails that are already taken, so the
+        #   unique constraint only fires on concurrent writers.
+        taken = self._existing_keys({normalize_email(user.email) for user in batch})
+        pending = []
+        for index, user in enumerate(batch, start=offset):
+            key = normalize_email(user.email)
+            if key in taken:
+                result.failures.append(BulkSaveFailure(index, user, DUPLICATE_EMAIL))
+            else:
+                taken.add(key)  #   Also rejects duplicates inside the batch
+                pending.append((index, user))
+        if not pending:
+            return
+
+        try:
+            with self.session.begin_nested():
+                ids = self._insert_many([user for _, user in pending])
+        except IntegrityError as e:
+            if not is_duplicate_email(e):
+                raise
+            #   Lost a race with another writer: retry row by row so that only
+            #   the conflicting rows are reported and the rest of the batch is kept.
+            self._insert_rows(pending, result)
+            return
+        for (_, user), user_id in zip(pending, ids):
+            user.id = user_id
+        result.saved += len(pending)
+
+    def _insert_rows(self, pending: List[tuple], result: BulkSaveResult) -> None:
+        for index, user in pending:
+            try:
+                with self.session.begin_nested():
+                    user.id = self._insert_row(user)
+                result.saved += 1
+            except IntegrityError as e:
+                if not is_duplicate_email(e):
+                    raise
+                result.failures.append(BulkSaveFailure(index, user, DUPLICATE_EMAIL))
+
+    def _insert_row(self, user: User) -> int:
+        stmt = insert(UserModel).values(name=user.name, email=user.email)
+        if self.session.get_bind().dialect.insert_returning:
+            #   No refresh SELECT
+            return self.session.scalar(stmt.returning(UserModel.id))
+        return self.session.execute(stmt).inserted_primary_key[0]
+
+    def _insert_many(self, users: List[User]) -> List[int]:
+        #   Ids in the order of users
+        return insert_user_rows(
+            self.session, [{"name": user.name, "email": user.email} for user in users]
+        )
+
+    def find_by_id(self, user_id: int) -> Optional[User]:
+        try:
+            row = self.session.execute(_USER_BY_ID, {"user_id": user_id}).first()
+        except Exception as e:
+            raise DatabaseException(f"Error finding user by id: {e}")
+        return None if row is None else User(*row)
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        try:
+            row = self.session.execute(
+                _USER_BY_EMAIL, {"email": normalize_email(email)}
+            ).first()
+        except Exception as e:
+            raise DatabaseException(f"Error finding user by email: {e}")
+        return None if row is None else User(*row)
+
+    def exists_many(self, emails: Iterable[str]) -> Set[str]:
+        spellings = {}
+        for email in emails:
+            spellings.setdefault(normalize_email(email), []).append(email)
+        try:
+            existing = self._existing_keys(spellings)
+        except Exception as e:
+            raise DatabaseException(f"Error checking existing emails: {e}")
+        return {email for key in existing for email in spellings[key]}
+
+    def _existing_keys(self, keys: Iterable[str]) -> Set[str]:
+        return set(self._ids_by_key(keys))
+
+    def _ids_by_key(self, keys: Iterable[str]) -> Dict[str, int]:
+        return user_ids_by_key(self.session, keys)
 
     def find_all(self) -> List[User]:
+        users: List[User] = []
+        try:
+            stmt = select(*USER_COLUMNS).execution_options(yield_per=FETCH_SIZE)
+            for rows in self.session.execute(stmt).partitions():
+                users.extend(starmap(User, rows))
+        except Exception as e:
+            raise DatabaseException(f"Error finding all users: {e}")
+        return users
+
+    def find_all_batch(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> UserBatch:
+        stmt = select(*USER_COLUMNS).order_by(USERS.c.id)
+        if after_id is not None:
+            stmt = stmt.where(USERS.c.id > after_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        batch = UserBatch()
         try:
-            db_users = self.session.query(UserModel).all()
-            return [User(id=u.id, name=u.name, email=u.email) for u in db_users]
+            #   Rows go straight into the columns; no User objects are created
+            for rows in self.session.execute(
+                stmt.execution_options(yield_per=FETCH_SIZE)
+            ).partitions():
+                batch.extend_rows(rows)
         except Exception as e:
-            raise DatabaseException(f"Error finding all users: {e}")
\ No newline at end of file
+            raise DatabaseException(f"Error loading users: {e}")
+        return batch
+
+    def stream_batches(self, batch_size: int = FETCH_SIZE) -> Iterator[UserBatch]:
+        #   stream_results uses a server-side cursor where the driver has one, and
+        #   yield_per keeps only one batch of rows in memory at a time
+        stmt = (
+            select(*USER_COLUMNS)
+            .order_by(USERS.c.id)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        try:
+            for rows in self.session.execute(stmt).partitions():
+                yield UserBatch.from_rows(rows)
+        except Exception as e:
+            raise DatabaseException(f"Error streaming users: {e}")
+
+    def id_range(self) -> Tuple[Optional[int], Optional[int]]:
+        try:
+            low, high = self.session.execute(
+                select(func.min(UserModel.id), func.max(UserModel.id))
+            ).one()
+            return low, high
+        except Exception as e:
+            raise DatabaseException(f"Error reading user id range: {e}")
+
+    def count_inactive(self, last_access_before: datetime) -> int:
+        try:
+            return self.session.scalar(
+                select(func.count())
+                .select_from(UserModel)
+                .where(_inactive_since(last_access_before))
+            )
+        except Exception as e:
+            raise DatabaseException(f"Error counting inactive users: {e}")
+
+    def deactivate_inactive(
+        self, last_access_before: datetime, start_id: int, end_id: int
+    ) -> int:
+        #   One set-based UPDATE over [start_id, end_id], committed on its own unless
+        #   a unit of work owns the transaction. Already deactivated rows no longer
+        #   match, so re-running a range is harmless.
+        def attempt() -> int:
+            try:
+                count = self.session.execute(
+                    update(UserModel)
+                    .where(
+                        UserModel.id.between(start_id, end_id),
+                        _inactive_since(last_access_before),
+                    )
+                    .values(ativo=False)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                self._commit()
+                return count
+            except Exception as e:
+                self._rollback()
+                raise database_error("Error deactivating inactive users", e)
+
+        return retry_transient(attempt) if self.autocommit else attempt()
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> List[User]:
+        term = query.strip().lower()
+        if not term:
+            return []
+        pattern = _like_escape(term)
+        name, email = func.lower(USERS.c.name), func.lower(USERS.c.email)
+        #   Exact email first, then email prefix, then a name or name-word prefix,
+        #   then any other substring match
+        rank = case(
+            (email == term, 0),
+            (email.like(f"{pattern}%", escape="\\"), 1),
+            (
+                name.like(f"{pattern}%", escape="\\")
+                | name.like(f"% {pattern}%", escape="\\"),
+                2,
+            ),
+            else_=3,
+        )
+        stmt = select(*USER_COLUMNS)
+        try:
+            if len(term) >= TRIGRAM_MIN_LENGTH and self._has_search_index():
+                #   The FTS5 trigram index finds substring matches without a scan
+                phrase = '"' + term.replace('"', '""') + '"'
+                stmt = stmt.where(
+                    USERS.c.id.in_(
+                        select(literal_column("rowid"))
+                        .select_from(table("users_search"))
+                        .where(literal_column("users_search").match(phrase))
+                    )
+                )
+            else:
+                #   Served by the pg_trgm indexes on PostgreSQL, a scan elsewhere
+                stmt = stmt.where(
+                    name.like(f"%{pattern}%", escape="\\")
+                    | email.like(f"%{pattern}%", escape="\\")
+                )
+            rows = self.session.execute(
+                stmt.order_by(rank, USERS.c.id).limit(limit).offset(offset)
+            ).all()
+        except Exception as e:
+            raise DatabaseException(f"Error searching users: {e}")
+        return _to_users(rows)
+
+    def _has_search_index(self) -> bool:
+        #   Only a found index is remembered: a repository that outlives the
+        #   migration creating it starts using it on its next search
+        if not self._search_index:
+            self._search_index = (
+                self.session.get_bind().dialect.name == "sqlite"
+                and self.session.scalar(
+                    text("SELECT 1 FROM sqlite_master WHERE name = 'users_search'")
+                )
+                is not None
+            )
+        return self._search_index
+
+    def iter_all(
+        self,
+        page_size: int = 1000,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[User]:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        #   Keyset pagination: each page seeks past the last id through the primary
+        #   key index, so page N costs the same as page 1 (unlike OFFSET).
+        last_id = after_id
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            stmt = select(*USER_COLUMNS).order_by(USERS.c.id).limit(size)
+            if last_id is not None:
+                stmt = stmt.where(USERS.c.id > last_id)
+            try:
+                rows = self.session.execute(stmt).all()
+            except Exception as e:
+                raise DatabaseException(f"Error iterating users: {e}")
+            yield from starmap(User, rows)
+            if len(rows) < size:
+                return
+            last_id = rows[-1].id
+            if remaining is not None:
+                remaining -= len(rows)
+
+
+class SQLProjetoRepository(_SessionRepository, ProjetoRepository):
+    #   Membership lives in project_members; every membership query goes through
+    #   its (project_id, id) or (user_id, project_id) index, never a full project load.
+
+    def save(self, projeto: Projeto) -> Projeto:
+        try:
+            db_project = (
+                self.session.get(ProjectModel, projeto.id)
+                if projeto.id is not None
+                else None
+            )
+            if db_project is None:
+                db_project = ProjectModel(id=projeto.id)
+                self.session.add(db_project)
+            db_project.nome = projeto.nome
+            db_project.descricao = projeto.descricao
+            db_project.data_criacao = projeto.data_criacao
+            db_project.responsavel_id = projeto.responsavel_id
+            self.session.flush()
+            projeto.id = db_project.id
+
+            #   Only the members added or removed on the entity are written.
+            #   Members that are simply not in membros (a project loaded with
+            #   with_members=False lists only its responsible user) are kept.
+            wanted = list(projeto.membros)
+            existing = self._existing_members(projeto.id, wanted)
+            self._insert_members(projeto.id, [m for m in wanted if m not in existing])
+            self._delete_members(
+                projeto.id,
+                [m for m in projeto.membros.removidos() if m != projeto.responsavel_id],
+            )
+            self._commit()
+            projeto.membros.limpar_removidos()
+            return projeto
+        except Exception as e:
+            self._rollback()
+            raise DatabaseException(f"Error saving project: {e}")
+
+    def find_by_id(
+        self, projeto_id: int, with_members: bool = True
+    ) -> Optional[Projeto]:
+        #   Without members only the responsible user is listed in membros.
+        #   Saving such a project keeps the other members; remove_members drops
+        #   members that were not loaded.
+        try:
+            db_project = self.session.get(ProjectModel, projeto_id)
+            if db_project is None:
+                return None
+            membros = Membros(self.find_members(projeto_id)) if with_members else None
+        except DatabaseException:
+            raise
+        except Exception as e:
+            raise DatabaseException(f"Error finding project by id: {e}")
+        return Projeto(
+            id=db_project.id,
+            nome=db_project.nome,
+            descricao=db_project.descricao,
+            data_criacao=db_project.data_criacao,
+            responsavel_id=db_project.responsavel_id,
+            membros=membros,
+        )
+
+    def add_members(self, projeto_id: int, usuarios_ids: Iterable[int]) -> int:
+        wanted = list(dict.fromkeys(usuarios_ids))  #   Deduplicated, order kept
+        try:
+            existing = self._existing_members(projeto_id, wanted)
+            added = self._insert_members(
+                projeto_id, [u for u in wanted if u not in existing]
+            )
+            self._commit()
+            return added
+        except Exception as e:
+            self._rollback()
+            raise DatabaseException(f"Error adding project members: {e}")
+
+    def remove_members(self, projeto_id: int, usuarios_ids: Iterable[int]) -> int:
+        try:
+            responsavel_id = self.session.scalar(
+                select(ProjectModel.responsavel_id).where(ProjectModel.id == projeto_id)
+            )
+            removed = self._delete_members(
+                projeto_id, [u for u in set(usuarios_ids) if u != responsavel_id]
+            )
+            self._commit()
+            return removed
+        except Exception as e:
+            self._rollback()
+            raise DatabaseException(f"Error removing project members: {e}")
+
+    def is_member(self, projeto_id: int, usuario_id: int) -> bool:
+        try:
+            return (
+                self.session.scalar(
+                    select(ProjectMemberModel.id)
+                    .where(
+                        ProjectMemberModel.project_id == projeto_id,
+                        ProjectMemberModel.user_id == usuario_id,
+                    )
+                    .limit(1)
+                )
+                is not None
+            )
+        except Exception as e:
+            raise DatabaseException(f"Error checking project membership: {e}")
+
+    def count_members(self, projeto_id: int) -> int:
+        try:
+            return self.session.scalar(
+                select(func.count())
+                .select_from(ProjectMemberModel)
+                .where(ProjectMemberModel.project_id == projeto_id)
+            )
+        except Exception as e:
+            raise DatabaseException(f"Error counting project members: {e}")
+
+    def find_members(
+        self,
+        projeto_id: int,
+        after_usuario_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        stmt = (
+            select(ProjectMemberModel.user_id)
+            .where(ProjectMemberModel.project_id == projeto_id)
+            .order_by(ProjectMemberModel.id)
+        )
+        if after_usuario_id is not None:
+            #   Keyset on insertion order: resume after that member's row
+            after_row = (
+                select(ProjectMemberModel.id)
+                .where(
+                    ProjectMemberModel.project_id == projeto_id,
+                    ProjectMemberModel.user_id == after_usuario_id,
+                )
+                .scalar_subquery()
+            )
+            stmt = stmt.where(ProjectMemberModel.id > after_row)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        try:
+            return list(self.session.scalars(stmt))
+        except Exception as e:
+            raise DatabaseException(f"Error finding project members: {e}")
+
+    def find_projects_of_user(self, usuario_id: int) -> List[int]:
+        try:
+            return list(
+                self.session.scalars(
+                    select(ProjectMemberModel.project_id)
+                    .where(ProjectMemberModel.user_id == usuario_id)
+                    .order_by(ProjectMemberModel.project_id)
+                )
+            )
+        except Exception as e:
+            raise DatabaseException(f"Error finding projects of user: {e}")
+
+    def _existing_members(self, projeto_id: int, usuarios_ids: List[int]) -> Set[int]:
+        existing = set()
+        for start in range(0, len(usuarios_ids), EXISTS_CHUNK_SIZE):
+            chunk = usuarios_ids[start : start + EXISTS_CHUNK_SIZE]
+            existing.update(
+                self.session.scalars(
+                    select(ProjectMemberModel.user_id).where(
+                        ProjectMemberModel.project_id == projeto_id,
+                        ProjectMemberModel.user_id.in_(chunk),
+                    )
+                )
+            )
+        return existing
+
+    def _insert_members(self, projeto_id: int, usuarios_ids: List[int]) -> int:
+        if usuarios_ids:
+            self.session.execute(
+                insert(ProjectMemberModel),
+                [{"project_id": projeto_id, "user_id": u} for u in usuarios_ids],
+            )
+        return len(usuarios_ids)
+
+    def _delete_members(self, projeto_id: int, usuarios_ids: List[int]) -> int:
+        removed = 0
+        for start in range(0, len(usuarios_ids), EXISTS_CHUNK_SIZE):
+            chunk = usuarios_ids[start : start + EXISTS_CHUNK_SIZE]
+            removed += self.session.execute(
+                delete(ProjectMemberModel).where(
+                    ProjectMemberModel.project_id == projeto_id,
+                    ProjectMemberModel.user_id.in_(chunk),
+                )
+            ).rowcount
+        return removed
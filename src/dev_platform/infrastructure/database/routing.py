@@ -0,0 +1,130 @@
+#   src/infrastructure/database/routing.py
+#   Read/write splitting: sessions opened for reading use a replica, everything
+#   else (and anything that writes) uses the primary.
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+from shared.exceptions import DatabaseException
+
+STRATEGIES = ("round_robin", "least_connections")
+
+
+class ReplicaRouter:
+    #   Read-your-writes is tracked per process: for `read_your_writes_window`
+    #   seconds after a commit that wrote, reads stay on the primary.
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: Sequence[Engine],
+        strategy: str = "round_robin",
+        read_your_writes_window: float = 2.0,
+        retry_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if strategy not in STRATEGIES:
+            raise DatabaseException(
+                f"Unknown replica strategy {strategy!r}; use one of {', '.join(STRATEGIES)}"
+            )
+        self.primary = primary
+        self.replicas: List[Engine] = list(replicas)
+        self.strategy = strategy
+        self.read_your_writes_window = read_your_writes_window
+        self.retry_after = retry_after
+        self.clock = clock
+        #   Replica index -> when to try it again
+        self._down_until: Dict[int, float] = {}
+        self._last_write: Optional[float] = None
+        self._turn = 0  #   Round-robin position
+        self._lock = threading.Lock()
+
+    def record_write(self) -> None:
+        with self._lock:
+            self._last_write = self.clock()
+
+    def mark_down(self, engine: Engine) -> None:
+        with self._lock:
+            self._down_until[self.replicas.index(engine)] = (
+                self.clock() + self.retry_after
+            )
+
+    def available_replicas(self) -> List[Engine]:
+        now = self.clock()
+        with self._lock:
+            return [
+                e
+                for i, e in enumerate(self.replicas)
+                if self._down_until.get(i, 0.0) <= now
+            ]
+
+    def read_engine(self) -> Engine:
+        with self._lock:
+            recent_write = (
+                self._last_write is not None
+                and self.clock() - self._last_write < self.read_your_writes_window
+            )
+        if recent_write:
+            return self.primary
+        for engine in self._candidates():
+            try:
+                #   Checking out a pooled connection (pre-pinged) detects a dead
+                #   replica before the session relies on it
+                with engine.connect():
+                    pass
+                return engine
+            except SQLAlchemyError:
+                self.mark_down(engine)
+        return self.primary  #   Every replica is down: fail over to the primary
+
+    def _candidates(self) -> List[Engine]:
+        available = self.available_replicas()
+        if not available:
+            return []
+        if self.strategy == "least_connections":
+            return sorted(
+                available,
+                key=lambda e: e.pool.checkedout()
+                if hasattr(e.pool, "checkedout")
+                else 0,
+            )
+        #   Round robin over the replicas that are up
+        with self._lock:
+            start = self._turn % len(available)
+            self._turn += 1
+        return available[start:] + available[:start]
+
+
+class RoutingSession(Session):
+    #   A read-only session picks one replica on first use and keeps it, so its
+    #   queries see a single replica's state. Writes always go to the primary.
+    def __init__(self, router: ReplicaRouter, read_only: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.router = router
+        self.read_only = read_only
+        self._read_bind: Optional[Engine] = None
+        self._wrote = False
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self._wrote = True
+            return self.router.primary
+        if not self.read_only or self._wrote:
+            return self.router.primary
+        if self._read_bind is None:
+            self._read_bind = self.router.read_engine()
+        return self._read_bind
+
+    def close(self) -> None:
+        super().close()
+        self._read_bind = None
+
+    def commit(self) -> None:
+        super().commit()
+        if self._wrote:
+            self.router.record_write()
+            self._wrote = False
+            #   Choose again on the next read, so that it honours the read-your-writes pin
+            self._read_bind = None
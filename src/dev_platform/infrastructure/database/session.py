@@ -1,14 +1,155 @@
 #   src/infrastructure/database/session.py
-from sqlalchemy import create_engine
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine as SQLAlchemyEngine, make_url
 from sqlalchemy.orm import sessionmaker
-from infrastructure.config import DATABASE_URL  #   Assuming this holds the URL
+from infrastructure.config import Settings, get_settings
+from shared.exceptions import DatabaseException
+from shared.profiling import get_profiler
+
+_engine: Optional[SQLAlchemyEngine] = None
+_session_factory: Optional[sessionmaker] = None
+_read_session_factory: Optional[sessionmaker] = None
+_router = None
+
+
+def enable_sqlite_savepoints(engine: SQLAlchemyEngine) -> None:
+    #   pysqlite emits its own BEGIN lazily and not before SAVEPOINT, so releasing
+    #   a savepoint would commit everything. Let SQLAlchemy drive the transaction.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+def apply_sqlite_pragmas(
+    engine: SQLAlchemyEngine, journal_mode: str, synchronous: str
+) -> None:
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if engine.url.database not in (None, "", ":memory:"):
+            #   WAL lets readers run during writes
+            cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={synchronous}")
+        #   Off by default in SQLite; enforces the declared foreign keys,
+        #   including the ON DELETE CASCADE of project_members
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def engine_options(url: str, settings: Settings) -> Dict[str, Any]:
+    parsed = make_url(url)
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.pool_pre_ping,
+        "pool_recycle": settings.pool_recycle,
+    }
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        #   In-memory SQLite uses a single-connection pool without overflow
+        return options
+    options.update(pool_size=settings.pool_size, max_overflow=settings.max_overflow)
+    return options
+
+
+def build_engine(url: str, settings: Optional[Settings] = None) -> SQLAlchemyEngine:
+    settings = settings or get_settings()
+    engine = create_engine(url, **engine_options(url, settings))
+    if engine.dialect.name == "sqlite":
+        enable_sqlite_savepoints(engine)
+        apply_sqlite_pragmas(
+            engine, settings.sqlite_journal_mode, settings.sqlite_synchronous
+        )
+    return engine
+
+
+def _instrumented(engine: SQLAlchemyEngine) -> SQLAlchemyEngine:
+    profiler = get_profiler()
+    if profiler is not None:
+        from infrastructure.database.instrumentation import instrument_engine
+
+        instrument_engine(engine, profiler)
+    return engine
+
+
+def get_engine() -> SQLAlchemyEngine:
+    #   Built on first use: importing this module never touches the database
+    global _engine
+    if _engine is None:
+        url = get_settings().database_url
+        if not url:
+            raise DatabaseException("DATABASE_URL is not set")
+        _engine = _instrumented(build_engine(url))
+    return _engine
+
+
+def get_router():
+    #   None unless DATABASE_REPLICA_URLS lists at least one replica
+    global _router
+    settings = get_settings()
+    if _router is None and settings.replica_urls:
+        from infrastructure.database.routing import ReplicaRouter
+
+        _router = ReplicaRouter(
+            get_engine(),
+            [
+                _instrumented(build_engine(url, settings))
+                for url in settings.replica_urls
+            ],
+            strategy=settings.replica_strategy,
+            read_your_writes_window=settings.read_your_writes_window,
+            retry_after=settings.replica_retry_after,
+        )
+    return _router
+
+
+def get_sessionmaker(read_only: bool = False) -> sessionmaker:
+    #   Read-only sessions go to a replica when replicas are configured
+    global _session_factory, _read_session_factory
+    router = get_router()
+    if router is None:
+        if _session_factory is None:
+            _session_factory = sessionmaker(
+                autocommit=False, autoflush=False, bind=get_engine()
+            )
+        return _session_factory
+    from infrastructure.database.routing import RoutingSession
+
+    if read_only:
+        if _read_session_factory is None:
+            _read_session_factory = sessionmaker(
+                class_=RoutingSession,
+                router=router,
+                read_only=True,
+                autocommit=False,
+                autoflush=False,
+            )
+        return _read_session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(
+            class_=RoutingSession, router=router, autocommit=False, autoflush=False
+        )
+    return _session_factory
+
+
+def __getattr__(name: str):
+    #   Lazy aliases for the former module-level Engine and SessionLocal
+    if name == "Engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-Engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=Engine)
 
 def get_db_session():
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -0,0 +1,726 @@
+#   src/infrastructure/database/sharding.py
+#   Users spread over several databases with the same schema. The owner of a
+#   user is a jump consistent hash of the normalized email, so going from N to
+#   M shards only moves the users whose owner changes, all of them to the new
+#   shards. Ids seen by callers are global: local id * SHARD_SLOTS + shard.
+import hashlib
+import heapq
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from sqlalchemy import bindparam, delete, exists, or_, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from domain.stats.interfaces import StatsRepository
+from domain.user.batch import UserBatch
+from domain.user.entities import User, normalize_email
+from domain.user.interfaces import BulkSaveFailure, BulkSaveResult, UserRepository
+from infrastructure.database.contention import database_error, retry_transient
+from infrastructure.database.models import (
+    ProjectMemberModel,
+    ProjectModel,
+    ShardLayoutModel,
+    UserModel,
+)
+from infrastructure.database.repositories import (
+    EXISTS_CHUNK_SIZE,
+    FETCH_SIZE,
+    USERS,
+    SQLUserRepository,
+    insert_user_rows,
+    user_ids_by_key,
+)
+from infrastructure.database.stats import SQLStatsRepository
+from shared.exceptions import DatabaseException, DomainException
+
+T = TypeVar("T")
+SHARD_SLOTS = 64  #   Most shards a deployment can have; part of every global id
+#   Share-locked where the database supports it, so a reshard marking the shard
+#   waits for the writes that already passed the check
+_LAYOUT = (
+    select(ShardLayoutModel.shards, ShardLayoutModel.resharding)
+    .where(ShardLayoutModel.id == 1)
+    .with_for_update(read=True)
+)
+
+
+def _hash_key(email: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(normalize_email(email).encode("utf-8"), digest_size=8).digest(),
+        "big",
+    )
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    #   Lamping & Veach, "A Fast, Minimal Memory, Consistent Hash Algorithm"
+    b, j = -1, 0
+    while j < buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return b
+
+
+def shard_for_email(email: str, shards: int) -> int:
+    return jump_hash(_hash_key(email), shards)
+
+
+def encode_id(local_id: int, shard: int) -> int:
+    return local_id * SHARD_SLOTS + shard
+
+
+def decode_id(user_id: int) -> Tuple[int, int]:
+    return divmod(user_id, SHARD_SLOTS)  #   (local id, shard)
+
+
+def _local_after(after_id: Optional[int], shard: int) -> Optional[int]:
+    #   Largest local id whose global id is <= after_id: keyset resumes past it
+    return None if after_id is None else (after_id - shard) // SHARD_SLOTS
+
+
+def _search_rank(user: User, term: str) -> int:
+    #   Same order as SQLUserRepository.search, to merge the shards' pages
+    email, name = user.email.lower(), user.name.lower()
+    if email == term:
+        return 0
+    if email.startswith(term):
+        return 1
+    if name.startswith(term) or f" {term}" in name:
+        return 2
+    return 3
+
+
+class ShardedUserRepository(UserRepository):
+    #   Point reads and writes go to the owning shard only. Listings query every
+    #   shard in parallel and merge the streams by global id. Each call commits
+    #   on the shards it touched; there is no transaction across shards. Writes
+    #   first check the shard's layout row and are refused while a reshard runs,
+    #   or once a reshard has moved the users to a different number of shards.
+    def __init__(self, engines: Sequence[Engine]):
+        if not engines:
+            raise DatabaseException("At least one shard is needed")
+        if len(engines) > SHARD_SLOTS:
+            raise DatabaseException(f"At most {SHARD_SLOTS} shards are supported")
+        self.engines = list(engines)
+        self._sessions = [
+            sessionmaker(bind=engine, autoflush=False) for engine in self.engines
+        ]
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.engines), thread_name_prefix="shard"
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def shard_for(self, email: str) -> int:
+        return shard_for_email(email, len(self.engines))
+
+    def _call(self, shard: int, operation: Callable[[SQLUserRepository], T]) -> T:
+        #   A short-lived session per call keeps the shards usable from many threads
+        with self._sessions[shard]() as session:
+            return operation(SQLUserRepository(session))
+
+    def _write(self, shard: int, operation: Callable[[SQLUserRepository], T]) -> T:
+        #   The layout check and the write share one transaction, retried as a
+        #   whole on lock conflicts
+        def attempt() -> T:
+            with self._sessions[shard]() as session:
+                self._check_layout(session)
+                result = operation(SQLUserRepository(session, autocommit=False))
+                try:
+                    session.commit()
+                except Exception as e:
+                    raise database_error("Error committing to shard", e)
+                return result
+
+        return retry_transient(attempt)
+
+    def _check_layout(self, session: Session) -> None:
+        try:
+            layout = session.execute(_LAYOUT).first()
+        except Exception as e:
+            raise database_error("Error reading shard layout", e)
+        if layout is None:
+            return
+        if layout.resharding:
+            raise DatabaseException(
+                "Users are being resharded; writes resume once reshard-users finishes"
+            )
+        if layout.shards is not None and layout.shards != len(self.engines):
+            raise DatabaseException(
+                f"Users were resharded to {layout.shards} shards but "
+                f"{len(self.engines)} are configured; update DATABASE_SHARD_URLS"
+            )
+
+    def _scatter(
+        self,
+        operation: Callable[[int, SQLUserRepository], T],
+        shards: Optional[Iterable[int]] = None,
+        write: bool = False,
+    ) -> List[T]:
+        shards = range(len(self.engines)) if shards is None else shards
+        call = self._write if write else self._call
+        futures = [
+            self._executor.submit(call, k, lambda repo, k=k: operation(k, repo))
+            for k in shards
+        ]
+        return [future.result() for future in futures]
+
+    def map_shards(self, operation: Callable[[Session], T]) -> List[T]:
+        def call(shard: int) -> T:
+            with self._sessions[shard]() as session:
+                return operation(session)
+
+        futures = [self._executor.submit(call, k) for k in range(len(self.engines))]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _globalize(user: Optional[User], shard: int) -> Optional[User]:
+        if user is not None:
+            user.id = encode_id(user.id, shard)
+        return user
+
+    def save(self, user: User) -> User:
+        shard = self.shard_for(user.email)
+        return self._globalize(self._write(shard, lambda repo: repo.save(user)), shard)
+
+    def save_many(
+        self, users: Iterable[User], batch_size: int = 1000
+    ) -> BulkSaveResult:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        result = BulkSaveResult()
+        iterator = iter(users)
+        offset = 0
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            #   Shard -> indexes in batch
+            positions: Dict[int, List[int]] = defaultdict(list)
+            for index, user in enumerate(batch):
+                positions[self.shard_for(user.email)].append(index)
+            parts = self._scatter(
+                lambda k, repo: repo.save_many(
+                    [batch[i] for i in positions[k]], batch_size
+                ),
+                positions,
+                write=True,
+            )
+            for shard, part in zip(positions, parts):
+                indexes = positions[shard]
+                result.saved += part.saved
+                failed = set()
+                for failure in part.failures:
+                    failed.add(failure.index)
+                    result.failures.append(
+                        BulkSaveFailure(
+                            offset + indexes[failure.index],
+                            failure.user,
+                            failure.reason,
+                        )
+                    )
+                for j, index in enumerate(indexes):
+                    if j not in failed:
+                        self._globalize(batch[index], shard)
+            offset += len(batch)
+        result.failures.sort(key=lambda f: f.index)
+        return result
+
+    def find_by_id(self, user_id: int) -> Optional[User]:
+        local_id, shard = decode_id(user_id)
+        if shard >= len(self.engines):
+            return None
+        return self._globalize(
+            self._call(shard, lambda repo: repo.find_by_id(local_id)), shard
+        )
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        shard = self.shard_for(email)
+        return self._globalize(
+            self._call(shard, lambda repo: repo.find_by_email(email)), shard
+        )
+
+    def exists_many(self, emails: Iterable[str]) -> Set[str]:
+        by_shard: Dict[int, List[str]] = defaultdict(list)
+        for email in emails:
+            by_shard[self.shard_for(email)].append(email)
+        return set().union(
+            *self._scatter(lambda k, repo: repo.exists_many(by_shard[k]), by_shard)
+        )
+
+    def find_all(self) -> List[User]:
+        return list(self.iter_all(page_size=FETCH_SIZE))
+
+    def iter_all(
+        self,
+        page_size: int = 1000,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[User]:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        #   Every shard's first page is requested before any is read; after that
+        #   each shard fetches its next page in the background while the current
+        #   one is merged
+        firsts = [
+            self._executor.submit(self._page, k, page_size, _local_after(after_id, k))
+            for k in range(len(self.engines))
+        ]
+        streams = [
+            self._shard_stream(k, page_size, first) for k, first in enumerate(firsts)
+        ]
+        merged = heapq.merge(*streams, key=lambda user: user.id)
+        return merged if limit is None else islice(merged, limit)
+
+    def _page(
+        self, shard: int, page_size: int, after_local: Optional[int]
+    ) -> List[User]:
+        return self._call(
+            shard,
+            lambda repo: list(
+                repo.iter_all(
+                    page_size=page_size, after_id=after_local, limit=page_size
+                )
+            ),
+        )
+
+    def _shard_stream(
+        self, shard: int, page_size: int, future: "Future[List[User]]"
+    ) -> Iterator[User]:
+        while True:
+            users = future.result()
+            if len(users) == page_size:
+                future = self._executor.submit(
+                    self._page, shard, page_size, users[-1].id
+                )
+            for user in users:
+                yield self._globalize(user, shard)
+            if len(users) < page_size:
+                return
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> List[User]:
+        term = query.strip().lower()
+        pages = self._scatter(
+            lambda k, repo: [
+                self._globalize(u, k) for u in repo.search(query, limit=offset + limit)
+            ]
+        )
+        ranked = sorted(
+            (user for users in pages for user in users),
+            key=lambda u: (_search_rank(u, term), u.id),
+        )
+        return ranked[offset : offset + limit]
+
+    def find_all_batch(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> UserBatch:
+        return UserBatch.from_users(
+            self.iter_all(page_size=FETCH_SIZE, after_id=after_id, limit=limit)
+        )
+
+    def stream_batches(self, batch_size: int = FETCH_SIZE) -> Iterator[UserBatch]:
+        users = self.iter_all(page_size=batch_size)
+        while True:
+            batch = UserBatch.from_users(islice(users, batch_size))
+            if not len(batch):
+                return
+            yield batch
+
+    def id_range(self) -> Tuple[Optional[int], Optional[int]]:
+        ranges = self._scatter(lambda k, repo: repo.id_range())
+        lows = [
+            encode_id(low, k) for k, (low, _) in enumerate(ranges) if low is not None
+        ]
+        highs = [
+            encode_id(high, k) for k, (_, high) in enumerate(ranges) if high is not None
+        ]
+        return (min(lows), max(highs)) if lows else (None, None)
+
+    def count_inactive(self, last_access_before: datetime) -> int:
+        return sum(
+            self._scatter(lambda k, repo: repo.count_inactive(last_access_before))
+        )
+
+    def deactivate_inactive(
+        self, last_access_before: datetime, start_id: int, end_id: int
+    ) -> int:
+        def deactivate(shard: int, repo: SQLUserRepository) -> int:
+            low, high = _local_after(start_id - 1, shard) + 1, _local_after(
+                end_id, shard
+            )
+            return (
+                repo.deactivate_inactive(last_access_before, low, high)
+                if low <= high
+                else 0
+            )
+
+        return sum(self._scatter(deactivate, write=True))
+
+
+class ShardedStatsRepository(StatsRepository):
+    #   Each shard's triggers keep the user summaries of that shard, so user
+    #   figures are added up over the shards. Projects are not sharded: their
+    #   summaries come from the primary database.
+    def __init__(self, users: ShardedUserRepository, primary: StatsRepository):
+        self.users = users
+        self.primary = primary
+
+    def user_totals(self) -> Tuple[int, int]:
+        totals = self.users.map_shards(
+            lambda session: SQLStatsRepository(session).user_totals()
+        )
+        return sum(active for active, _ in totals), sum(
+            inactive for _, inactive in totals
+        )
+
+    def active_users_by_access_day(
+        self, ranges: Sequence[Tuple[Optional[date], Optional[date]]]
+    ) -> List[int]:
+        counts = self.users.map_shards(
+            lambda session: SQLStatsRepository(session).active_users_by_access_day(
+                ranges
+            )
+        )
+        return [sum(column) for column in zip(*counts)]
+
+    def project_totals(self) -> Tuple[int, int]:
+        return self.primary.project_totals()
+
+    def largest_projects(self, limit: int) -> List[Tuple[int, str, int]]:
+        return self.primary.largest_projects(limit)
+
+    def rebuild(self) -> None:
+        #   Every shard commits its own rebuild; the primary's runs in the
+        #   caller's transaction
+        def rebuild_shard(session: Session) -> None:
+            SQLStatsRepository(session).rebuild()
+            try:
+                session.commit()
+            except Exception as e:
+                raise database_error("Error rebuilding shard stats", e)
+
+        self.users.map_shards(rebuild_shard)
+        self.primary.rebuild()
+
+
+@dataclass
+class ReshardReport:
+    scanned: int = 0
+    moved: int = 0
+    retried: int = 0  #   Users copied again because they changed while being moved
+
+
+def reshard(
+    engines: Sequence[Engine],
+    current_shards: int,
+    chunk_size: int = 1000,
+    on_progress: Optional[Callable[[int, ReshardReport], None]] = None,
+    on_move: Optional[Callable[[int, int], None]] = None,
+) -> ReshardReport:
+    #   engines[:current_shards] hold the data today; the rest are new, empty
+    #   shards with the schema already migrated.
+    #
+    #   User writes are blocked for the whole run: every shard's layout row is
+    #   marked as resharding first, and ShardedUserRepository refuses to write
+    #   while it is. At the end the rows record the new number of shards and the
+    #   mark is cleared, so only repositories configured with all the shards
+    #   can write again. Reads are not blocked but still route by the old
+    #   layout: until DATABASE_SHARD_URLS is updated, users already moved are
+    #   not found. A failed run leaves writes blocked; run it again to finish.
+    #
+    #   Each chunk is copied to its new owners, committed there, and only then
+    #   deleted from the source, so a user is never missing. The delete only
+    #   removes rows still equal to what was copied, so writes that bypass the
+    #   repository are copied again rather than lost. Projects and memberships
+    #   are not sharded, so users that own or belong to a project are never
+    #   moved; the run refuses to start if any would have to. Moved users get a
+    #   new local id, so their global id changes: on_move receives (old id, new id).
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if not 0 < current_shards <= len(engines) <= SHARD_SLOTS:
+        raise DomainException(
+            f"Need between {current_shards} and {SHARD_SLOTS} shards, got {len(engines)}"
+        )
+    report = ReshardReport()
+    try:
+        _check_layouts(engines, current_shards)
+        _check_references(engines, current_shards)
+        for engine in engines:
+            _set_layout(engine, resharding=True)
+        for source in range(current_shards):
+            last_id = 0
+            while True:
+                with Session(engines[source]) as session:
+                    rows = session.execute(
+                        select(*_MOVED_COLUMNS)
+                        .where(UserModel.id > last_id)
+                        .order_by(UserModel.id)
+                        .limit(chunk_size)
+                    ).all()
+                if not rows:
+                    break
+                last_id = rows[-1].id
+                report.scanned += len(rows)
+                _move_rows(engines, source, rows, report, on_move)
+                if on_progress is not None:
+                    on_progress(source, report)
+        for engine in engines:
+            _set_layout(engine, resharding=False, shards=len(engines))
+    except (DomainException, DatabaseException):
+        raise
+    except Exception as e:
+        raise DatabaseException(f"Error resharding users: {e}")
+    return report
+
+
+_MOVED_COLUMNS = (
+    UserModel.id,
+    UserModel.name,
+    UserModel.email,
+    UserModel.ultimo_acesso,
+    UserModel.ativo,
+)
+_REFERENCES = (ProjectMemberModel.user_id, ProjectModel.responsavel_id)
+RESHARD_ATTEMPTS = 5  #   Copies of a chunk before giving up on users that keep changing
+
+
+def _check_layouts(engines: Sequence[Engine], current_shards: int) -> None:
+    for source in range(current_shards):
+        with Session(engines[source]) as session:
+            shards = session.scalar(
+                select(ShardLayoutModel.shards).where(ShardLayoutModel.id == 1)
+            )
+        if shards is not None and shards != current_shards:
+            raise DomainException(
+                f"Shard {source} records {shards} shards, not {current_shards}; "
+                f"check DATABASE_SHARD_URLS"
+            )
+
+
+def _set_layout(engine: Engine, **values) -> None:
+    #   On PostgreSQL and MySQL the update waits for writes holding the row's
+    #   share lock; on SQLite those writes fail on the stale snapshot and retry
+    with Session(engine) as session:
+        session.execute(
+            update(ShardLayoutModel).where(ShardLayoutModel.id == 1).values(**values)
+        )
+        session.commit()
+
+
+def _check_references(engines: Sequence[Engine], current_shards: int) -> None:
+    pinned = []
+    for source in range(current_shards):
+        referenced = or_(*(UserModel.id.in_(select(column)) for column in _REFERENCES))
+        with Session(engines[source]) as session:
+            for row in session.execute(
+                select(UserModel.id, UserModel.email).where(referenced)
+            ):
+                if shard_for_email(row.email, len(engines)) != source:
+                    pinned.append(encode_id(row.id, source))
+    if pinned:
+        shown = ", ".join(str(user_id) for user_id in pinned[:10])
+        raise DomainException(
+            f"{len(pinned)} users that own or belong to a project would move to another shard "
+            f"(ids {shown}{', ...' if len(pinned) > 10 else ''}); projects are not sharded, "
+            f"so reassign them first"
+        )
+
+
+def _move_rows(
+    engines: Sequence[Engine],
+    source: int,
+    rows: list,
+    report: ReshardReport,
+    on_move: Optional[Callable[[int, int], None]],
+) -> None:
+    pending = [
+        row for row in rows if shard_for_email(row.email, len(engines)) != source
+    ]
+    for attempt in range(RESHARD_ATTEMPTS):
+        if not pending:
+            return
+        if attempt:
+            report.retried += len(pending)
+        #   Source local id -> (target, target local id)
+        copies: Dict[int, Tuple[int, int]] = {}
+        moving: Dict[int, list] = defaultdict(list)
+        for row in pending:
+            moving[shard_for_email(row.email, len(engines))].append(row)
+        for target, group in moving.items():
+            new_ids = _copy_users(engines[target], group)
+            for row in group:
+                copies[row.id] = (target, new_ids[normalize_email(row.email)])
+        deleted = _delete_unchanged(engines[source], pending)
+        for row in pending:
+            if row.id in deleted:
+                target, new_id = copies[row.id]
+                if on_move is not None:
+                    on_move(encode_id(row.id, source), encode_id(new_id, target))
+        report.moved += len(deleted)
+        left = [row.id for row in pending if row.id not in deleted]
+        if not left:
+            return
+        #   Changed, deleted or newly referenced since they were read: the copies
+        #   are stale, so drop them and start over from the rows as they are now
+        by_target: Dict[int, List[int]] = defaultdict(list)
+        for user_id in left:
+            target, new_id = copies[user_id]
+            by_target[target].append(new_id)
+        for target, new_ids in by_target.items():
+            _delete_ids(engines[target], new_ids)
+        with Session(engines[source]) as session:
+            current = _select_in(session, select(*_MOVED_COLUMNS), UserModel.id, left)
+            referenced = {
+                user_id
+                for column in _REFERENCES
+                for user_id in _select_in(
+                    session, select(column), column, left, scalars=True
+                )
+            }
+        pending = [
+            row for row in current if shard_for_email(row.email, len(engines)) != source
+        ]
+        if any(row.id in referenced for row in pending):
+            raise DomainException(
+                f"Users {sorted(encode_id(row.id, source) for row in pending if row.id in referenced)} "
+                f"joined a project while being moved; reassign them and run again"
+            )
+    if pending:
+        raise DatabaseException(
+            f"Users {[encode_id(row.id, source) for row in pending]} kept changing while being "
+            f"moved; run again"
+        )
+
+
+def _select_in(
+    session: Session, query, column, values: list, scalars: bool = False
+) -> list:
+    found = []
+    for start in range(0, len(values), EXISTS_CHUNK_SIZE):
+        statement = query.where(column.in_(values[start : start + EXISTS_CHUNK_SIZE]))
+        found.extend(
+            session.scalars(statement) if scalars else session.execute(statement)
+        )
+    return found
+
+
+def _copy_users(engine: Engine, rows: list) -> Dict[str, int]:
+    #   Returns the target's local id per normalized email. Users already copied
+    #   by an interrupted run are found instead of inserted again, and brought up
+    #   to date with the source.
+    with Session(engine) as session:
+        ids = user_ids_by_key(session, (normalize_email(row.email) for row in rows))
+        found = [row for row in rows if normalize_email(row.email) in ids]
+        if found:
+            session.execute(
+                update(USERS)
+                .where(USERS.c.id == bindparam("b_id"))
+                .values(
+                    name=bindparam("b_name"),
+                    ultimo_acesso=bindparam("b_ultimo_acesso"),
+                    ativo=bindparam("b_ativo"),
+                ),
+                [
+                    {
+                        "b_id": ids[normalize_email(row.email)],
+                        "b_name": row.name,
+                        "b_ultimo_acesso": row.ultimo_acesso,
+                        "b_ativo": row.ativo,
+                    }
+                    for row in found
+                ],
+            )
+        missing = [row for row in rows if normalize_email(row.email) not in ids]
+        if missing:
+            new_ids = insert_user_rows(
+                session,
+                [
+                    {
+                        "name": row.name,
+                        "email": row.email,
+                        "ultimo_acesso": row.ultimo_acesso,
+                        "ativo": row.ativo,
+                    }
+                    for row in missing
+                ],
+            )
+            ids.update(zip((normalize_email(row.email) for row in missing), new_ids))
+        session.commit()
+    return ids
+
+
+def _delete_unchanged(engine: Engine, rows: list) -> Set[int]:
+    #   Deletes each row only if it still has the values that were copied and
+    #   nothing references it; returns the ids actually deleted
+    unchanged = delete(USERS).where(
+        USERS.c.id == bindparam("b_id"),
+        USERS.c.name == bindparam("b_name"),
+        USERS.c.email == bindparam("b_email"),
+        USERS.c.ativo == bindparam("b_ativo"),
+        USERS.c.ultimo_acesso.is_not_distinct_from(
+            bindparam("b_ultimo_acesso", type_=USERS.c.ultimo_acesso.type)
+        ),
+        *(~exists().where(column == USERS.c.id) for column in _REFERENCES),
+    )
+    ids = [row.id for row in rows]
+    with Session(engine) as session:
+        session.execute(
+            unchanged,
+            [
+                {
+                    "b_id": row.id,
+                    "b_name": row.name,
+                    "b_email": row.email,
+                    "b_ativo": row.ativo,
+                    "b_ultimo_acesso": row.ultimo_acesso,
+                }
+                for row in rows
+            ],
+        )
+        remaining = set(
+            _select_in(session, select(USERS.c.id), USERS.c.id, ids, scalars=True)
+        )
+        session.commit()
+    return {user_id for user_id in ids if user_id not in remaining}
+
+
+def _delete_ids(engine: Engine, ids: List[int]) -> None:
+    with Session(engine) as session:
+        for start in range(0, len(ids), EXISTS_CHUNK_SIZE):
+            session.execute(
+                delete(USERS).where(
+                    USERS.c.id.in_(ids[start : start + EXISTS_CHUNK_SIZE])
+                )
+            )
+        session.commit()
+
+
+_sharded_users: Optional[ShardedUserRepository] = None
+
+
+def get_sharded_user_repository() -> Optional[ShardedUserRepository]:
+    #   None unless DATABASE_SHARD_URLS lists the shards; built once per process
+    global _sharded_users
+    if _sharded_users is None:
+        from infrastructure.config import get_settings
+        from infrastructure.database.session import build_engine
+
+        urls = get_settings().shard_urls
+        if urls:
+            _sharded_users = ShardedUserRepository([build_engine(url) for url in urls])
+    return _sharded_users
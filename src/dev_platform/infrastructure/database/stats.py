@@ -0,0 +1,160 @@
+#   src/infrastructure/database/stats.py
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import and_, case, delete, func, insert, select, text, true
+from sqlalchemy.orm import Session
+from domain.stats.interfaces import StatsRepository
+from infrastructure.database.contention import database_error
+from infrastructure.database.models import (
+    ProjectMemberCountModel,
+    ProjectMemberModel,
+    ProjectModel,
+    StatsCounterModel,
+    UserAccessDayModel,
+    UserModel,
+)
+from shared.exceptions import DatabaseException
+
+STATS_SLOTS = 8  #   Must match SLOTS in the stats migration, which writes the triggers
+USERS_ACTIVE = "users_active"
+USERS_INACTIVE = "users_inactive"
+PROJECTS = "projects"
+PROJECT_MEMBERS = "project_members"
+COUNTERS = (USERS_ACTIVE, USERS_INACTIVE, PROJECTS, PROJECT_MEMBERS)
+
+
+class SQLStatsRepository(StatsRepository):
+    #   Reads touch a fixed number of counter rows, one row per calendar day of
+    #   last access, or `limit` projects through the members index.
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _counters(self, *names: str) -> List[int]:
+        values = dict(
+            self.session.execute(
+                select(StatsCounterModel.name, func.sum(StatsCounterModel.value))
+                .where(StatsCounterModel.name.in_(names))
+                .group_by(StatsCounterModel.name)
+            ).all()
+        )
+        return [values.get(name) or 0 for name in names]
+
+    def user_totals(self) -> Tuple[int, int]:
+        try:
+            active, inactive = self._counters(USERS_ACTIVE, USERS_INACTIVE)
+            return active, inactive
+        except Exception as e:
+            raise DatabaseException(f"Error reading user stats: {e}")
+
+    def active_users_by_access_day(
+        self, ranges: Sequence[Tuple[Optional[date], Optional[date]]]
+    ) -> List[int]:
+        if not ranges:
+            return []
+        day = UserAccessDayModel.day
+        sums = []
+        for first_day, last_day in ranges:
+            bounds = [day >= first_day] if first_day is not None else []
+            if last_day is not None:
+                bounds.append(day <= last_day)
+            sums.append(
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (and_(true(), *bounds), UserAccessDayModel.active_users),
+                            else_=0,
+                        )
+                    ),
+                    0,
+                )
+            )
+        try:
+            return list(self.session.execute(select(*sums)).one())
+        except Exception as e:
+            raise DatabaseException(f"Error reading access stats: {e}")
+
+    def project_totals(self) -> Tuple[int, int]:
+        try:
+            projects, memberships = self._counters(PROJECTS, PROJECT_MEMBERS)
+            return projects, memberships
+        except Exception as e:
+            raise DatabaseException(f"Error reading project stats: {e}")
+
+    def largest_projects(self, limit: int) -> List[Tuple[int, str, int]]:
+        counts = ProjectMemberCountModel
+        try:
+            rows = self.session.execute(
+                select(counts.project_id, ProjectModel.nome, counts.members)
+                .join(ProjectModel, ProjectModel.id == counts.project_id)
+                .where(counts.members > 0)
+                .order_by(counts.members.desc(), counts.project_id.desc())
+                .limit(limit)
+            ).all()
+        except Exception as e:
+            raise DatabaseException(f"Error reading project stats: {e}")
+        return [tuple(row) for row in rows]
+
+    def rebuild(self) -> None:
+        #   Runs in the caller's transaction. On PostgreSQL the source tables are
+        #   locked against writes so no trigger update lands between the counts
+        #   and the commit; SQLite already holds its write lock from the first delete.
+        try:
+            if self.session.get_bind().dialect.name == "postgresql":
+                self.session.execute(
+                    text("LOCK TABLE users, projects, project_members IN SHARE MODE")
+                )
+            for model in (
+                StatsCounterModel,
+                UserAccessDayModel,
+                ProjectMemberCountModel,
+            ):
+                self.session.execute(delete(model))
+
+            values = {
+                (name, slot): 0 for name in COUNTERS for slot in range(STATS_SLOTS)
+            }
+            slot = UserModel.id % STATS_SLOTS
+            for user_slot, ativo, count in self.session.execute(
+                select(slot, UserModel.ativo, func.count()).group_by(
+                    slot, UserModel.ativo
+                )
+            ):
+                values[USERS_ACTIVE if ativo else USERS_INACTIVE, user_slot] += count
+            for name, model in (
+                (PROJECTS, ProjectModel),
+                (PROJECT_MEMBERS, ProjectMemberModel),
+            ):
+                slot = model.id % STATS_SLOTS
+                for row_slot, count in self.session.execute(
+                    select(slot, func.count()).group_by(slot)
+                ):
+                    values[name, row_slot] += count
+            self.session.execute(
+                insert(StatsCounterModel),
+                [
+                    {"name": name, "slot": slot, "value": value}
+                    for (name, slot), value in values.items()
+                ],
+            )
+
+            day = func.date(UserModel.ultimo_acesso)
+            self.session.execute(
+                insert(UserAccessDayModel).from_select(
+                    ["day", "active_users"],
+                    select(day, func.count())
+                    .where(
+                        UserModel.ativo.is_(True), UserModel.ultimo_acesso.is_not(None)
+                    )
+                    .group_by(day),
+                )
+            )
+            self.session.execute(
+                insert(ProjectMemberCountModel).from_select(
+                    ["project_id", "members"],
+                    select(ProjectMemberModel.project_id, func.count()).group_by(
+                        ProjectMemberModel.project_id
+                    ),
+                )
+            )
+        except Exception as e:
+            raise database_error("Error rebuilding stats", e)
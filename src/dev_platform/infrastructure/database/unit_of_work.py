@@ -0,0 +1,79 @@
+#   src/infrastructure/database/unit_of_work.py
+from typing import Callable, Optional, TypeVar
+from sqlalchemy.orm import Session
+from domain.unit_of_work import UnitOfWork
+from infrastructure.cache.user_cache import with_user_cache
+from infrastructure.config import get_settings
+from infrastructure.database.contention import database_error, retry_transient
+from infrastructure.database.outbox import SQLOutbox
+from infrastructure.database.repositories import SQLProjetoRepository, SQLUserRepository
+from infrastructure.database.session import get_sessionmaker
+from infrastructure.database.sharding import (
+    ShardedStatsRepository,
+    get_sharded_user_repository,
+)
+from infrastructure.database.stats import SQLStatsRepository
+from shared.exceptions import DatabaseException
+
+T = TypeVar("T")
+
+
+class SQLUnitOfWork(UnitOfWork):
+    #   read_only=True lets reads go to a replica when replicas are configured;
+    #   anything written through it still reaches the primary. With
+    #   DATABASE_SHARD_URLS set, users live on the shards instead: each user
+    #   write commits on its shard at once and is not part of this transaction,
+    #   so the outbox must be turned off (OUTBOX_ENABLED=0): an event written
+    #   here could commit without its user, or the user without its event.
+    #   USER_CACHE_ENABLED puts a cache shared by every unit of work in front of users.
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        read_only: bool = False,
+    ):
+        self.session_factory = session_factory
+        self.read_only = read_only
+        self.session: Optional[Session] = None
+
+    def __enter__(self) -> "SQLUnitOfWork":
+        settings = get_settings()
+        if settings.shard_urls and settings.outbox_enabled:
+            raise DatabaseException(
+                "The outbox cannot be used with DATABASE_SHARD_URLS: set "
+                "OUTBOX_ENABLED=0 or remove DATABASE_SHARD_URLS"
+            )
+        self.session = (self.session_factory or get_sessionmaker(self.read_only))()
+        sharded = get_sharded_user_repository()
+        self.users = with_user_cache(
+            sharded or SQLUserRepository(self.session, autocommit=False)
+        )
+        self.projetos = SQLProjetoRepository(self.session, autocommit=False)
+        self.outbox = SQLOutbox(self.session) if settings.outbox_enabled else None
+        self.stats = SQLStatsRepository(self.session)
+        if sharded is not None:
+            self.stats = ShardedStatsRepository(sharded, self.stats)
+        return self
+
+    def commit(self) -> None:
+        try:
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise database_error("Error committing unit of work", e)
+
+    def rollback(self) -> None:
+        self.session.rollback()
+
+    def close(self) -> None:
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    def run(self, work: Callable[[UnitOfWork], T]) -> T:
+        #   Lock conflicts (SQLite "database is locked", PostgreSQL serialization
+        #   failures) restart the whole transaction with backoff. Not with
+        #   shards: user writes have already committed there and would be
+        #   repeated. Each shard write retries on its own instead.
+        if get_sharded_user_repository() is not None:
+            return UnitOfWork.run(self, work)
+        return retry_transient(lambda: UnitOfWork.run(self, work))
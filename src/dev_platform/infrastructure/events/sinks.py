@@ -0,0 +1,47 @@
+#   src/infrastructure/events/sinks.py
+#   Destinations for OutboxRelay: any callable taking a list of OutboxMessage.
+#   A sink must raise if the batch was not accepted, so it is delivered again.
+import importlib
+import os
+import sys
+from typing import Callable, List
+from infrastructure.database.outbox import OutboxMessage
+from shared.exceptions import DomainException
+
+
+class FileSink:
+    #   Appends one JSON object per line; path "-" writes to stdout
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self, messages: List[OutboxMessage]) -> None:
+        lines = "".join(message.to_json() + "\n" for message in messages)
+        if self.path == "-":
+            sys.stdout.write(lines)
+            sys.stdout.flush()
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())  #   On disk before the rows are deleted
+
+
+class CallbackSink:
+    #   Calls the callback once per message, in outbox order
+    def __init__(self, callback: Callable[[OutboxMessage], None]):
+        self.callback = callback
+
+    def __call__(self, messages: List[OutboxMessage]) -> None:
+        for message in messages:
+            self.callback(message)
+
+
+def load_callback(spec: str) -> Callable[[OutboxMessage], None]:
+    #   "package.module:function"
+    module_name, _, attribute = spec.partition(":")
+    if not module_name or not attribute:
+        raise DomainException(f"Callback must look like module:function, got {spec!r}")
+    try:
+        return getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as e:
+        raise DomainException(f"Cannot load callback {spec}: {e}")
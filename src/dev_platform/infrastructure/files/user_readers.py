@@ -0,0 +1,66 @@
+#   src/infrastructure/files/user_readers.py
+import csv
+import json
+from pathlib import Path
+from typing import Iterator, Optional
+from application.user.dtos import ImportFailureDTO, UserCreateDTO, UserRowDTO
+from shared.exceptions import DomainException
+
+FORMATS = ("csv", "jsonl")
+_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+
+def detect_format(path: str) -> str:
+    fmt = _EXTENSIONS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise DomainException(
+            f"Cannot detect file format of {path}; use one of {', '.join(FORMATS)}"
+        )
+    return fmt
+
+
+def read_user_rows(path: str, fmt: Optional[str] = None) -> Iterator[UserRowDTO]:
+    #   Generators keep memory constant: one record is held at a time
+    fmt = fmt or detect_format(path)
+    if fmt == "csv":
+        return _read_csv(path)
+    if fmt == "jsonl":
+        return _read_jsonl(path)
+    raise DomainException(f"Unsupported format: {fmt}")
+
+
+def _read_csv(path: str) -> Iterator[UserRowDTO]:
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = {"name", "email"} - set(reader.fieldnames or ())
+        if missing:
+            raise DomainException(
+                f"CSV header is missing columns: {', '.join(sorted(missing))}"
+            )
+        for row in reader:
+            yield reader.line_num, UserCreateDTO(
+                name=(row["name"] or "").strip(), email=(row["email"] or "").strip()
+            )
+
+
+def _read_jsonl(path: str) -> Iterator[UserRowDTO]:
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, ImportFailureDTO(
+                    line_number, None, f"Invalid JSON ({e.msg})"
+                )
+                continue
+            if not isinstance(record, dict):
+                yield line_number, ImportFailureDTO(
+                    line_number, None, "Expected a JSON object"
+                )
+                continue
+            yield line_number, UserCreateDTO(
+                name=str(record.get("name") or "").strip(),
+                email=str(record.get("email") or "").strip(),
+            )
@@ -0,0 +1,137 @@
+#   src/infrastructure/files/user_writers.py
+import bz2
+import csv
+import gzip
+import io
+import json
+import lzma
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional
+from domain.user.batch import UserBatch
+from shared.exceptions import DomainException
+
+FORMATS = ("csv", "jsonl", "parquet")
+COMPRESSIONS = ("none", "gzip", "bz2", "xz", "snappy", "zstd")
+_TEXT_OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+_PARQUET_CODECS = ("none", "gzip", "snappy", "zstd")
+_EXTENSIONS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+}
+_COMPRESSED_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+COLUMNS = ("id", "name", "email")
+
+
+def detect_format(path: str) -> Optional[str]:
+    suffixes = [s.lower() for s in Path(path).suffixes]
+    if suffixes and suffixes[-1] in _COMPRESSED_SUFFIXES:
+        suffixes = suffixes[:-1]
+    return _EXTENSIONS.get(suffixes[-1]) if suffixes else None
+
+
+def detect_compression(path: str) -> str:
+    return _COMPRESSED_SUFFIXES.get(Path(path).suffix.lower(), "none")
+
+
+def write_users(
+    batches: Iterable[UserBatch],
+    path: str,
+    fmt: Optional[str] = None,
+    compression: Optional[str] = None,
+) -> int:
+    #   Writes whole batches at a time; returns the number of users written.
+    #   path "-" writes uncompressed CSV/JSON Lines to stdout.
+    fmt = fmt or detect_format(path)
+    if fmt is None:
+        raise DomainException(
+            f"Cannot detect file format of {path}; use one of {', '.join(FORMATS)}"
+        )
+    compression = compression or (
+        detect_compression(path) if fmt != "parquet" else "snappy"
+    )
+    if fmt == "parquet":
+        if compression not in _PARQUET_CODECS:
+            raise DomainException(
+                f"Parquet supports {', '.join(_PARQUET_CODECS)} compression"
+            )
+        return _write_parquet(batches, path, compression)
+    if compression not in ("none", *_TEXT_OPENERS):
+        raise DomainException(
+            f"{fmt} supports none, {', '.join(_TEXT_OPENERS)} compression"
+        )
+    with _open_text(path, compression) as f:
+        if fmt == "csv":
+            return _write_csv(batches, f)
+        if fmt == "jsonl":
+            return _write_jsonl(batches, f)
+    raise DomainException(f"Unsupported format: {fmt}")
+
+
+@contextmanager
+def _open_text(path: str, compression: str) -> Iterator[IO[str]]:
+    if path == "-":
+        if compression != "none":
+            raise DomainException("Compressed output needs a file path")
+        yield sys.stdout
+        return
+    opener = _TEXT_OPENERS.get(compression)
+    if opener is None:
+        f = open(path, "w", newline="", encoding="utf-8", buffering=1024 * 1024)
+    else:
+        f = opener(path, "wt", newline="", encoding="utf-8")
+    with f:
+        yield f
+
+
+def _write_csv(batches: Iterable[UserBatch], f: IO[str]) -> int:
+    writer = csv.writer(f)
+    writer.writerow(COLUMNS)
+    written = 0
+    for batch in batches:
+        writer.writerows(batch.rows())
+        written += len(batch)
+    return written
+
+
+def _write_jsonl(batches: Iterable[UserBatch], f: IO[str]) -> int:
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    written = 0
+    for batch in batches:
+        buffer = io.StringIO()
+        for user_id, name, email in batch.rows():
+            buffer.write(encode({"id": user_id, "name": name, "email": email}))
+            buffer.write("\n")
+        f.write(buffer.getvalue())  #   One write per batch
+        written += len(batch)
+    return written
+
+
+def _write_parquet(batches: Iterable[UserBatch], path: str, compression: str) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise DomainException(
+            "Parquet export needs pyarrow: pip install dev-platform[parquet]"
+        )
+    if path == "-":
+        raise DomainException("Parquet output needs a file path")
+    schema = pa.schema(
+        [("id", pa.int64()), ("name", pa.string()), ("email", pa.string())]
+    )
+    written = 0
+    #   Each batch becomes one row group; its columns map directly onto UserBatch's
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for batch in batches:
+            writer.write_table(
+                pa.table(
+                    [pa.array(batch.ids, pa.int64()), batch.names, batch.emails],
+                    schema=schema,
+                )
+            )
+            written += len(batch)
+    return written
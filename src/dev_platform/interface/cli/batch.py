@@ -0,0 +1,205 @@
+#   src/interface/cli/batch.py
+#   JSON Lines protocol of the `serve` command. Each request is one JSON object
+#   per line, e.g. {"cmd": "create", "name": "...", "email": "...", "ref": 7}, and
+#   gets one or more JSON lines back; "ref" is echoed so callers can pipeline.
+#   Every command runs in its own unit of work on the process-wide engine.
+#   "access" marks a user as active through the server's AccessTracker, which
+#   writes the timestamps behind and flushes what is left when the server stops.
+import json
+import os
+import signal
+import socketserver
+import stat
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+from application.user.dtos import UserCreateDTO
+from application.user.usecases import (
+    CreateUserUseCase,
+    FindUserUseCase,
+    ListUsersUseCase,
+    RecordAccessUseCase,
+)
+from domain.unit_of_work import UnitOfWork
+from domain.user.entities import User
+from domain.user.interfaces import AccessRecorder
+from shared.exceptions import DatabaseException, DomainException
+
+COMMANDS = ("access", "create", "list", "lookup")
+
+
+def _user(user: User) -> Dict[str, Any]:
+    return {"id": user.id, "name": user.name, "email": user.email}
+
+
+def _error(kind: str, message: str) -> Dict[str, Any]:
+    return {"ok": False, "error": kind, "message": message}
+
+
+class _RequestError(Exception):
+    pass
+
+
+#   Arguments are checked here, with their JSON types, so that a malformed
+#   request is reported as such and never reaches the database layer
+def _str_field(
+    request: Dict[str, Any], name: str, required: bool = True
+) -> Optional[str]:
+    value = request.get(name)
+    if value is None:
+        if required:
+            raise _RequestError(f"Missing field '{name}' for {request['cmd']}")
+        return None
+    if not isinstance(value, str):
+        raise _RequestError(f"Field '{name}' must be a string")
+    return value
+
+
+def _int_field(
+    request: Dict[str, Any], name: str, default: Optional[int] = None
+) -> Optional[int]:
+    value = request.get(name, default)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise _RequestError(f"Field '{name}' must be an integer")
+    return value
+
+
+class BatchHandler:
+    def __init__(
+        self,
+        uow_factory: Callable[..., UnitOfWork],
+        access_recorder: Optional[AccessRecorder] = None,
+    ):
+        #   uow_factory(read_only=True) may route reads to a replica
+        self.uow_factory = uow_factory
+        self.access_recorder = access_recorder
+        self._commands = {
+            "access": self._access,
+            "create": self._create,
+            "list": self._list,
+            "lookup": self._lookup,
+        }
+
+    def handle_line(self, line: str) -> Iterator[Dict[str, Any]]:
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            yield _error("request", f"Invalid JSON: {e}")
+            return
+        if not isinstance(request, dict):
+            yield _error("request", "Each line must be a JSON object")
+            return
+        ref = request.get("ref")
+        for response in self._dispatch(request):
+            if ref is not None:
+                response["ref"] = ref
+            yield response
+
+    def _dispatch(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        name = request.get("cmd")
+        command = self._commands.get(name) if isinstance(name, str) else None
+        if command is None:
+            yield _error(
+                "request", f"Unknown cmd {name!r}; use one of {', '.join(COMMANDS)}"
+            )
+            return
+        try:
+            yield from command(request)
+        except _RequestError as e:
+            yield _error("request", str(e))
+        except ValueError as e:
+            yield _error("request", f"Bad arguments for {name}: {e}")
+        except DomainException as e:
+            yield _error("domain", str(e))
+        except DatabaseException as e:
+            yield _error("database", str(e))
+
+    def _create(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        dto = UserCreateDTO(
+            name=_str_field(request, "name"), email=_str_field(request, "email")
+        )
+        user = self.uow_factory().run(
+            lambda uow: CreateUserUseCase(uow.users, uow.outbox).execute(dto)
+        )
+        yield {"ok": True, "user": _user(user)}
+
+    def _lookup(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        user_id, email = _int_field(request, "id"), _str_field(
+            request, "email", required=False
+        )
+        with self.uow_factory(read_only=True) as uow:
+            user = FindUserUseCase(uow.users).execute(user_id=user_id, email=email)
+        yield {"ok": True, "user": None if user is None else _user(user)}
+
+    def _access(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        user_id, email = _int_field(request, "id"), _str_field(
+            request, "email", required=False
+        )
+        if self.access_recorder is None:
+            raise DomainException("Access tracking is not enabled on this server")
+        with self.uow_factory(read_only=True) as uow:
+            user = RecordAccessUseCase(uow.users, self.access_recorder).execute(
+                user_id=user_id, email=email
+            )
+        yield {"ok": True, "user": None if user is None else _user(user)}
+
+    def _list(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        #   Streamed: one line per user, then a summary line
+        after_id, limit = _int_field(request, "after_id"), _int_field(request, "limit")
+        page_size = _int_field(request, "page_size", 1000)
+        count = 0
+        with self.uow_factory(read_only=True) as uow:
+            users = ListUsersUseCase(uow.users).stream(
+                after_id=after_id, limit=limit, page_size=page_size
+            )
+            for user in users:
+                count += 1
+                yield {"ok": True, "user": _user(user)}
+        yield {"ok": True, "done": True, "count": count}
+
+
+def serve_lines(
+    handler: BatchHandler,
+    lines: Iterable[str],
+    write: Callable[[str], None],
+    flush: Callable[[], None] = lambda: None,
+) -> None:
+    for line in lines:
+        if not line.strip():
+            continue
+        for response in handler.handle_line(line):
+            write(json.dumps(response) + "\n")
+        flush()  #   The caller may be waiting on this answer before sending more
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        serve_lines(
+            self.server.batch_handler,
+            (raw.decode("utf-8") for raw in self.rfile),
+            lambda text: self.wfile.write(text.encode("utf-8")),
+            self.wfile.flush,
+        )
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True  #   Open client connections do not block shutdown
+
+
+def serve_socket(handler: BatchHandler, path: str) -> None:
+    #   One thread per connection; the session pool is shared between them
+    if os.path.exists(path):
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            raise DomainException(f"{path} exists and is not a socket")
+        os.unlink(path)  #   Left behind by a previous server
+    server = _UnixServer(path, _ConnectionHandler)
+    server.batch_handler = handler
+    #   Clean up the socket on kill too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        os.chmod(path, 0o600)  #   Local automation only
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.unlink(path)
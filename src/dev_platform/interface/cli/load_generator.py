@@ -0,0 +1,136 @@
+#   src/interface/cli/load_generator.py
+#   Synthetic write load for the `load-test` command: every worker drives
+#   CreateUserUseCase through its own units of work, so the numbers include the
+#   duplicate check, the insert, the commit and any lock retries.
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from application.user.dtos import UserCreateDTO
+from application.user.usecases import CreateUserUseCase
+from infrastructure.database.repositories import DUPLICATE_EMAIL
+from infrastructure.database.session import get_engine
+from infrastructure.database.unit_of_work import SQLUnitOfWork
+from shared.exceptions import (
+    DatabaseException,
+    DomainException,
+    TransientDatabaseException,
+)
+
+MODES = ("thread", "process")
+
+
+@dataclass
+class LoadTestReport:
+    mode: str
+    workers: int
+    elapsed_seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list)  #   Seconds per create, sorted
+    outcomes: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def percentile(self, p: float) -> float:
+        #   Nearest-rank percentile
+        if not self.latencies:
+            return 0.0
+        return self.latencies[max(math.ceil(p / 100 * len(self.latencies)) - 1, 0)]
+
+    def summary(self) -> str:
+        outcomes = ", ".join(
+            f"{name}={count}" for name, count in sorted(self.outcomes.items())
+        )
+        return "\n".join(
+            [
+                f"{self.requests} requests with {self.workers} {self.mode} workers in {self.elapsed_seconds:.2f}s: "
+                f"{self.throughput:.1f} requests/s",
+                f"Latency ms: p50 {self.percentile(50) * 1000:.1f}  p95 {self.percentile(95) * 1000:.1f}  "
+                f"p99 {self.percentile(99) * 1000:.1f}  max {self.percentile(100) * 1000:.1f}",
+                f"Outcomes: {outcomes}",
+            ]
+        )
+
+
+def synthetic_users(
+    count: int, duplicate_rate: float = 0.0, seed: Optional[int] = None
+) -> List[Tuple[str, str]]:
+    #   Emails are unique per run. With duplicate_rate > 0 some users reuse the
+    #   previous email, which lands on another worker and provokes a real race.
+    rng = random.Random(seed)
+    run = uuid.uuid4().hex[:8]
+    users = []
+    for i in range(count):
+        if users and rng.random() < duplicate_rate:
+            email = users[-1][1]
+        else:
+            email = f"load-{run}-{i}@example.test"
+        users.append((f"Load User {i}", email))
+    return users
+
+
+def _create_users(
+    users: List[Tuple[str, str]]
+) -> Tuple[float, float, List[float], Dict[str, int]]:
+    with get_engine().connect():  #   Connect before the clock starts
+        pass
+    latencies, outcomes = [], Counter()
+    started = time.time()  #   Wall clock: comparable across processes
+    for name, email in users:
+        dto = UserCreateDTO(name=name, email=email)
+        t0 = time.perf_counter()
+        try:
+            SQLUnitOfWork().run(
+                lambda uow: CreateUserUseCase(uow.users, uow.outbox).execute(dto)
+            )
+            outcomes["created"] += 1
+        except DomainException as e:
+            outcomes["duplicate" if str(e) == DUPLICATE_EMAIL else "rejected"] += 1
+        except TransientDatabaseException:
+            outcomes["lock_timeout"] += 1  #   Still conflicting after every retry
+        except DatabaseException:
+            outcomes["database_error"] += 1
+        latencies.append(time.perf_counter() - t0)
+    return started, time.time(), latencies, dict(outcomes)
+
+
+def _reset_engine() -> None:
+    #   A forked worker must not reuse the parent's pooled connections
+    get_engine().dispose(close=False)
+
+
+def run_load_test(
+    users: List[Tuple[str, str]], workers: int = 8, mode: str = "thread"
+) -> LoadTestReport:
+    if mode not in MODES:
+        raise DomainException(f"mode must be one of {', '.join(MODES)}")
+    if workers < 1:
+        raise DomainException("workers must be at least 1")
+    #   Round-robin slices put neighbouring users (and duplicated emails) on different workers
+    slices = [users[i::workers] for i in range(workers) if users[i::workers]]
+    if mode == "thread":
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_reset_engine)
+    report = LoadTestReport(mode=mode, workers=workers)
+    outcomes = Counter()
+    starts, ends = [], []
+    with executor:
+        for started, ended, latencies, counts in executor.map(_create_users, slices):
+            starts.append(started)
+            ends.append(ended)
+            report.latencies.extend(latencies)
+            outcomes.update(counts)
+    report.latencies.sort()
+    report.outcomes = dict(outcomes)
+    report.elapsed_seconds = max(ends) - min(starts) if starts else 0.0
+    return report
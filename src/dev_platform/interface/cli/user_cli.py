@@ -1,43 +1,551 @@
 #   src/interface/cli/user_cli.py  (formerly user_cli.py, renamed for clarity)
+#   Only light modules are imported here; SQLAlchemy and the layers built on it
+#   are imported inside the commands so that `--help` starts instantly.
 import click
-from application.user.usecases import CreateUserUseCase, ListUsersUseCase
-from application.user.dtos import UserCreateDTO
-from infrastructure.database.repositories import SQLUserRepository
-from infrastructure.database.session import get_db_session
-from shared.exceptions import DomainException, DatabaseException
+from shared.exceptions import DeliveryException, DomainException, DatabaseException
+
+IMPORT_FORMATS = ("csv", "jsonl")
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+EXPORT_COMPRESSIONS = ("none", "gzip", "bz2", "xz", "snappy", "zstd")
+
 
 @click.group()
-def cli():
-    pass
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print query and use case timings when the command exits",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Also write the profile to this file (.json, otherwise Prometheus text format)",
+)
+@click.pass_context
+def cli(ctx: click.Context, profile: bool, profile_output: str):
+    if not (profile or profile_output):
+        return
+    from shared.profiling import enable_profiling
+
+    profiler = enable_profiling()
+
+    def report():
+        if profile:
+            click.echo(profiler.summary(), err=True)
+            from infrastructure.cache.user_cache import user_cache_stats
+
+            cache = user_cache_stats()
+            if cache is not None:
+                click.echo(
+                    f"User cache: {cache.hits} hits, {cache.misses} misses ({cache.hit_ratio:.0%}), "
+                    f"{cache.size} entries",
+                    err=True,
+                )
+        if profile_output:
+            profiler.write(profile_output)
+
+    ctx.call_on_close(report)
+
 
 @cli.command()
-@click.option('--name', prompt='User name', help='Name of the user')
-@click.option('--email', prompt='User email', help='Email of the user')
+@click.option("--name", prompt="User name", help="Name of the user")
+@click.option("--email", prompt="User email", help="Email of the user")
 def create_user(name: str, email: str):
-    db_session = next(get_db_session())  #   Get the session
-    repository = SQLUserRepository(db_session)
-    use_case = CreateUserUseCase(repository)
+    from application.user.dtos import UserCreateDTO
+    from application.user.usecases import CreateUserUseCase
+    from infrastructure.database.unit_of_work import SQLUnitOfWork
+
     user_create_dto = UserCreateDTO(name=name, email=email)  #   Create DTO
     try:
-        user = use_case.execute(user_create_dto)
+        user = SQLUnitOfWork().run(
+            lambda uow: CreateUserUseCase(uow.users, uow.outbox).execute(
+                user_create_dto
+            )
+        )
         click.echo(f"User created: {user.name} ({user.email})")
     except DomainException as e:
         click.echo(f"Domain Error: {e}")
     except DatabaseException as e:
         click.echo(f"Database Error: {e}")
-    finally:
-        db_session.close()
+
+
+@cli.command()
+@click.option(
+    "--limit", type=click.IntRange(min=0), help="Maximum number of users to print"
+)
+@click.option(
+    "--after-id", type=int, help="Only users with an id greater than this one"
+)
+@click.option(
+    "--page-size",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Users fetched per query",
+)
+def list_users(limit: int, after_id: int, page_size: int):
+    from application.user.usecases import ListUsersUseCase
+    from infrastructure.database.unit_of_work import SQLUnitOfWork
+
+    try:
+        with SQLUnitOfWork(read_only=True) as uow:
+            for user in ListUsersUseCase(uow.users).stream(
+                after_id=after_id, limit=limit, page_size=page_size
+            ):
+                click.echo(f"ID: {user.id}, Name: {user.name}, Email: {user.email}")
+    except DatabaseException as e:
+        click.echo(f"Database Error: {e}")
+
 
 @cli.command()
-def list_users():
-    db_session = next(get_db_session())
-    repository = SQLUserRepository(db_session)
-    use_case = ListUsersUseCase(repository)
+@click.argument("query")
+@click.option(
+    "--page",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Page of results to print",
+)
+@click.option(
+    "--page-size",
+    default=20,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Results per page",
+)
+def search_users(query: str, page: int, page_size: int):
+    from application.user.usecases import SearchUsersUseCase
+    from infrastructure.database.unit_of_work import SQLUnitOfWork
+
     try:
-        users = use_case.execute()
+        with SQLUnitOfWork(read_only=True) as uow:
+            users = SearchUsersUseCase(uow.users).execute(
+                query, page=page, page_size=page_size
+            )
         for user in users:
             click.echo(f"ID: {user.id}, Name: {user.name}, Email: {user.email}")
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
+    except DatabaseException as e:
+        click.echo(f"Database Error: {e}")
+
+
+@cli.command()
+@click.argument("path", type=click.Path(dir_okay=False, allow_dash=True))
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(EXPORT_FORMATS),
+    help="Output format (detected from the extension by default)",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(EXPORT_COMPRESSIONS),
+    help="gzip/bz2/xz for csv and jsonl (detected from .gz/.bz2/.xz), snappy/gzip/zstd for parquet",
+)
+@click.option(
+    "--batch-size",
+    default=10000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Rows fetched and written per batch",
+)
+def export_users(path: str, fmt: str, compression: str, batch_size: int):
+    from application.user.usecases import ExportUsersUseCase
+    from infrastructure.database.unit_of_work import SQLUnitOfWork
+    from infrastructure.files.user_writers import write_users
+
+    try:
+        with SQLUnitOfWork(read_only=True) as uow:
+            written = write_users(
+                ExportUsersUseCase(uow.users).execute(batch_size=batch_size),
+                path,
+                fmt,
+                compression,
+            )
+        if path != "-":
+            click.echo(f"Exported {written} users to {path}")
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
+    except DatabaseException as e:
+        click.echo(f"Database Error: {e}")
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Listen on this Unix socket instead of reading commands from stdin",
+)
+def serve(socket_path: str):
+    from contextlib import nullcontext
+    from infrastructure.config import get_settings
+    from infrastructure.database.access_tracker import access_tracker
+    from infrastructure.database.session import get_engine, get_sessionmaker
+    from infrastructure.database.unit_of_work import SQLUnitOfWork
+    from interface.cli.batch import BatchHandler, serve_lines, serve_socket
+
+    try:
+        with get_engine().connect():  #   Warm the pool before the first command
+            pass
+        #   The tracker writes by primary-database id, so it is off with shards.
+        #   Leaving the block (end of input, Ctrl-C, SIGTERM) flushes it.
+        tracker = (
+            nullcontext()
+            if get_settings().shard_urls
+            else access_tracker(get_sessionmaker())
+        )
+        with tracker as recorder:
+            handler = BatchHandler(SQLUnitOfWork, recorder)
+            if socket_path:
+                click.echo(f"Listening on {socket_path}", err=True)
+                serve_socket(handler, socket_path)
+            else:
+                stdout = click.get_text_stream("stdout")
+                serve_lines(
+                    handler, click.get_text_stream("stdin"), stdout.write, stdout.flush
+                )
+    except KeyboardInterrupt:
+        pass
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
+    except DatabaseException as e:
+        click.echo(f"Database Error: {e}")
+
+
+@cli.command()
+@click.option(
+    "--users",
+    "count",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Synthetic users to create",
+)
+@click.option(
+    "--workers",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Concurrent writers",
+)
+@click.option(
+    "--mode",
+    default="thread",
+    show_default=True,
+    type=click.Choice(("thread", "process")),
+    help="Run the writers as threads or as separate processes",
+)
+@click.option(
+    "--duplicate-rate",
+    default=0.0,
+    show_default=True,
+    type=click.FloatRange(0, 1),
+    help="Share of users reusing an email, to exercise unique-email races",
+)
+@click.option("--seed", type=int, help="Seed for the duplicate choice")
+def load_test(count: int, workers: int, mode: str, duplicate_rate: float, seed: int):
+    from interface.cli.load_generator import run_load_test, synthetic_users
+
+    try:
+        report = run_load_test(
+            synthetic_users(count, duplicate_rate, seed), workers=workers, mode=mode
+        )
+        click.echo(report.summary())
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
+    except DatabaseException as e:
+        click.echo(f"Database Error: {e}")
+
+
+@cli.command()
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(IMPORT_FORMATS),
+    help="File format (detected from the extension by default)",
+)
+@click.option(
+    "--batch-size",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Users inserted per statement",
+)
+def import_users(path: str, fmt: str, batch_size: int):
+    from application.user.usecases import ImportUsersUseCase
+    from infrastructure.database.unit_of_work import SQLUnitOfWork
+    from infrastructure.files.user_readers import read_user_rows
+
+    try:
+        with SQLUnitOfWork() as uow:
+            use_case = ImportUsersUseCase(uow.users, uow.outbox)
+            report = use_case.execute(read_user_rows(path, fmt), batch_size=batch_size)
+            uow.commit()
+        for failure in report.failures:
+            click.echo(
+                f"Line {failure.line} ({failure.email}): {failure.reason}", err=True
+            )
+        click.echo(
+            f"Imported {report.imported} users, {len(report.failures)} rows failed"
+        )
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
+    except DatabaseException as e:
+        click.echo(f"Database Error: {e}")
+
+
+@cli.command()
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(IMPORT_FORMATS),
+    help="File format (detected from the extension by default)",
+)
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Processes checking the rows; only pays off for large files on several cores",
+)
+def validate_users(path: str, fmt: str, workers: int):
+    from application.user.usecases import ValidateUsersUseCase
+    from infrastructure.files.user_readers import read_user_rows
+
+    try:
+        report = ValidateUsersUseCase().execute(
+            read_user_rows(path, fmt), workers=workers
+        )
+        for failure in report.failures:
+            click.echo(
+                f"Line {failure.line} ({failure.email}): {failure.reason}", err=True
+            )
+        click.echo(
+            f"Checked {report.checked} users, {len(report.failures)} rows invalid"
+        )
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
+
+
+@cli.command()
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, allow_dash=True),
+    help="Append events as JSON Lines to this file (- for stdout)",
+)
+@click.option("--callback", help="Deliver each event to this module:function instead")
+@click.option(
+    "--batch-size",
+    default=500,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Events delivered per transaction",
+)
+@click.option(
+    "--poll-interval",
+    default=1.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Seconds between polls of an empty outbox",
+)
+@click.option("--once", is_flag=True, help="Exit once the outbox is empty")
+def relay_events(
+    output: str, callback: str, batch_size: int, poll_interval: float, once: bool
+):
+    from infrastructure.database.outbox import OutboxRelay
+    from infrastructure.database.session import get_sessionmaker
+    from infrastructure.events.sinks import CallbackSink, FileSink, load_callback
+
+    def progress(relayed: int):
+        click.echo(f"Relayed {relayed} events", err=True)
+
+    try:
+        if bool(output) == bool(callback):
+            raise DomainException("Give either --output or --callback")
+        sink = FileSink(output) if output else CallbackSink(load_callback(callback))
+        relay = OutboxRelay(get_sessionmaker(), sink, batch_size=batch_size)
+        if once:
+            progress(relay.drain())
+        else:
+            #   Logs sink failures and retries
+            relay.run(poll_interval, on_batch=progress)
+    except KeyboardInterrupt:
+        pass
+    except DeliveryException as e:
+        click.echo(f"Delivery Error: {e}")  #   --once: the batch stays in the outbox
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
+    except DatabaseException as e:
+        click.echo(f"Database Error: {e}")
+
+
+@cli.command()
+@click.option(
+    "--add",
+    "added",
+    multiple=True,
+    required=True,
+    help="URL of a new, migrated and empty shard (repeatable); appended after DATABASE_SHARD_URLS",
+)
+@click.option(
+    "--chunk-size",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Users read per transaction",
+)
+@click.option(
+    "--id-map",
+    type=click.Path(dir_okay=False, writable=True),
+    help='Write "old_id,new_id" for every moved user',
+)
+def reshard_users(added: tuple, chunk_size: int, id_map: str):
+    import csv
+    from infrastructure.config import get_settings
+    from infrastructure.database.session import build_engine
+    from infrastructure.database.sharding import reshard
+
+    def progress(shard, report):
+        click.echo(
+            f"Shard {shard}: scanned {report.scanned}, moved {report.moved}", err=True
+        )
+
+    map_file = None
+    try:
+        current = get_settings().shard_urls
+        if not current:
+            raise DomainException("DATABASE_SHARD_URLS is not set")
+        urls = current + added
+        if len(set(urls)) != len(urls):
+            raise DomainException("Each shard URL may appear only once")
+        map_file = open(id_map, "w", newline="") if id_map else None
+        on_move = csv.writer(map_file).writerow if map_file else None
+        report = reshard(
+            [build_engine(url) for url in urls],
+            len(current),
+            chunk_size=chunk_size,
+            on_progress=progress,
+            on_move=(lambda old, new: on_move((old, new))) if on_move else None,
+        )
+        click.echo(
+            f"Moved {report.moved} of {report.scanned} users ({report.retried} copied again after "
+            f"changing). User writes are refused until DATABASE_SHARD_URLS={','.join(urls)}"
+        )
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
     except DatabaseException as e:
         click.echo(f"Database Error: {e}")
     finally:
-        db_session.close()
\ No newline at end of file
+        if map_file:
+            map_file.close()
+
+
+@cli.command()
+@click.option(
+    "--days",
+    required=True,
+    type=click.IntRange(min=0),
+    help="Deactivate users whose last access is older than this",
+)
+@click.option(
+    "--chunk-size",
+    default=10000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Ids updated per transaction",
+)
+@click.option(
+    "--start-id",
+    type=int,
+    help='Resume from this id (the "next id" printed by an interrupted run)',
+)
+@click.option(
+    "--dry-run", is_flag=True, help="Only count the users that would be deactivated"
+)
+def deactivate_inactive(days: int, chunk_size: int, start_id: int, dry_run: bool):
+    from application.user.usecases import DeactivateInactiveUsersUseCase
+    from infrastructure.database.unit_of_work import SQLUnitOfWork
+
+    def progress(report):
+        click.echo(
+            f"Processed ids up to {report.last_id}: {report.matched} deactivated "
+            f"(next id {report.next_id})",
+            err=True,
+        )
+
+    try:
+        with SQLUnitOfWork() as uow:
+            report = DeactivateInactiveUsersUseCase(uow).execute(
+                days,
+                chunk_size=chunk_size,
+                start_id=start_id,
+                dry_run=dry_run,
+                on_progress=progress,
+            )
+        if dry_run:
+            click.echo(
+                f"{report.matched} users inactive since {report.cutoff:%Y-%m-%d %H:%M} would be deactivated"
+            )
+        else:
+            click.echo(
+                f"Deactivated {report.matched} users inactive since {report.cutoff:%Y-%m-%d %H:%M}"
+            )
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
+    except DatabaseException as e:
+        click.echo(f"Database Error: {e}")
+
+
+@cli.command()
+@click.option(
+    "--top",
+    default=10,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Largest projects to list",
+)
+def stats(top: int):
+    from application.stats.usecases import GetStatsUseCase
+    from infrastructure.database.unit_of_work import SQLUnitOfWork
+
+    try:
+        with SQLUnitOfWork(read_only=True) as uow:
+            report = GetStatsUseCase(uow.stats).execute(top_projects=top)
+        click.echo(
+            f"Users: {report.active_users} active, {report.inactive_users} inactive"
+        )
+        click.echo("Active users by days since last access:")
+        for bucket in report.inactivity:
+            days = (
+                f"{bucket.min_days}+"
+                if bucket.max_days is None
+                else f"{bucket.min_days}-{bucket.max_days}"
+            )
+            click.echo(f"  {days} days: {bucket.users}")
+        click.echo(f"  never: {report.never_accessed}")
+        click.echo(f"Projects: {report.projects}, memberships: {report.memberships}")
+        for project in report.largest_projects:
+            click.echo(
+                f"  ID: {project.id}, Name: {project.nome}, Members: {project.members}"
+            )
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
+    except DatabaseException as e:
+        click.echo(f"Database Error: {e}")
+
+
+@cli.command()
+def rebuild_stats():
+    from application.stats.usecases import RebuildStatsUseCase
+    from infrastructure.database.unit_of_work import SQLUnitOfWork
+
+    try:
+        SQLUnitOfWork().run(lambda uow: RebuildStatsUseCase(uow.stats).execute())
+        click.echo("Stats rebuilt")
+    except DomainException as e:
+        click.echo(f"Domain Error: {e}")
+    except DatabaseException as e:
+        click.echo(f"Database Error: {e}")
@@ -1,5 +1,8 @@
 #   src/main.py
 from interface.cli.user_cli import cli  #   Corrected import
 
+def main():
+    cli()
+
 if __name__ == "__main__":
-    cli()
\ No newline at end of file
+    main()
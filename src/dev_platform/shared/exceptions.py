@@ -7,6 +7,14 @@ class DatabaseException(Exception):
     """Exception for database-related errors."""
     pass
 
+class TransientDatabaseException(DatabaseException):
+    """Lock or serialization conflict; retrying the transaction may succeed."""
+    pass
+
+class DeliveryException(Exception):
+    """An event sink did not accept a batch; the events stay in the outbox."""
+    pass
+
 class DomainError(Exception):
     """Exception for database-related errors (DomainError)."""
     pass
\ No newline at end of file
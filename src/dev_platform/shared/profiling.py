@@ -0,0 +1,252 @@
+#   src/shared/profiling.py
+import functools
+import inspect
+import json
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+STATEMENT_KEY_LENGTH = 200  #   Statements are grouped by their first characters
+
+
+@dataclass
+class TimingStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    rows: int = 0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class Profiler:
+    #   Collects query and use-case timings; safe to share between threads
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.queries: Dict[str, TimingStats] = {}
+        self.usecases: Dict[str, TimingStats] = {}
+        self._lock = threading.Lock()
+
+    def record_query(self, statement: str, seconds: float, rows: int = 0) -> None:
+        key = statement_key(statement)
+        with self._lock:
+            stats = self.queries.setdefault(key, TimingStats())
+            stats.add(seconds)
+            stats.rows += max(rows, 0)
+
+    def record_rows(self, statement: str, rows: int) -> None:
+        key = statement_key(statement)
+        with self._lock:
+            self.queries.setdefault(key, TimingStats()).rows += rows
+
+    def record_usecase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.usecases.setdefault(name, TimingStats()).add(seconds)
+
+    def totals(self) -> Dict[str, float]:
+        with self._lock:
+            db = sum(s.total_seconds for s in self.queries.values())
+            usecases = sum(s.total_seconds for s in self.usecases.values())
+            return {
+                "wall_seconds": time.perf_counter() - self.started_at,
+                "query_count": sum(s.count for s in self.queries.values()),
+                "rows": sum(s.rows for s in self.queries.values()),
+                "db_seconds": db,
+                "usecase_seconds": usecases,
+                #   Time inside use cases not spent waiting on the database: ORM and our own code
+                "non_db_usecase_seconds": max(usecases - db, 0.0),
+            }
+
+    def summary(self, top: int = 10) -> str:
+        totals = self.totals()
+        lines = [
+            f"Wall time: {totals['wall_seconds'] * 1000:.1f} ms",
+            f"Use cases: {totals['usecase_seconds'] * 1000:.1f} ms "
+            f"(database {totals['db_seconds'] * 1000:.1f} ms, ORM/application {totals['non_db_usecase_seconds'] * 1000:.1f} ms)",
+            f"Queries: {totals['query_count']}, rows: {totals['rows']}",
+        ]
+        with self._lock:
+            usecases = sorted(
+                self.usecases.items(), key=lambda item: -item[1].total_seconds
+            )
+            queries = sorted(
+                self.queries.items(), key=lambda item: -item[1].total_seconds
+            )[:top]
+        for name, stats in usecases:
+            lines.append(
+                f"  {name}: {stats.count} calls, {stats.total_seconds * 1000:.1f} ms total, "
+                f"{stats.max_seconds * 1000:.1f} ms max"
+            )
+        if queries:
+            lines.append(f"Top {len(queries)} statements by total time:")
+        for statement, stats in queries:
+            lines.append(
+                f"  {stats.total_seconds * 1000:8.1f} ms  {stats.count:6d}x  {stats.rows:8d} rows  {statement}"
+            )
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        with self._lock:
+            queries = [dict(statement=k, **asdict(v)) for k, v in self.queries.items()]
+            usecases = [dict(usecase=k, **asdict(v)) for k, v in self.usecases.items()]
+        return json.dumps(
+            {"totals": self.totals(), "usecases": usecases, "queries": queries},
+            indent=2,
+        )
+
+    def to_prometheus(self) -> str:
+        #   Prometheus text exposition format, suitable for the node_exporter textfile collector
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str, samples: List[str]) -> None:
+            lines.extend(
+                [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *samples]
+            )
+
+        with self._lock:
+            queries = list(self.queries.items())
+            usecases = list(self.usecases.items())
+        family(
+            "dev_platform_query_seconds",
+            "summary",
+            "Time spent executing SQL statements.",
+            [
+                f'dev_platform_query_seconds_{suffix}{{statement="{_label(k)}"}} {value}'
+                for k, v in queries
+                for suffix, value in (("sum", v.total_seconds), ("count", v.count))
+            ],
+        )
+        family(
+            "dev_platform_query_rows_total",
+            "counter",
+            "Rows returned or affected by SQL statements.",
+            [
+                f'dev_platform_query_rows_total{{statement="{_label(k)}"}} {v.rows}'
+                for k, v in queries
+            ],
+        )
+        family(
+            "dev_platform_usecase_seconds",
+            "summary",
+            "Time spent in use case calls.",
+            [
+                f'dev_platform_usecase_seconds_{suffix}{{usecase="{_label(k)}"}} {value}'
+                for k, v in usecases
+                for suffix, value in (("sum", v.total_seconds), ("count", v.count))
+            ],
+        )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        #   Format follows the extension: .json, anything else is Prometheus text
+        content = self.to_json() if path.endswith(".json") else self.to_prometheus()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def statement_key(statement: str) -> str:
+    return re.sub(r"\s+", " ", statement).strip()[:STATEMENT_KEY_LENGTH]
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+_profiler: Optional[Profiler] = None
+
+
+def enable_profiling() -> Profiler:
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
+
+
+def disable_profiling() -> None:
+    global _profiler
+    _profiler = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    return _profiler
+
+
+def profiled(func: Callable) -> Callable:
+    #   Times a use case method under its qualified name when profiling is on;
+    #   otherwise the only cost is one global lookup per call.
+    name = func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            profiler = _profiler
+            if profiler is None:
+                return await func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                profiler.record_usecase(name, time.perf_counter() - started)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _profiler
+        if profiler is None:
+            return func(*args, **kwargs)
+        started = time.perf_counter()
+        value = func(*args, **kwargs)
+        if isinstance(value, Iterator):
+            return _timed_iterator(profiler, name, value, time.perf_counter() - started)
+        if isinstance(value, AsyncIterator):
+            return _timed_async_iterator(
+                profiler, name, value, time.perf_counter() - started
+            )
+        profiler.record_usecase(name, time.perf_counter() - started)
+        return value
+
+    return wrapper
+
+
+def _timed_iterator(
+    profiler: Profiler, name: str, iterator: Iterator, elapsed: float
+) -> Iterator:
+    #   Streaming use cases do their work while being consumed; time only that,
+    #   not the caller's processing between items.
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                elapsed += time.perf_counter() - started
+                return
+            elapsed += time.perf_counter() - started
+            yield item
+    finally:
+        profiler.record_usecase(name, elapsed)
+
+
+async def _timed_async_iterator(
+    profiler: Profiler, name: str, iterator: AsyncIterator, elapsed: float
+) -> AsyncIterator:
+    #   As _timed_iterator, for async streams (async generators included)
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                elapsed += time.perf_counter() - started
+                return
+            elapsed += time.perf_counter() - started
+            yield item
+    finally:
+        profiler.record_usecase(name, elapsed)
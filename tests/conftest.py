@@ -0,0 +1,60 @@
+#   tests/conftest.py
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src" / "dev_platform"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))  #   Same layout main.py runs with
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from infrastructure.database.session import build_engine  # noqa: E402
+
+
+def run_alembic(url: str, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "DATABASE_URL": url, "PYTHONPATH": str(SRC)}
+    return subprocess.run(
+        [sys.executable, "-m", "alembic", *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def alembic():
+    return run_alembic
+
+
+@pytest.fixture(scope="session")
+def migrated_template(tmp_path_factory) -> Path:
+    #   Migrated once per run (indexes and triggers are only created by the
+    #   migrations), then copied for every test that needs a database
+    path = tmp_path_factory.mktemp("schema") / "template.db"
+    run_alembic(f"sqlite:///{path}", "upgrade", "head").check_returncode()
+    return path
+
+
+@pytest.fixture
+def database_url(migrated_template, tmp_path) -> str:
+    path = tmp_path / "test.db"
+    shutil.copy(migrated_template, path)
+    return f"sqlite:///{path}"
+
+
+@pytest.fixture
+def engine(database_url):
+    engine = build_engine(database_url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine) -> sessionmaker:
+    return sessionmaker(bind=engine, autoflush=False)
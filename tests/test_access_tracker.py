@@ -0,0 +1,77 @@
+#   tests/test_access_tracker.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.database.access_tracker import AccessTracker
+from infrastructure.database.models import UserModel
+
+START = datetime(2024, 1, 1)
+
+
+def seed(session_factory, count):
+    with session_factory() as session:
+        session.execute(
+            insert(UserModel),
+            [{"name": f"User {i}", "email": f"u{i}@x.io"} for i in range(count)],
+        )
+        session.commit()
+
+
+@pytest.fixture
+def unreachable(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'x.db'}")
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def test_flush_only_moves_last_access_forward(session_factory):
+    seed(session_factory, 2)
+    tracker = AccessTracker(session_factory, batch_size=1)
+    tracker.record(1, START + timedelta(minutes=5))
+    tracker.record(1, START)  #   Older than the buffered access
+    tracker.record(2, START)
+    assert tracker.pending == 2
+    assert tracker.flush() == 2
+    tracker.record(2, START - timedelta(days=1))  #   Older than the stored one
+    tracker.close()
+    with session_factory() as session:
+        seen = session.scalars(select(UserModel.ultimo_acesso).order_by(UserModel.id))
+        assert seen.all() == [START + timedelta(minutes=5), START]
+    assert (tracker.stats.recorded, tracker.stats.flushes) == (4, 2)
+
+
+def test_full_buffer_flushes_on_the_callers_thread(session_factory):
+    seed(session_factory, 10)
+    tracker = AccessTracker(session_factory, max_pending=3).start()
+    try:
+        for i in range(1, 11):
+            tracker.record(i, START + timedelta(minutes=i))
+            assert tracker.pending <= 3
+    finally:
+        tracker.close()
+    with session_factory() as session:
+        seen = session.scalars(select(UserModel.ultimo_acesso).order_by(UserModel.id))
+        assert seen.all() == [START + timedelta(minutes=i) for i in range(1, 11)]
+    assert tracker.stats.dropped == 0
+
+
+def test_failed_flushes_drop_the_oldest_timestamps(unreachable, caplog):
+    tracker = AccessTracker(unreachable, max_pending=3)
+    for i in range(1, 8):
+        tracker.record(i, START + timedelta(minutes=i))
+        assert tracker.pending <= 3
+    assert tracker._pending == {i: START + timedelta(minutes=i) for i in (5, 6, 7)}
+    assert tracker.stats.dropped == 4 and tracker.stats.failed_flushes > 0
+    assert "dropped the 1 oldest" in caplog.text
+
+
+def test_repeated_users_do_not_overflow(unreachable):
+    tracker = AccessTracker(unreachable, max_pending=2)
+    tracker.record(1, START)
+    for minute in range(5):
+        tracker.record(2, START + timedelta(minutes=minute))
+    assert tracker._pending == {1: START, 2: START + timedelta(minutes=4)}
+    assert tracker.stats.dropped == 0
@@ -0,0 +1,124 @@
+#   tests/test_async_usecases.py
+#   Runs the asyncio use cases against aiosqlite; each test drives its own event
+#   loop with asyncio.run so no pytest plugin is needed.
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from application.user.async_usecases import (
+    AsyncCreateUserUseCase,
+    AsyncListUsersUseCase,
+)
+from application.user.dtos import UserCreateDTO
+from domain.user.entities import User
+from domain.user.events import UserCreated
+from infrastructure.database.async_repositories import SQLAsyncUserRepository
+from infrastructure.database.async_session import to_async_url
+from infrastructure.database.async_unit_of_work import SQLAsyncUnitOfWork
+from infrastructure.database.models import OutboxModel, UserModel
+from shared.exceptions import DomainException
+
+
+def run_with_factory(database_url, work):
+    async def main():
+        engine = create_async_engine(to_async_url(database_url))
+        factory = async_sessionmaker(
+            bind=engine, autoflush=False, expire_on_commit=False
+        )
+        try:
+            return await work(factory)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def run_with_repository(database_url, work):
+    async def with_repository(factory):
+        async with factory() as session:
+            return await work(SQLAsyncUserRepository(session))
+
+    return run_with_factory(database_url, with_repository)
+
+
+def test_create_and_list(database_url):
+    async def work(repo):
+        create = AsyncCreateUserUseCase(repo)
+        alice = await create.execute(
+            UserCreateDTO(name="Alice Smith", email="alice@x.io")
+        )
+        bob = await create.execute(UserCreateDTO(name="Bob Jones", email="bob@x.io"))
+        return alice, bob, await AsyncListUsersUseCase(repo).execute()
+
+    alice, bob, users = run_with_repository(database_url, work)
+    assert alice.id is not None and bob.id is not None
+    assert users == [alice, bob]
+
+
+def test_stream_pages_by_id(database_url):
+    async def work(repo):
+        create = AsyncCreateUserUseCase(repo)
+        for i in range(7):
+            await create.execute(UserCreateDTO(name=f"User {i}", email=f"u{i}@x.io"))
+        list_users = AsyncListUsersUseCase(repo)
+        everyone = [u async for u in list_users.stream(page_size=3)]
+        page = [
+            u
+            async for u in list_users.stream(
+                after_id=everyone[1].id, limit=3, page_size=2
+            )
+        ]
+        return everyone, page
+
+    everyone, page = run_with_repository(database_url, work)
+    assert [u.email for u in everyone] == [f"u{i}@x.io" for i in range(7)]
+    assert page == everyone[2:5]
+
+
+def test_duplicate_email_is_a_domain_error(database_url):
+    async def work(repo):
+        create = AsyncCreateUserUseCase(repo)
+        await create.execute(UserCreateDTO(name="Alice Smith", email="alice@x.io"))
+        with pytest.raises(DomainException, match="Email already registered"):
+            await create.execute(UserCreateDTO(name="Alice Again", email="ALICE@x.io"))
+        return await repo.exists_many(["Alice@X.IO", "nobody@x.io"])
+
+    assert run_with_repository(database_url, work) == {"Alice@X.IO"}
+
+
+def test_unique_constraint_race_is_a_domain_error(database_url):
+    #   Bypasses the pre-check, as a concurrent writer would
+    async def work(repo):
+        await repo.save(User(id=None, name="Alice Smith", email="alice@x.io"))
+        with pytest.raises(DomainException, match="Email already registered"):
+            await repo.save(User(id=None, name="Alice Again", email="ALICE@X.IO"))
+        return await repo.find_all()
+
+    assert len(run_with_repository(database_url, work)) == 1
+
+
+def test_create_writes_the_event_in_the_same_transaction(database_url):
+    def create(uow, email):
+        use_case = AsyncCreateUserUseCase(uow.users, uow.outbox)
+        return use_case.execute(UserCreateDTO(name="Alice Smith", email=email))
+
+    async def work(factory):
+        alice = await SQLAsyncUnitOfWork(factory).run(
+            lambda uow: create(uow, "alice@x.io")
+        )
+        #   Loses the race after the duplicate check: neither row may commit
+        async with SQLAsyncUnitOfWork(factory) as uow:
+            await uow.outbox.add(UserCreated(user_id=0, name="Again", email="a@x.io"))
+            with pytest.raises(DomainException, match="Email already registered"):
+                await uow.users.save(User(id=None, name="Again", email="ALICE@X.IO"))
+        async with factory() as session:
+            emails = (await session.scalars(select(UserModel.email))).all()
+            events = (await session.execute(select(OutboxModel))).scalars().all()
+        return alice, emails, events
+
+    alice, emails, events = run_with_factory(database_url, work)
+    assert emails == ["alice@x.io"]
+    assert [e.event_type for e in events] == ["UserCreated"]
+    assert f'"user_id": {alice.id}' in events[0].payload
@@ -0,0 +1,134 @@
+#   tests/test_backfill.py
+#   Runs run_backfill inside an Alembic environment, the way a revision's
+#   upgrade() would, against a small table of its own.
+import io
+from contextlib import contextmanager
+
+import pytest
+import sqlalchemy as sa
+from alembic.config import Config
+from alembic.operations import Operations
+from alembic.runtime.environment import EnvironmentContext
+from alembic.script import ScriptDirectory
+
+from migrations.backfill import checkpoints, reset_backfill, run_backfill
+from tests.conftest import ROOT
+
+ROWS = 25
+
+
+@contextmanager
+def migration(**options):
+    config = Config()
+    config.set_main_option("script_location", str(ROOT / "migrations"))
+    with EnvironmentContext(config, ScriptDirectory.from_config(config)) as env:
+        env.configure(**options)
+        with Operations.context(env.get_context()):
+            yield
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'backfill.db'}")
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text(
+                "CREATE TABLE items (id INTEGER PRIMARY KEY, value INTEGER, doubled INTEGER)"
+            )
+        )
+        connection.execute(
+            sa.text("INSERT INTO items (id, value) VALUES (:id, :id)"),
+            [{"id": i} for i in range(1, ROWS + 1)],
+        )
+    yield engine
+    engine.dispose()
+
+
+def backfill(engine, update, **kwargs):
+    with engine.connect() as connection:
+        with migration(connection=connection):
+            return run_backfill(
+                "items_doubled", "items", update, where="doubled IS NULL", **kwargs
+            )
+
+
+def checkpoint(engine):
+    with engine.connect() as connection:
+        return connection.execute(sa.select(checkpoints)).one()
+
+
+def doubled(engine):
+    with engine.connect() as connection:
+        return connection.execute(
+            sa.text("SELECT count(*) FROM items WHERE doubled = value * 2")
+        ).scalar()
+
+
+def test_backfill_runs_to_completion_once(engine):
+    assert backfill(engine, "doubled = value * 2", chunk_size=10) == ROWS
+    assert doubled(engine) == ROWS
+    state = checkpoint(engine)
+    assert (state.last_key, state.rows, state.completed) == (ROWS, ROWS, True)
+    assert backfill(engine, "doubled = value * 2", chunk_size=10) == 0
+
+
+def test_interrupted_backfill_resumes_after_the_last_committed_range(engine):
+    ranges = []
+
+    def crash_on_third_range(connection, low, high):
+        if len(ranges) == 2:
+            raise RuntimeError("killed")
+        ranges.append((low, high))
+        return connection.execute(
+            sa.text(
+                "UPDATE items SET doubled = value * 2 "
+                "WHERE id BETWEEN :low AND :high AND doubled IS NULL"
+            ),
+            {"low": low, "high": high},
+        ).rowcount
+
+    with pytest.raises(RuntimeError, match="killed"):
+        backfill(engine, crash_on_third_range, chunk_size=10)
+    #   Each range committed on its own, before the crash
+    assert doubled(engine) == 20
+    assert checkpoint(engine)[1:3] == (20, 20)
+
+    assert backfill(engine, "doubled = value * 2", chunk_size=10) == ROWS - 20
+    state = checkpoint(engine)
+    assert (state.rows, state.completed) == (ROWS, True)
+    assert doubled(engine) == ROWS
+
+    with engine.connect() as connection:
+        with migration(connection=connection):
+            reset_backfill("items_doubled")
+        connection.commit()
+        assert connection.execute(sa.select(checkpoints)).first() is None
+
+
+def test_offline_backfill_is_a_single_update():
+    script = io.StringIO()
+    with migration(dialect_name="sqlite", as_sql=True, output_buffer=script):
+        run_backfill(
+            "items_doubled", "items", "doubled = value * 2", where="doubled IS NULL"
+        )
+        with pytest.raises(RuntimeError, match="cannot be rendered offline"):
+            run_backfill("items_python", "items", lambda connection, low, high: 0)
+        reset_backfill("items_doubled")
+    assert script.getvalue().strip() == (
+        "UPDATE items SET doubled = value * 2 WHERE doubled IS NULL;"
+    )
+
+
+def test_offline_upgrade_renders_a_script(alembic, tmp_path):
+    url = f"sqlite:///{tmp_path / 'never-created.db'}"
+    result = alembic(url, "upgrade", "head", "--sql")
+    assert result.returncode == 0, result.stderr
+    for statement in (
+        "CREATE TABLE users",
+        "CREATE VIRTUAL TABLE users_search",
+        "CREATE TRIGGER stats_",
+        "INSERT INTO shard_layout",
+        "UPDATE alembic_version SET version_num='7a1d4e9b3c58'",
+    ):
+        assert statement in result.stdout
+    assert not (tmp_path / "never-created.db").exists()
@@ -0,0 +1,154 @@
+#   tests/test_batch_protocol.py
+import io
+import json
+from datetime import datetime
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy import select
+
+from infrastructure.database import session as db_session
+from infrastructure.database.access_tracker import AccessTracker
+from infrastructure.database.models import UserModel
+from infrastructure.database.unit_of_work import SQLUnitOfWork
+from interface.cli.batch import BatchHandler, serve_lines
+from interface.cli.user_cli import cli
+
+
+@pytest.fixture
+def tracker(session_factory):
+    tracker = AccessTracker(session_factory)
+    yield tracker
+    tracker.close()
+
+
+@pytest.fixture
+def handler(session_factory, tracker) -> BatchHandler:
+    return BatchHandler(
+        lambda read_only=False: SQLUnitOfWork(session_factory, read_only=read_only),
+        tracker,
+    )
+
+
+def last_access(session_factory, email):
+    with session_factory() as session:
+        return session.scalar(
+            select(UserModel.ultimo_acesso).where(UserModel.email == email)
+        )
+
+
+def responses(handler: BatchHandler, *requests) -> list:
+    out = io.StringIO()
+    lines = [r if isinstance(r, str) else json.dumps(r) for r in requests]
+    serve_lines(handler, lines, out.write)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_create_lookup_and_list(handler):
+    created, by_email, listed, done = responses(
+        handler,
+        {"cmd": "create", "name": "Alice Smith", "email": "alice@x.io", "ref": 1},
+        {"cmd": "lookup", "email": "ALICE@x.io", "ref": 2},
+        {"cmd": "list"},
+    )
+    assert created["ok"] and created["ref"] == 1
+    assert by_email["user"] == created["user"] and by_email["ref"] == 2
+    assert listed["user"] == created["user"]
+    assert done == {"ok": True, "done": True, "count": 1}
+
+
+@pytest.mark.parametrize(
+    "request_line",
+    [
+        "not json",
+        "[1, 2]",
+        {"cmd": None},
+        {"cmd": "drop"},
+        {"cmd": "create", "name": "Alice Smith"},
+        {"cmd": "list", "limit": "ten"},
+        {"cmd": "list", "page_size": 0},
+    ],
+)
+def test_malformed_requests_are_request_errors(handler, request_line):
+    (response,) = responses(handler, request_line)
+    assert response["ok"] is False
+    assert response["error"] == "request"
+
+
+@pytest.mark.parametrize(
+    "request_line",
+    [
+        {"cmd": ["x"]},
+        {"cmd": {"a": 1}},
+        {"cmd": "create", "name": "Alice Smith", "email": 5},
+        {"cmd": "lookup", "email": 5},
+        {"cmd": "lookup", "id": "1"},
+        {"cmd": "lookup", "id": True},
+        {"cmd": "access", "id": "1"},
+    ],
+)
+def test_mistyped_requests_are_request_errors(handler, request_line):
+    #   Checked before any use case runs, so they never surface as other errors
+    (response,) = responses(handler, request_line)
+    assert response["ok"] is False
+    assert response["error"] == "request"
+
+
+def test_bad_line_does_not_stop_the_stream(handler):
+    results = responses(
+        handler,
+        {"cmd": ["x"]},
+        {"cmd": "create", "name": "Bob Jones", "email": "bob@x.io"},
+    )
+    assert [r["ok"] for r in results] == [False, True]
+
+
+def test_domain_errors(handler):
+    first, duplicate, short = responses(
+        handler,
+        {"cmd": "create", "name": "Alice Smith", "email": "alice@x.io"},
+        {"cmd": "create", "name": "Alice Again", "email": "ALICE@X.IO"},
+        {"cmd": "create", "name": "Al", "email": "al@x.io"},
+    )
+    assert first["ok"]
+    assert duplicate["error"] == "domain" and short["error"] == "domain"
+
+
+def test_access_is_written_behind(handler, tracker, session_factory):
+    created, accessed, unknown = responses(
+        handler,
+        {"cmd": "create", "name": "Alice Smith", "email": "alice@x.io"},
+        {"cmd": "access", "email": "ALICE@x.io"},
+        {"cmd": "access", "id": 999},
+    )
+    assert accessed["user"] == created["user"] and unknown["user"] is None
+    assert tracker.pending == 1 and last_access(session_factory, "alice@x.io") is None
+    tracker.flush()
+    assert last_access(session_factory, "alice@x.io") is not None
+
+
+def test_access_needs_a_tracker(session_factory):
+    handler = BatchHandler(lambda read_only=False: SQLUnitOfWork(session_factory))
+    (response,) = responses(handler, {"cmd": "access", "id": 1})
+    assert response["error"] == "domain"
+
+
+def test_serve_flushes_accesses_on_shutdown(engine, session_factory, monkeypatch):
+    monkeypatch.setattr(db_session, "_engine", engine)
+    monkeypatch.setattr(db_session, "_session_factory", session_factory)
+    monkeypatch.setattr(db_session, "get_router", lambda: None)
+    requests = [
+        {"cmd": "create", "name": "Alice Smith", "email": "alice@x.io"},
+        {"cmd": "access", "email": "alice@x.io"},
+    ]
+    before = datetime.now()
+    result = CliRunner().invoke(
+        cli, ["serve"], input="".join(json.dumps(r) + "\n" for r in requests)
+    )
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line)["ok"] for line in result.output.splitlines()] == [
+        True,
+        True,
+    ]
+    #   Well within ACCESS_FLUSH_INTERVAL: written by the flush on exit
+    assert last_access(session_factory, "alice@x.io") >= before
@@ -0,0 +1,86 @@
+#   tests/test_cli_startup.py
+import os
+import subprocess
+import sys
+from dataclasses import replace
+
+import pytest
+from sqlalchemy import text
+
+from infrastructure import config
+from infrastructure.database import session as db_session
+from shared.exceptions import DatabaseException
+from tests.conftest import SRC
+
+#   Runs the CLI the way main.py does, then lists what it imported on stderr
+CLI = (
+    "import sys; sys.argv = ['dev-platform', *sys.argv[1:]]; import main\n"
+    "try:\n"
+    "    main.main()\n"
+    "finally:\n"
+    "    print(*sys.modules, file=sys.stderr)\n"
+)
+HEAVY = ("sqlalchemy", "dotenv", "infrastructure.database.session", "application")
+
+
+def run_cli(cwd, *args: str) -> subprocess.CompletedProcess:
+    env = {k: v for k, v in os.environ.items() if k != "DATABASE_URL"}
+    env["PYTHONPATH"] = str(SRC)
+    return subprocess.run(
+        [sys.executable, "-c", CLI, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+@pytest.mark.parametrize("args", [["--help"], ["import-users", "--help"]])
+def test_help_imports_no_database_layers(tmp_path, args):
+    #   No DATABASE_URL and no .env: help must not need either
+    result = run_cli(tmp_path, *args)
+    assert result.returncode == 0, result.stderr
+    assert "Usage:" in result.stdout
+    modules = set(result.stderr.split())
+    assert not [m for m in modules if m.split(".")[0] in HEAVY or m in HEAVY]
+
+
+@pytest.fixture
+def lazy_session(monkeypatch):
+    #   A fresh, unbuilt process-wide engine, torn down after the test
+    monkeypatch.setattr(db_session, "_engine", None)
+    monkeypatch.setattr(db_session, "_session_factory", None)
+    yield db_session
+    if db_session._engine is not None:
+        db_session._engine.dispose()
+
+
+def use_settings(monkeypatch, **changes):
+    settings = replace(config.get_settings(), **changes)
+    monkeypatch.setattr(db_session, "get_settings", lambda: settings)
+    return settings
+
+
+def test_engine_needs_a_database_url_only_when_used(lazy_session, monkeypatch):
+    use_settings(monkeypatch, database_url=None)
+    with pytest.raises(DatabaseException, match="DATABASE_URL is not set"):
+        lazy_session.get_engine()
+
+
+def test_engine_is_built_once_from_settings(lazy_session, monkeypatch, tmp_path):
+    settings = use_settings(
+        monkeypatch,
+        database_url=f"sqlite:///{tmp_path / 'lazy.db'}",
+        pool_size=3,
+        max_overflow=2,
+        sqlite_journal_mode="WAL",
+        sqlite_synchronous="FULL",
+    )
+    engine = lazy_session.get_engine()
+    assert lazy_session.Engine is engine
+    assert lazy_session.SessionLocal is lazy_session.get_sessionmaker()
+    assert (engine.pool.size(), engine.pool._max_overflow) == (3, 2)
+    assert engine.pool._pre_ping is settings.pool_pre_ping
+    with engine.connect() as connection:
+        assert connection.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert connection.scalar(text("PRAGMA synchronous")) == 2  #   FULL
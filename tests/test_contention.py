@@ -0,0 +1,114 @@
+#   tests/test_contention.py
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
+
+from infrastructure.database.contention import (
+    is_transient,
+    is_unique_violation,
+    retry_transient,
+)
+from shared.exceptions import DatabaseException, TransientDatabaseException
+
+
+class DriverError(Exception):
+    def __init__(self, *args, sqlstate=None):
+        super().__init__(*args)
+        self.sqlstate = sqlstate
+
+
+def wrapped(cls, orig):
+    return cls("INSERT INTO users ...", {}, orig)
+
+
+@pytest.mark.parametrize(
+    "error, transient",
+    [
+        (
+            wrapped(OperationalError, sqlite3.OperationalError("database is locked")),
+            True,
+        ),
+        (
+            wrapped(DBAPIError, DriverError("could not serialize", sqlstate="40001")),
+            True,
+        ),
+        (wrapped(DBAPIError, DriverError("deadlock detected", sqlstate="40P01")), True),
+        (wrapped(OperationalError, DriverError(1213, "Deadlock found")), True),
+        (
+            wrapped(OperationalError, sqlite3.OperationalError("no such table: x")),
+            False,
+        ),
+        (
+            wrapped(IntegrityError, sqlite3.IntegrityError("UNIQUE constraint failed")),
+            False,
+        ),
+        (RuntimeError("database is locked"), False),
+    ],
+)
+def test_is_transient(error, transient):
+    assert is_transient(error) is transient
+
+
+@pytest.mark.parametrize(
+    "message, sqlstate, unique",
+    [
+        ("UNIQUE constraint failed: users.email", None, True),
+        ("UNIQUE constraint failed: index 'ix_users_email_lower'", None, True),
+        (
+            'duplicate key value violates unique constraint "users_email_key"',
+            "23505",
+            True,
+        ),
+        ("UNIQUE constraint failed: projects.nome", None, False),
+        ("NOT NULL constraint failed: users.email", None, False),
+        ("FOREIGN KEY constraint failed", None, False),
+    ],
+)
+def test_is_unique_violation(message, sqlstate, unique):
+    error = wrapped(IntegrityError, DriverError(message, sqlstate=sqlstate))
+    assert (
+        is_unique_violation(
+            error, "users.email", "users_email_key", "ix_users_email_lower"
+        )
+        is unique
+    )
+
+
+def test_retry_transient_backs_off_until_the_operation_succeeds():
+    waits, calls = [], []
+
+    def operation():
+        calls.append(1)
+        if len(calls) < 4:
+            raise TransientDatabaseException("database is locked")
+        return "done"
+
+    assert (
+        retry_transient(operation, attempts=5, backoff=0.1, sleep=waits.append)
+        == "done"
+    )
+    assert len(calls) == 4 and len(waits) == 3
+    #   Full jitter under a cap that doubles with each attempt
+    assert all(0 <= wait <= 0.1 * 2**i for i, wait in enumerate(waits))
+
+
+def test_retry_transient_gives_up_and_skips_other_errors():
+    calls = []
+
+    def locked():
+        calls.append(1)
+        raise TransientDatabaseException("database is locked")
+
+    with pytest.raises(TransientDatabaseException):
+        retry_transient(locked, attempts=3, backoff=0, sleep=lambda s: None)
+    assert len(calls) == 3
+
+    def broken():
+        calls.append(1)
+        raise DatabaseException("no such table")
+
+    calls.clear()
+    with pytest.raises(DatabaseException, match="no such table"):
+        retry_transient(broken, attempts=3, backoff=0, sleep=lambda s: None)
+    assert len(calls) == 1
@@ -0,0 +1,69 @@
+#   tests/test_deactivate.py
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+
+from application.user.usecases import DeactivateInactiveUsersUseCase
+from infrastructure.database.models import UserModel
+from infrastructure.database.repositories import SQLUserRepository
+from infrastructure.database.unit_of_work import SQLUnitOfWork
+
+NOW = datetime(2024, 6, 1)
+
+
+def test_only_active_users_idle_since_the_cutoff_are_deactivated(session_factory):
+    last_accesses = [NOW - timedelta(days=90), NOW, None, NOW - timedelta(days=31)]
+    cutoff = NOW - timedelta(days=30)
+    with session_factory() as session:
+        session.execute(
+            insert(UserModel),
+            [
+                {"name": f"User {i}", "email": f"u{i}@x.io", "ultimo_acesso": when}
+                for i, when in enumerate(last_accesses)
+            ],
+        )
+        session.commit()
+        repo = SQLUserRepository(session)
+        assert repo.count_inactive(cutoff) == 2
+        assert repo.deactivate_inactive(cutoff, 1, 1) == 1
+        #   Rows already deactivated no longer match, so ranges can be re-run
+        assert repo.deactivate_inactive(cutoff, 1, 4) == 1
+        assert repo.count_inactive(cutoff) == 0
+        ativo = session.scalars(select(UserModel.ativo).order_by(UserModel.id))
+        assert ativo.all() == [False, True, True, False]
+
+
+def test_resuming_from_next_id_skips_processed_chunks(session_factory):
+    with session_factory() as session:
+        session.execute(
+            insert(UserModel),
+            [
+                {
+                    "name": f"User {i}",
+                    "email": f"u{i}@x.io",
+                    "ultimo_acesso": NOW - timedelta(days=90),
+                }
+                for i in range(10)
+            ],
+        )
+        session.commit()
+
+    class Interrupted(Exception):
+        pass
+
+    def stop_after_first_chunk(report):
+        raise Interrupted(report.next_id)
+
+    with SQLUnitOfWork(session_factory) as uow:
+        use_case = DeactivateInactiveUsersUseCase(uow)
+        try:
+            use_case.execute(
+                30, chunk_size=4, now=NOW, on_progress=stop_after_first_chunk
+            )
+        except Interrupted as e:
+            (next_id,) = e.args
+        assert next_id == 5
+        report = use_case.execute(30, chunk_size=4, start_id=next_id, now=NOW)
+    assert (report.matched, report.last_id, report.next_id) == (6, 10, 11)
+    with session_factory() as session:
+        assert not any(session.scalars(select(UserModel.ativo)))
@@ -0,0 +1,106 @@
+#   tests/test_export_users.py
+import bz2
+import csv
+import gzip
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from domain.user.batch import UserBatch
+from domain.user.entities import User
+from infrastructure.database import session as db_session
+from infrastructure.database.repositories import SQLUserRepository
+from infrastructure.files.user_writers import (
+    detect_compression,
+    detect_format,
+    write_users,
+)
+from interface.cli.user_cli import cli
+from shared.exceptions import DomainException
+
+ROWS = [(1, "Alice Smith", "alice@x.io"), (2, "José Souza", "jose@x.io")]
+
+
+def batches():
+    #   Two batches, to check every batch is written
+    return [UserBatch.from_rows(ROWS[:1]), UserBatch.from_rows(ROWS[1:])]
+
+
+@pytest.mark.parametrize(
+    "path, fmt, compression",
+    [
+        ("users.csv", "csv", "none"),
+        ("users.CSV.gz", "csv", "gzip"),
+        ("users.ndjson.bz2", "jsonl", "bz2"),
+        ("users.parquet", "parquet", "none"),
+        ("users.txt", None, "none"),
+    ],
+)
+def test_format_and_compression_follow_the_extension(path, fmt, compression):
+    assert (detect_format(path), detect_compression(path)) == (fmt, compression)
+
+
+def test_csv_is_written_with_a_header(tmp_path):
+    path = tmp_path / "users.csv.gz"
+    assert write_users(batches(), str(path)) == 2
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+        assert list(csv.reader(f)) == [["id", "name", "email"]] + [
+            [str(i), name, email] for i, name, email in ROWS
+        ]
+
+
+def test_jsonl_is_written_one_object_per_line(tmp_path):
+    path = tmp_path / "users.out"
+    assert write_users(batches(), str(path), "jsonl", "bz2") == 2
+    with bz2.open(path, "rt", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": i, "name": name, "email": email} for i, name, email in ROWS
+    ]
+    assert "José" in lines[1]  #   Not escaped to é
+
+
+def test_parquet_writes_a_row_group_per_batch(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "users.parquet"
+    assert write_users(batches(), str(path), compression="zstd") == 2
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 2
+    assert parquet.metadata.row_group(0).column(0).compression == "ZSTD"
+    assert parquet.read().to_pylist() == [
+        {"id": i, "name": name, "email": email} for i, name, email in ROWS
+    ]
+
+
+@pytest.mark.parametrize(
+    "path, fmt, compression, message",
+    [
+        ("users.txt", None, None, "Cannot detect file format"),
+        ("users.csv", None, "zstd", "csv supports none"),
+        ("users.parquet", None, "bz2", "Parquet supports"),
+        ("-", "csv", "gzip", "Compressed output needs a file path"),
+        ("-", "parquet", None, "Parquet output needs a file path"),
+    ],
+)
+def test_unsupported_outputs_are_domain_errors(path, fmt, compression, message):
+    with pytest.raises(DomainException, match=message):
+        write_users(batches(), path, fmt, compression)
+
+
+def test_export_users_streams_the_table(engine, session_factory, monkeypatch, tmp_path):
+    monkeypatch.setattr(db_session, "_engine", engine)
+    monkeypatch.setattr(db_session, "_session_factory", session_factory)
+    monkeypatch.setattr(db_session, "get_router", lambda: None)
+    with session_factory() as session:
+        SQLUserRepository(session).save_many(
+            User(id=None, name=f"User {i}", email=f"u{i}@x.io") for i in range(5)
+        )
+    path = tmp_path / "users.jsonl"
+    result = CliRunner().invoke(cli, ["export-users", str(path), "--batch-size", "2"])
+    assert result.output == f"Exported 5 users to {path}\n"
+    emails = [json.loads(line)["email"] for line in path.read_text().splitlines()]
+    assert emails == [f"u{i}@x.io" for i in range(5)]
+
+    result = CliRunner().invoke(cli, ["export-users", "-", "--format", "csv"])
+    assert result.output.splitlines()[:2] == ["id,name,email", "1,User 0,u0@x.io"]
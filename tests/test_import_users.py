@@ -0,0 +1,75 @@
+#   tests/test_import_users.py
+import pytest
+from sqlalchemy import func, select
+
+from application.user.dtos import UserCreateDTO
+from application.user.usecases import ImportUsersUseCase, ValidateUsersUseCase
+from infrastructure.database.models import OutboxModel, UserModel
+from infrastructure.database.unit_of_work import SQLUnitOfWork
+from infrastructure.files.user_readers import read_user_rows
+from shared.exceptions import DomainException
+
+LINES = [
+    '{"name": "Alice Smith", "email": "alice@x.io"}',
+    '{"name": "Bob Jones", "email": "bob@x.io"',
+    "",
+    '["Carol", "carol@x.io"]',
+    '{"name": "Dave Brown", "email": "not-an-email"}',
+    '{"name": "Erin Green", "email": "ALICE@x.io"}',
+    '{"name": "Frank White", "email": "frank@x.io"}',
+]
+
+
+def write_jsonl(tmp_path):
+    path = tmp_path / "users.jsonl"
+    path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_csv_rows_keep_their_line_numbers(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "email,name\nalice@x.io, Alice Smith \n\nbob@x.io,Bob Jones\n", encoding="utf-8"
+    )
+    assert list(read_user_rows(str(path))) == [
+        (2, UserCreateDTO(name="Alice Smith", email="alice@x.io")),
+        (4, UserCreateDTO(name="Bob Jones", email="bob@x.io")),
+    ]
+
+
+def test_unusable_files_are_domain_errors(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text("name\nAlice Smith\n", encoding="utf-8")
+    with pytest.raises(DomainException, match="missing columns: email"):
+        list(read_user_rows(str(path)))
+    with pytest.raises(DomainException, match="Cannot detect file format"):
+        read_user_rows(str(tmp_path / "users.txt"))
+
+
+def test_unreadable_jsonl_lines_are_row_failures(tmp_path):
+    rows = list(read_user_rows(write_jsonl(tmp_path)))
+    assert [line for line, _ in rows] == [1, 2, 4, 5, 6, 7]
+    assert rows[1][1].line == 2 and rows[1][1].reason.startswith("Invalid JSON")
+    assert rows[2][1].reason == "Expected a JSON object"
+
+
+def test_import_reports_every_failing_line_and_keeps_going(tmp_path, session_factory):
+    path = write_jsonl(tmp_path)
+    with SQLUnitOfWork(session_factory) as uow:
+        use_case = ImportUsersUseCase(uow.users, uow.outbox)
+        report = use_case.execute(read_user_rows(path), batch_size=2)
+        uow.commit()
+    assert report.imported == 2
+    assert [f.line for f in report.failures] == [2, 4, 5, 6]
+    assert "Email already registered" in report.failures[3].reason
+    with session_factory() as session:
+        emails = session.scalars(select(UserModel.email).order_by(UserModel.id))
+        assert emails.all() == ["alice@x.io", "frank@x.io"]
+        outbox = select(func.count()).select_from(OutboxModel)
+        assert session.scalar(outbox) == 2
+
+
+def test_validate_reports_unreadable_lines(tmp_path):
+    report = ValidateUsersUseCase().execute(read_user_rows(write_jsonl(tmp_path)))
+    assert report.checked == 6
+    assert [f.line for f in report.failures] == [2, 4, 5, 6]
@@ -0,0 +1,54 @@
+#   tests/test_load_generator.py
+import pytest
+from sqlalchemy import func, select
+
+from infrastructure.database import session as db_session
+from infrastructure.database.models import UserModel
+from interface.cli.load_generator import (
+    LoadTestReport,
+    run_load_test,
+    synthetic_users,
+)
+from shared.exceptions import DomainException
+
+
+@pytest.fixture
+def default_database(engine, session_factory, monkeypatch):
+    #   The harness opens its units of work on the process-wide engine
+    monkeypatch.setattr(db_session, "_engine", engine)
+    monkeypatch.setattr(db_session, "_session_factory", session_factory)
+    monkeypatch.setattr(db_session, "get_router", lambda: None)
+    return session_factory
+
+
+def test_synthetic_users_repeat_emails_at_the_duplicate_rate():
+    #   A duplicate reuses the previous user's email
+    users = synthetic_users(200, duplicate_rate=0.25, seed=7)
+    repeats = sum(users[i][1] == users[i - 1][1] for i in range(1, len(users)))
+    assert 20 < repeats < 80
+    assert len({email for _, email in users}) == len(users) - repeats
+    assert len({email for _, email in synthetic_users(50)}) == 50
+
+
+def test_every_request_gets_an_outcome(default_database):
+    users = synthetic_users(40, duplicate_rate=0.3, seed=1)
+    distinct = len({email for _, email in users})
+    report = run_load_test(users, workers=4)
+    assert report.requests == 40 and report.elapsed_seconds > 0
+    assert report.outcomes == {"created": distinct, "duplicate": 40 - distinct}
+    assert report.latencies == sorted(report.latencies)
+    assert "40 requests with 4 thread workers" in report.summary()
+    with default_database() as session:
+        count = session.scalar(select(func.count()).select_from(UserModel))
+    assert count == distinct
+
+
+def test_percentiles_use_the_nearest_rank():
+    report = LoadTestReport(mode="thread", workers=1, latencies=[0.1, 0.2, 0.3, 0.4])
+    assert [report.percentile(p) for p in (0, 50, 75, 100)] == [0.1, 0.2, 0.3, 0.4]
+    assert LoadTestReport(mode="thread", workers=1).percentile(99) == 0.0
+
+
+def test_rejects_unknown_modes():
+    with pytest.raises(DomainException, match="mode must be one of"):
+        run_load_test([], mode="fiber")
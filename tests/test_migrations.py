@@ -0,0 +1,23 @@
+#   tests/test_migrations.py
+import sqlite3
+
+
+def test_lower_email_index_lists_case_duplicates(alembic, tmp_path):
+    path = tmp_path / "old.db"
+    url = f"sqlite:///{path}"
+    assert alembic(url, "upgrade", "5b1e0c3a9f21").returncode == 0
+    with sqlite3.connect(path) as db:
+        db.executemany(
+            "INSERT INTO users (name, email) VALUES (?, ?)",
+            [("Alice", "alice@x.io"), ("Bob", "bob@x.io"), ("Alice 2", "ALICE@x.io")],
+        )
+    upgrade = alembic(url, "upgrade", "head")
+    assert upgrade.returncode != 0
+    assert "2 users share an email with another user ignoring case" in upgrade.stderr
+    assert "id=1 email=alice@x.io" in upgrade.stderr
+    assert "id=3 email=ALICE@x.io" in upgrade.stderr
+    assert "bob@x.io" not in upgrade.stderr
+
+    with sqlite3.connect(path) as db:
+        db.execute("UPDATE users SET email = 'alice2@x.io' WHERE id = 3")
+    assert alembic(url, "upgrade", "head").returncode == 0
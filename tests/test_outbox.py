@@ -0,0 +1,88 @@
+#   tests/test_outbox.py
+import threading
+from dataclasses import dataclass
+
+import pytest
+from sqlalchemy import func, select
+
+from infrastructure.database.models import OutboxModel
+from infrastructure.database.outbox import OutboxRelay, SQLOutbox
+from shared.exceptions import DeliveryException, TransientDatabaseException
+
+
+@dataclass
+class Pinged:
+    n: int
+
+
+@pytest.fixture
+def queued(session_factory):
+    with session_factory() as session:
+        SQLOutbox(session).add_many(Pinged(n) for n in range(5))
+        session.commit()
+    return session_factory
+
+
+def outbox_size(session_factory) -> int:
+    with session_factory() as session:
+        return session.scalar(select(func.count()).select_from(OutboxModel))
+
+
+def test_drain_delivers_in_order_and_empties_the_outbox(queued):
+    delivered = []
+    relay = OutboxRelay(queued, delivered.append, batch_size=2)
+    assert relay.drain() == 5
+    assert [[m.payload["n"] for m in batch] for batch in delivered] == [
+        [0, 1],
+        [2, 3],
+        [4],
+    ]
+    assert delivered[0][0].event_type == "Pinged"
+    assert outbox_size(queued) == 0 and relay.drain() == 0
+
+
+def test_sink_failure_leaves_the_batch_in_the_outbox(queued):
+    def sink(messages):
+        raise OSError("disk full")
+
+    with pytest.raises(DeliveryException, match="disk full"):
+        OutboxRelay(queued, sink, batch_size=2).relay_batch()
+    assert outbox_size(queued) == 5
+
+
+def test_run_retries_after_sink_failures(queued, caplog):
+    stop = threading.Event()
+    delivered, calls = [], []
+
+    def sink(messages):
+        calls.append(len(messages))
+        if len(calls) <= 2:
+            raise OSError("unreachable")
+        delivered.extend(m.payload["n"] for m in messages)
+        if len(delivered) == 5:
+            stop.set()
+
+    relay = OutboxRelay(queued, sink, batch_size=2)
+    relay.run(poll_interval=0, stop=stop, retry_delay=0)
+    assert delivered == [0, 1, 2, 3, 4]
+    assert outbox_size(queued) == 0
+    assert caplog.text.count("retrying") == 2
+
+
+def test_run_retries_after_lock_conflicts(queued, caplog, monkeypatch):
+    stop = threading.Event()
+    delivered = []
+    relay = OutboxRelay(queued, delivered.extend, batch_size=5)
+    drain, failures = relay.drain, []
+
+    def locked_then_drain():
+        if len(failures) < 2:
+            failures.append(1)
+            raise TransientDatabaseException("database is locked")
+        stop.set()
+        return drain()
+
+    monkeypatch.setattr(relay, "drain", locked_then_drain)
+    relay.run(poll_interval=0, stop=stop, retry_delay=0)
+    assert len(delivered) == 5 and outbox_size(queued) == 0
+    assert caplog.text.count("database is locked; retrying") == 2
@@ -0,0 +1,117 @@
+#   tests/test_profiling.py
+import asyncio
+
+import pytest
+from sqlalchemy import select, update
+
+from domain.user.entities import User
+from infrastructure.database.instrumentation import instrument_engine
+from infrastructure.database.models import UserModel
+from infrastructure.database.repositories import SQLUserRepository
+from infrastructure.database.session import build_engine
+from shared import profiling
+from shared.profiling import Profiler, profiled
+
+
+class Clock:
+    #   Stands in for the time module: advances only when told to
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self):
+        return self.now
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    profiler = Profiler()
+    monkeypatch.setattr(profiling, "_profiler", profiler)
+    return profiler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(profiling, "time", clock)
+    return clock
+
+
+def test_instrumented_engine_counts_fetched_and_affected_rows(database_url):
+    profiler = Profiler()
+    engine = build_engine(database_url)
+    instrument_engine(engine, profiler)
+    try:
+        with engine.begin() as connection:
+            rows = [{"name": f"User {i}", "email": f"u{i}@x.io"} for i in range(5)]
+            connection.execute(UserModel.__table__.insert(), rows)
+            connection.execute(
+                update(UserModel).where(UserModel.id <= 3).values(ativo=False)
+            )
+            assert len(connection.execute(select(UserModel.id)).all()) == 5
+            result = connection.execute(select(UserModel.email).order_by(UserModel.id))
+            assert result.fetchmany(2) == [("u0@x.io",), ("u1@x.io",)]
+            result.close()
+    finally:
+        engine.dispose()
+    queries = {k.split(" ")[0]: s for k, s in profiler.queries.items()}
+    assert queries["UPDATE"].rows == 3
+    ids = [s for k, s in profiler.queries.items() if k.startswith("SELECT users.id")]
+    emails = [
+        s for k, s in profiler.queries.items() if k.startswith("SELECT users.email")
+    ]
+    assert ids[0].rows == 5 and ids[0].count == 1
+    assert emails[0].rows == 2  #   Only what was fetched
+
+
+def test_repository_reads_are_counted(engine, session_factory):
+    profiler = Profiler()
+    instrument_engine(engine, profiler)
+    with session_factory() as session:
+        repo = SQLUserRepository(session)
+        repo.save_many(
+            User(id=None, name=f"User {i}", email=f"u{i}@x.io") for i in range(7)
+        )
+        assert len(list(repo.iter_all(page_size=3))) == 7
+    assert profiler.totals()["rows"] >= 7
+    pages = [s for k, s in profiler.queries.items() if "LIMIT" in k]
+    assert sum(s.rows for s in pages) == 7
+
+
+def test_async_streams_are_timed_while_consumed(profiler, clock):
+    class UseCase:
+        @profiled
+        def stream(self):
+            async def users():
+                for i in range(3):
+                    clock.now += 1  #   Work done to produce a user
+                    yield i
+
+            return users()
+
+    async def consume():
+        items = []
+        async for item in UseCase().stream():
+            clock.now += 10  #   The caller's own work is not the use case's
+            items.append(item)
+        return items
+
+    assert asyncio.run(consume()) == [0, 1, 2]
+    stats = profiler.usecases[
+        "test_async_streams_are_timed_while_consumed.<locals>.UseCase.stream"
+    ]
+    assert (stats.count, stats.total_seconds) == (1, 3)
+
+
+def test_async_generator_functions_are_timed_while_consumed(profiler, clock):
+    @profiled
+    async def numbers():
+        for i in range(2):
+            clock.now += 2
+            yield i
+
+    async def consume():
+        return [item async for item in numbers()]
+
+    assert asyncio.run(consume()) == [0, 1]
+    (stats,) = profiler.usecases.values()
+    assert stats.total_seconds == 4
@@ -0,0 +1,83 @@
+#   tests/test_projeto_repository.py
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete, func, insert, select
+
+from domain.models import Projeto
+from infrastructure.database.models import ProjectMemberModel, ProjectModel, UserModel
+from infrastructure.database.repositories import SQLProjetoRepository
+
+
+@pytest.fixture
+def session(session_factory):
+    with session_factory() as session:
+        session.execute(
+            insert(UserModel),
+            [{"name": f"User {i}", "email": f"u{i}@x.io"} for i in range(1, 9)],
+        )
+        session.commit()
+        yield session
+
+
+@pytest.fixture
+def repo(session):
+    return SQLProjetoRepository(session)
+
+
+def new_project(membros=None):
+    return Projeto(
+        id=None,
+        nome="Apollo",
+        descricao="Moon",
+        data_criacao=datetime(2024, 1, 1),
+        responsavel_id=3,
+        membros=membros,
+    )
+
+
+def memberships(session):
+    return session.scalar(select(func.count()).select_from(ProjectMemberModel))
+
+
+def test_save_and_load_keep_members_in_insertion_order(repo):
+    projeto = repo.save(new_project([5, 1, 7]))
+    loaded = repo.find_by_id(projeto.id)
+    assert (loaded.nome, loaded.descricao, loaded.responsavel_id) == (
+        "Apollo",
+        "Moon",
+        3,
+    )
+    assert loaded.membros == [5, 1, 7, 3]
+    loaded.adicionar_membros([2, 5])
+    loaded.remover_membro(1)
+    repo.save(loaded)
+    assert repo.find_members(projeto.id) == [5, 7, 3, 2]
+    assert repo.find_members(projeto.id, after_usuario_id=7, limit=1) == [3]
+    assert repo.find_projects_of_user(2) == [projeto.id]
+
+
+def test_saving_a_project_loaded_without_members_keeps_them(repo):
+    projeto = repo.save(new_project([5, 1, 7]))
+    partial = repo.find_by_id(projeto.id, with_members=False)
+    assert partial.membros == [3]
+    partial.nome = "Artemis"
+    partial.adicionar_membro(8)
+    repo.save(partial)
+    assert repo.find_by_id(projeto.id).nome == "Artemis"
+    assert repo.find_members(projeto.id) == [5, 1, 7, 3, 8]
+    assert repo.remove_members(projeto.id, [1, 3]) == 1  #   Never the responsible
+    assert repo.count_members(projeto.id) == 4
+
+
+def test_deleting_users_and_projects_removes_their_memberships(repo, session):
+    apollo = repo.save(new_project([5, 1]))
+    gemini = repo.save(new_project([5, 2]))
+    session.execute(delete(UserModel).where(UserModel.id == 5))
+    session.commit()
+    assert repo.find_members(apollo.id) == [1, 3]
+    assert repo.find_members(gemini.id) == [2, 3]
+    session.execute(delete(ProjectModel).where(ProjectModel.id == apollo.id))
+    session.commit()
+    assert repo.find_by_id(apollo.id) is None
+    assert memberships(session) == 2
@@ -0,0 +1,50 @@
+#   tests/test_read_path.py
+import pytest
+from sqlalchemy import event
+
+from domain.user.entities import User
+from infrastructure.database import repositories
+from infrastructure.database.repositories import SQLUserRepository
+
+USERS = [User(id=None, name=f"User {i}", email=f"U{i}@x.io") for i in range(5)]
+
+
+@pytest.fixture
+def saved(session_factory):
+    with session_factory() as session:
+        SQLUserRepository(session).save_many(USERS)
+    return [
+        User(id=i, name=u.name, email=u.email) for i, u in enumerate(USERS, start=1)
+    ]
+
+
+@pytest.fixture
+def statements(engine):
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+def test_reads_select_three_columns_and_build_no_orm_objects(
+    saved, statements, session_factory, monkeypatch
+):
+    monkeypatch.setattr(repositories, "FETCH_SIZE", 2)  #   Several partitions
+    with session_factory() as session:
+        repo = SQLUserRepository(session)
+        assert repo.find_all() == saved
+        assert list(repo.iter_all(page_size=2)) == saved
+        assert list(repo.find_all_batch(after_id=1, limit=3)) == saved[1:4]
+        assert repo.find_by_id(3) == saved[2]
+        assert repo.find_by_email("u3@X.IO") == saved[3]
+        assert repo.find_by_id(99) is None and repo.find_by_email("no@x.io") is None
+        assert len(session.identity_map) == 0
+    selects = [s for s in statements if s.startswith("SELECT")]
+    assert len(selects) == 9
+    for statement in selects:
+        assert statement.startswith(
+            "SELECT users.id, users.name, users.email \nFROM users"
+        )
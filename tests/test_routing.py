@@ -0,0 +1,70 @@
+#   tests/test_routing.py
+import shutil
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from domain.user.entities import User
+from infrastructure.database.repositories import SQLUserRepository
+from infrastructure.database.routing import ReplicaRouter, RoutingSession
+from infrastructure.database.session import build_engine
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def setup(migrated_template, tmp_path):
+    #   The "replica" is a separate copy that never receives the primary's writes,
+    #   so a read that lands there cannot see them
+    primary_path, replica_path = tmp_path / "primary.db", tmp_path / "replica.db"
+    shutil.copy(migrated_template, primary_path)
+    shutil.copy(migrated_template, replica_path)
+    primary = build_engine(f"sqlite:///{primary_path}")
+    replica = build_engine(f"sqlite:///{replica_path}")
+    clock = Clock()
+    router = ReplicaRouter(primary, [replica], read_your_writes_window=2.0, clock=clock)
+    factory = sessionmaker(
+        class_=RoutingSession, router=router, read_only=True, autoflush=False
+    )
+    yield factory, clock, primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def test_reads_go_to_the_replica(setup):
+    factory, _, _, replica = setup
+    with factory() as session:
+        assert SQLUserRepository(session).find_all() == []
+        assert session.get_bind() is replica
+
+
+def test_read_after_write_in_the_same_session(setup):
+    factory, _, primary, _ = setup
+    with factory() as session:
+        repo = SQLUserRepository(session)
+        assert repo.find_by_email("alice@x.io") is None  #   Picks the replica
+        repo.save(User(id=None, name="Alice Smith", email="alice@x.io"))
+        found = repo.find_by_email("alice@x.io")
+        assert found is not None and found.name == "Alice Smith"
+        assert session.get_bind() is primary
+
+
+def test_read_your_writes_window_expires(setup):
+    factory, clock, primary, replica = setup
+    with factory() as session:
+        SQLUserRepository(session).save(
+            User(id=None, name="Alice Smith", email="a@x.io")
+        )
+    with factory() as session:
+        assert SQLUserRepository(session).find_by_email("a@x.io") is not None
+        assert session.get_bind() is primary
+    clock.now += 5
+    with factory() as session:
+        assert SQLUserRepository(session).find_by_email("a@x.io") is None
+        assert session.get_bind() is replica
@@ -0,0 +1,93 @@
+#   tests/test_search.py
+import pytest
+from sqlalchemy import delete, event, update
+from sqlalchemy.orm import Session
+
+from domain.user.entities import User
+from infrastructure.database.models import UserModel
+from infrastructure.database.repositories import SQLUserRepository
+from infrastructure.database.session import build_engine
+
+BEFORE_SEARCH_INDEX = "f81b6d3e2a47"
+NAMES = [
+    ("Alice Smith", "alice@x.io"),
+    ("Malice Jones", "mj@x.io"),
+    ("Bob Alicent", "bob@x.io"),
+    ("Carol White", "carol@alice.io"),
+]
+
+
+def capture_sql(engine):
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+def add_users(repo):
+    return repo.save_many(User(id=None, name=n, email=e) for n, e in NAMES)
+
+
+def emails(users):
+    return [u.email for u in users]
+
+
+@pytest.fixture
+def repo(engine, session_factory):
+    with session_factory() as session:
+        repo = SQLUserRepository(session)
+        add_users(repo)
+        yield repo
+
+
+def test_trigram_index_finds_substrings_in_rank_order(engine, repo):
+    statements = capture_sql(engine)
+    found = repo.search("ALICE")
+    assert any("MATCH" in s for s in statements)
+    #   Email prefix, name prefix, name-word prefix, then other substrings
+    assert emails(found) == ["alice@x.io", "bob@x.io", "mj@x.io", "carol@alice.io"]
+    assert emails(repo.search("alice@x.io")) == ["alice@x.io"]
+    assert emails(repo.search("lice", limit=2, offset=1)) == ["mj@x.io", "bob@x.io"]
+
+
+def test_short_terms_use_like(engine, repo):
+    statements = capture_sql(engine)
+    assert emails(repo.search("bo")) == ["bob@x.io"]
+    assert not any("MATCH" in s for s in statements)
+    assert repo.search("  ") == []
+
+
+def test_index_follows_updates_and_deletes(repo):
+    session = repo.session
+    session.execute(
+        update(UserModel).where(UserModel.email == "alice@x.io").values(name="Zed Doe")
+    )
+    session.execute(delete(UserModel).where(UserModel.email == "bob@x.io"))
+    session.commit()
+    assert emails(repo.search("zed")) == ["alice@x.io"]
+    assert emails(repo.search("smith")) == []
+    assert emails(repo.search("bob")) == []
+
+
+def test_like_fallback_until_the_index_is_migrated(alembic, tmp_path):
+    url = f"sqlite:///{tmp_path / 'old.db'}"
+    alembic(url, "upgrade", BEFORE_SEARCH_INDEX).check_returncode()
+    engine = build_engine(url)
+    statements = capture_sql(engine)
+    try:
+        with Session(engine) as session:
+            repo = SQLUserRepository(session)
+            add_users(repo)
+            assert emails(repo.search("alice"))[0] == "alice@x.io"
+            assert not any("MATCH" in s for s in statements)
+            session.close()  #   Releases the connection for the migration
+            alembic(url, "upgrade", "head").check_returncode()
+            statements.clear()
+            #   The same repository picks up the new index
+            assert emails(repo.search("alice"))[0] == "alice@x.io"
+            assert any("MATCH" in s for s in statements)
+    finally:
+        engine.dispose()
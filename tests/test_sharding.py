@@ -0,0 +1,233 @@
+#   tests/test_sharding.py
+import shutil
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from domain.user.entities import User
+from infrastructure.config import get_settings
+from infrastructure.database import sharding, unit_of_work
+from infrastructure.database.models import ProjectModel, UserModel
+from infrastructure.database.session import build_engine
+from infrastructure.database.sharding import (
+    ShardedStatsRepository,
+    ShardedUserRepository,
+    decode_id,
+    reshard,
+    shard_for_email,
+)
+from infrastructure.database.stats import SQLStatsRepository
+from infrastructure.database.unit_of_work import SQLUnitOfWork
+from shared.exceptions import (
+    DatabaseException,
+    DomainException,
+    TransientDatabaseException,
+)
+
+EMAILS = [f"user{i}@x.io" for i in range(40)]
+
+
+@pytest.fixture
+def engines(migrated_template, tmp_path):
+    engines = []
+    for k in range(3):
+        path = tmp_path / f"shard{k}.db"
+        shutil.copy(migrated_template, path)
+        engines.append(build_engine(f"sqlite:///{path}"))
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+@pytest.fixture
+def users(engines):
+    #   Saved on the first two shards; the third is added by reshard
+    repo = ShardedUserRepository(engines[:2])
+    saved = [
+        repo.save(User(id=None, name=f"User {i}", email=e))
+        for i, e in enumerate(EMAILS)
+    ]
+    repo.close()
+    return saved
+
+
+def movers(users):
+    return [u for u in users if shard_for_email(u.email, 3) != decode_id(u.id)[1]]
+
+
+def local_row(engines, user_id):
+    local_id, shard = decode_id(user_id)
+    with Session(engines[shard]) as session:
+        return session.get(UserModel, local_id)
+
+
+def test_reshard_moves_users_to_their_new_owner(engines, users):
+    moves = {}
+    report = reshard(engines, 2, chunk_size=7, on_move=moves.__setitem__)
+    moved = movers(users)
+    assert moved and report.moved == len(moved) and report.scanned == len(users)
+    assert set(moves) == {u.id for u in moved}
+    repo = ShardedUserRepository(engines)
+    try:
+        for user in users:
+            found = repo.find_by_email(user.email)
+            assert found.id == moves.get(user.id, user.id)
+            assert decode_id(found.id)[1] == shard_for_email(user.email, 3)
+        assert len(repo.find_all()) == len(users)
+    finally:
+        repo.close()
+    assert reshard(engines, 3).moved == 0  #   Nothing left to move
+
+
+def test_reshard_refuses_to_move_project_members(engines, users):
+    owner = movers(users)[0]
+    local_id, shard = decode_id(owner.id)
+    with Session(engines[shard]) as session:
+        session.execute(
+            insert(ProjectModel).values(
+                nome="Apollo",
+                descricao="",
+                data_criacao=datetime(2024, 1, 1),
+                responsavel_id=local_id,
+            )
+        )
+        session.commit()
+    with pytest.raises(DomainException, match="own or belong to a project"):
+        reshard(engines, 2)
+    assert local_row(engines, owner.id) is not None
+    with Session(engines[2]) as session:
+        assert session.scalars(select(UserModel.id)).all() == []
+
+
+def test_reshard_copies_again_users_updated_during_the_move(
+    engines, users, monkeypatch
+):
+    mover = movers(users)[0]
+    seen = datetime(2024, 5, 1, 12, 0)
+    copy_users = sharding._copy_users
+
+    def copy_then_update(engine, rows):
+        ids = copy_users(engine, rows)
+        if not hasattr(copy_then_update, "done"):
+            copy_then_update.done = True  #   A write landing between copy and delete
+            local_id, shard = decode_id(mover.id)
+            with Session(engines[shard]) as session:
+                session.execute(
+                    update(UserModel)
+                    .where(UserModel.id == local_id)
+                    .values(ultimo_acesso=seen, ativo=False)
+                )
+                session.commit()
+        return ids
+
+    monkeypatch.setattr(sharding, "_copy_users", copy_then_update)
+    report = reshard(engines, 2, chunk_size=1000)
+    assert report.retried > 0 and report.moved == len(movers(users))
+    repo = ShardedUserRepository(engines)
+    try:
+        moved = repo.find_by_email(mover.email)
+    finally:
+        repo.close()
+    row = local_row(engines, moved.id)
+    assert (row.ultimo_acesso, row.ativo) == (seen, False)
+
+
+def test_user_writes_are_refused_while_and_after_resharding(
+    engines, users, monkeypatch
+):
+    old = ShardedUserRepository(engines[:2])
+    copy_users = sharding._copy_users
+    refused = []
+
+    def copy_then_write(engine, rows):
+        if not refused:
+            with pytest.raises(DatabaseException, match="being resharded") as error:
+                old.save(User(id=None, name="Late", email="late@x.io"))
+            refused.append(error)
+        return copy_users(engine, rows)
+
+    monkeypatch.setattr(sharding, "_copy_users", copy_then_write)
+    reshard(engines, 2)
+    assert refused
+    try:
+        with pytest.raises(DatabaseException, match="resharded to 3 shards"):
+            old.save(User(id=None, name="Late", email="late@x.io"))
+    finally:
+        old.close()
+    new = ShardedUserRepository(engines)
+    try:
+        late = new.save(User(id=None, name="Late", email="late@x.io"))
+        assert decode_id(late.id)[1] == shard_for_email(late.email, 3)
+        assert new.find_by_email("late@x.io") == late
+    finally:
+        new.close()
+
+
+def test_reshard_without_ordered_returning(engines, users, monkeypatch):
+    #   As on MySQL: copied users get their ids looked up by email
+    for engine in engines:
+        monkeypatch.setattr(
+            engine.dialect,
+            "insert_executemany_returning_sort_by_parameter_order",
+            False,
+        )
+    moves = {}
+    reshard(engines, 2, chunk_size=7, on_move=moves.__setitem__)
+    repo = ShardedUserRepository(engines)
+    try:
+        for user in movers(users):
+            assert repo.find_by_id(moves[user.id]).email == user.email
+    finally:
+        repo.close()
+
+
+def test_stats_add_up_user_summaries_over_the_shards(engines, users):
+    with Session(engines[0]) as session:
+        session.execute(update(UserModel).values(ultimo_acesso=datetime(2024, 1, 1)))
+        session.commit()
+    on_first = len([u for u in users if decode_id(u.id)[1] == 0])
+    repo = ShardedUserRepository(engines[:2])
+    try:
+        with Session(engines[2]) as primary:
+            stats = ShardedStatsRepository(repo, SQLStatsRepository(primary))
+            assert stats.user_totals() == (len(users), 0)
+            assert stats.active_users_by_access_day([(None, None)]) == [on_first]
+            repo.deactivate_inactive(datetime(2024, 6, 1), 0, max(u.id for u in users))
+            assert stats.user_totals() == (len(users) - on_first, on_first)
+            stats.rebuild()
+            assert stats.user_totals() == (len(users) - on_first, on_first)
+            assert stats.active_users_by_access_day([(None, None)]) == [0]
+    finally:
+        repo.close()
+
+
+def test_units_of_work_refuse_the_outbox_with_shards(monkeypatch, session_factory):
+    settings = replace(get_settings(), shard_urls=("sqlite://",))
+    monkeypatch.setattr(unit_of_work, "get_settings", lambda: settings)
+    with pytest.raises(DatabaseException, match="OUTBOX_ENABLED=0"):
+        SQLUnitOfWork(session_factory).__enter__()
+    settings = replace(settings, outbox_enabled=False)
+    with SQLUnitOfWork(session_factory) as uow:
+        assert uow.outbox is None
+
+
+def test_units_of_work_are_not_retried_over_shard_writes(
+    engines, monkeypatch, session_factory
+):
+    repo = ShardedUserRepository(engines)
+    monkeypatch.setattr(unit_of_work, "get_sharded_user_repository", lambda: repo)
+    saved = []
+
+    def work(uow):
+        saved.append(uow.users.save(User(id=None, name="Alice", email="a@x.io")))
+        raise TransientDatabaseException("database is locked")
+
+    try:
+        with pytest.raises(TransientDatabaseException):
+            SQLUnitOfWork(session_factory).run(work)
+        assert len(saved) == 1 and len(repo.find_all()) == 1
+    finally:
+        repo.close()
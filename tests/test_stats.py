@@ -0,0 +1,166 @@
+#   tests/test_stats.py
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from infrastructure.database.models import (
+    ProjectMemberCountModel,
+    ProjectMemberModel,
+    ProjectModel,
+    StatsCounterModel,
+    UserAccessDayModel,
+    UserModel,
+)
+from infrastructure.database.session import build_engine
+from infrastructure.database.stats import SQLStatsRepository
+
+DAY = datetime(2024, 3, 1, 9, 30)
+BEFORE_STATS = "b6e3d18f0c74"
+
+
+def summaries(session):
+    #   Counter slots and zero rows are bookkeeping; compare what they add up to
+    counters = dict(
+        session.execute(
+            select(StatsCounterModel.name, func.sum(StatsCounterModel.value)).group_by(
+                StatsCounterModel.name
+            )
+        ).all()
+    )
+    days = dict(
+        session.execute(
+            select(UserAccessDayModel.day, UserAccessDayModel.active_users).where(
+                UserAccessDayModel.active_users != 0
+            )
+        ).all()
+    )
+    members = dict(
+        session.execute(
+            select(
+                ProjectMemberCountModel.project_id, ProjectMemberCountModel.members
+            ).where(ProjectMemberCountModel.members != 0)
+        ).all()
+    )
+    return counters, days, members
+
+
+def workload(session):
+    session.execute(
+        insert(UserModel),
+        [
+            {
+                "name": f"User {i}",
+                "email": f"u{i}@x.io",
+                "ultimo_acesso": DAY + timedelta(days=i % 4) if i % 5 else None,
+            }
+            for i in range(30)
+        ],
+    )
+    ids = session.scalars(select(UserModel.id).order_by(UserModel.id)).all()
+    session.execute(
+        update(UserModel).where(UserModel.id.in_(ids[:6])).values(ativo=False)
+    )
+    session.execute(update(UserModel).where(UserModel.id == ids[2]).values(ativo=True))
+    session.execute(
+        update(UserModel)
+        .where(UserModel.id.in_(ids[10:15]))
+        .values(ultimo_acesso=DAY + timedelta(days=7))
+    )
+    session.execute(
+        update(UserModel).where(UserModel.id == ids[16]).values(ultimo_acesso=None)
+    )
+    session.execute(delete(UserModel).where(UserModel.id.in_(ids[25:])))
+    session.execute(
+        insert(ProjectModel),
+        [
+            {
+                "nome": f"P{p}",
+                "descricao": "",
+                "data_criacao": DAY,
+                "responsavel_id": ids[p],
+            }
+            for p in range(4)
+        ],
+    )
+    projects = session.scalars(select(ProjectModel.id).order_by(ProjectModel.id)).all()
+    session.execute(
+        insert(ProjectMemberModel),
+        [
+            {"project_id": project, "user_id": user}
+            for n, project in enumerate(projects)
+            for user in ids[: 3 + 4 * n]
+        ],
+    )
+    session.execute(
+        delete(ProjectMemberModel).where(
+            ProjectMemberModel.project_id == projects[2],
+            ProjectMemberModel.user_id.in_(ids[:5]),
+        )
+    )
+    session.execute(
+        delete(ProjectMemberModel).where(ProjectMemberModel.project_id == projects[3])
+    )
+    session.execute(delete(ProjectModel).where(ProjectModel.id == projects[3]))
+    session.commit()
+
+
+@pytest.fixture
+def session(session_factory):
+    with session_factory() as session:
+        yield session
+
+
+def test_triggers_match_rebuild(session):
+    workload(session)
+    maintained = summaries(session)
+    SQLStatsRepository(session).rebuild()
+    session.commit()
+    assert maintained == summaries(session)
+
+
+def test_totals_read_the_summaries(session):
+    workload(session)
+    stats = SQLStatsRepository(session)
+    assert stats.user_totals() == (20, 5)
+    assert stats.project_totals() == (3, 3 + 7 + 6)
+    assert [members for _, _, members in stats.largest_projects(5)] == [7, 6, 3]
+    everyone, first_day = stats.active_users_by_access_day(
+        [(None, None), (DAY.date(), DAY.date())]
+    )
+    assert everyone == session.scalar(
+        select(func.count()).where(
+            UserModel.ativo, UserModel.ultimo_acesso.is_not(None)
+        )
+    )
+    assert first_day == session.scalar(
+        select(func.count()).where(
+            UserModel.ativo,
+            func.date(UserModel.ultimo_acesso) == DAY.date().isoformat(),
+        )
+    )
+
+
+def test_offline_migration_counts_existing_rows(alembic, tmp_path):
+    #   The rendered script has no counts to copy: it must compute them itself
+    path = tmp_path / "offline.db"
+    url = f"sqlite:///{path}"
+    alembic(url, "upgrade", BEFORE_STATS).check_returncode()
+    engine = build_engine(url)
+    try:
+        with Session(engine) as session:
+            workload(session)
+        script = alembic(url, "upgrade", f"{BEFORE_STATS}:head", "--sql")
+        assert script.returncode == 0, script.stderr
+        with sqlite3.connect(path) as db:
+            db.executescript(script.stdout)
+        with Session(engine) as session:
+            migrated = summaries(session)
+            SQLStatsRepository(session).rebuild()
+            session.commit()
+            assert migrated == summaries(session)
+            assert migrated[0]["users_active"] == 20
+    finally:
+        engine.dispose()
@@ -0,0 +1,61 @@
+#   tests/test_user_batch.py
+from datetime import datetime
+
+import pytest
+
+from domain.models import Projeto, Usuario
+from domain.user.batch import UserBatch
+from domain.user.entities import User
+from infrastructure.database.repositories import SQLUserRepository
+
+USERS = [User(id=i, name=f"User {i}", email=f"u{i}@x.io") for i in (3, 5, 8)]
+
+
+@pytest.mark.parametrize(
+    "entity",
+    [
+        USERS[0],
+        Usuario(id=1, nome="Alice", email="alice@x.io", data_criacao=datetime.now()),
+        Projeto(
+            id=1,
+            nome="Site",
+            descricao="",
+            data_criacao=datetime.now(),
+            responsavel_id=1,
+            membros=[1, 2],
+        ),
+    ],
+)
+def test_entities_are_slotted(entity):
+    assert not hasattr(entity, "__dict__")
+    with pytest.raises(AttributeError):
+        entity.apelido = "x"
+
+
+def test_batch_hands_out_users_from_its_columns():
+    batch = UserBatch.from_users(USERS)
+    assert len(batch) == 3 and batch.ids.typecode == "q"
+    assert batch[1] == USERS[1] and batch[-1] == USERS[2]
+    assert list(batch) == USERS
+    assert list(batch.rows()) == [(u.id, u.name, u.email) for u in USERS]
+    tail = batch[1:]
+    assert isinstance(tail, UserBatch) and list(tail) == USERS[1:]
+    assert list(UserBatch.from_rows(batch.rows())) == USERS
+
+
+def test_batch_only_holds_persisted_users():
+    with pytest.raises(ValueError, match="persisted"):
+        UserBatch.from_users([User(id=None, name="New User", email="new@x.io")])
+
+
+def test_repository_reads_into_a_batch(session_factory):
+    with session_factory() as session:
+        repo = SQLUserRepository(session)
+        repo.save_many(
+            User(id=None, name=f"User {i}", email=f"u{i}@x.io") for i in range(5)
+        )
+        saved = repo.find_all()
+        batch = repo.find_all_batch()
+        assert isinstance(batch, UserBatch) and list(batch) == saved
+        page = repo.find_all_batch(after_id=saved[1].id, limit=2)
+        assert list(page) == saved[2:4]
@@ -0,0 +1,78 @@
+#   tests/test_user_cache.py
+from dataclasses import replace
+
+import pytest
+
+from domain.user.entities import User
+from infrastructure.cache import user_cache
+from infrastructure.cache.user_cache import CachedUserRepository
+from infrastructure.config import get_settings
+from infrastructure.database.repositories import SQLUserRepository
+from infrastructure.database.unit_of_work import SQLUnitOfWork
+
+
+def test_reads_are_cached_until_evicted_or_expired(session_factory):
+    now = [0.0]
+    with session_factory() as session:
+        cache = CachedUserRepository(
+            SQLUserRepository(session), max_size=2, ttl=10, clock=lambda: now[0]
+        )
+        alice, bob, carol = (
+            cache.save(User(id=None, name=f"User {n}", email=f"{n}@x.io"))
+            for n in ("alice", "bob", "carol")
+        )
+        assert cache.find_by_id(bob.id) == bob
+        assert cache.find_by_id(alice.id) == alice  #   Evicted by carol
+        cache.find_by_email("bob@x.io").name = "Changed"  #   Callers get copies
+        now[0] = 11
+        assert cache.find_by_id(bob.id) == bob  #   Expired, read again
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 2)
+    assert (stats.evictions, stats.expirations, stats.size) == (2, 1, 2)
+
+
+def test_exists_many_counts_hits_and_misses(session_factory):
+    with session_factory() as session:
+        repo = SQLUserRepository(session)
+        cache = CachedUserRepository(repo)
+        cache.save(User(id=None, name="Alice Smith", email="alice@x.io"))
+        repo.save(User(id=None, name="Bob Jones", email="bob@x.io"))  #   Not cached
+        found = cache.exists_many(["ALICE@x.io", "bob@x.io", "nobody@x.io"])
+    assert found == {"ALICE@x.io", "bob@x.io"}
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    settings = replace(get_settings(), user_cache_enabled=True)
+    monkeypatch.setattr(user_cache, "get_settings", lambda: settings)
+    monkeypatch.setattr(user_cache, "_shared_cache", None)
+
+
+def test_units_of_work_share_the_cache(enabled, session_factory):
+    def create(uow):
+        return uow.users.save(User(id=None, name="Alice Smith", email="alice@x.io"))
+
+    alice = SQLUnitOfWork(session_factory).run(create)
+    for _ in range(3):
+        with SQLUnitOfWork(session_factory, read_only=True) as uow:
+            assert uow.users.find_by_id(alice.id) == alice
+    stats = user_cache.user_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+
+
+def test_rolled_back_writes_never_reach_the_cache(enabled, session_factory):
+    with SQLUnitOfWork(session_factory) as uow:
+        bob = uow.users.save(User(id=None, name="Bob Jones", email="bob@x.io"))
+        assert uow.users.find_by_email("bob@x.io") == bob  #   Own uncommitted write
+        uow.rollback()
+    with SQLUnitOfWork(session_factory, read_only=True) as uow:
+        assert uow.users.find_by_email("bob@x.io") is None
+        assert uow.users.find_by_id(bob.id) is None
+    assert user_cache.user_cache_stats().size == 0
+
+
+def test_disabled_by_default(session_factory):
+    with SQLUnitOfWork(session_factory) as uow:
+        assert isinstance(uow.users, SQLUserRepository)
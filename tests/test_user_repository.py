@@ -0,0 +1,98 @@
+#   tests/test_user_repository.py
+import pytest
+
+from domain.user.entities import User, normalize_email
+from infrastructure.database.repositories import DUPLICATE_EMAIL, SQLUserRepository
+from shared.exceptions import DatabaseException
+
+
+@pytest.fixture(params=["returning", "no-returning"])
+def repo(request, engine, session_factory, monkeypatch):
+    if request.param == "no-returning":
+        #   As on MySQL, which has no INSERT ... RETURNING
+        monkeypatch.setattr(engine.dialect, "insert_returning", False)
+        monkeypatch.setattr(
+            engine.dialect,
+            "insert_executemany_returning_sort_by_parameter_order",
+            False,
+        )
+    with session_factory() as session:
+        yield SQLUserRepository(session)
+
+
+def users(*emails):
+    return [User(id=None, name=f"User {i}", email=e) for i, e in enumerate(emails)]
+
+
+def test_save_assigns_ids(repo):
+    saved = repo.save(User(id=None, name="Alice Smith", email="alice@x.io"))
+    assert repo.find_by_id(saved.id) == saved
+
+
+def test_emails_match_regardless_of_case(repo):
+    alice = repo.save(User(id=None, name="Alice Smith", email="Alice@X.io"))
+    assert repo.find_by_email("aLICE@x.IO") == alice
+    assert repo.exists_many(["ALICE@x.io", "bob@x.io", "alice@X.IO"]) == {
+        "ALICE@x.io",
+        "alice@X.IO",
+    }
+
+
+def test_save_many_reports_duplicates_and_keeps_the_rest(repo):
+    repo.save(User(id=None, name="Alice Smith", email="alice@x.io"))
+    batch = users("a@x.io", "ALICE@x.io", "b@x.io", "B@x.io", "c@x.io")
+    result = repo.save_many(batch, batch_size=2)
+    assert result.saved == 3
+    assert [(f.index, f.user.email, f.reason) for f in result.failures] == [
+        (1, "ALICE@x.io", DUPLICATE_EMAIL),
+        (3, "B@x.io", DUPLICATE_EMAIL),
+    ]
+    for user in (batch[0], batch[2], batch[4]):
+        assert repo.find_by_email(user.email) == user
+    assert batch[1].id is None and batch[3].id is None
+
+
+def test_save_many_falls_back_to_rows_when_a_batch_hits_the_constraint(
+    repo, monkeypatch
+):
+    #   Another writer registered an email after the duplicate pre-check
+    repo.save(User(id=None, name="Alice Smith", email="alice@x.io"))
+    monkeypatch.setattr(repo, "_existing_keys", lambda keys: set())
+    batch = users("a@x.io", "Alice@x.io", "b@x.io")
+    result = repo.save_many(batch)
+    assert result.saved == 2
+    assert [f.index for f in result.failures] == [1]
+    assert [u.email for u in repo.find_all()] == ["alice@x.io", "a@x.io", "b@x.io"]
+    assert repo.find_by_id(batch[2].id).email == "b@x.io"
+
+
+def test_other_integrity_errors_are_not_duplicates(repo):
+    #   NOT NULL on name, not the email constraint
+    with pytest.raises(DatabaseException, match="NOT NULL"):
+        repo.save(User(id=None, name=None, email="alice@x.io"))
+    with pytest.raises(DatabaseException, match="NOT NULL"):
+        repo.save_many(users("a@x.io") + [User(id=None, name=None, email="b@x.io")])
+    assert repo.find_all() == []
+
+
+def test_only_ascii_letters_are_folded_like_the_database(repo):
+    #   SQLite's lower() leaves "É" alone, so these are different emails there
+    assert normalize_email("ÉMILE@X.IO") == "Émile@x.io"
+    batch = users("Émile@x.io", "émile@x.io", "ÉMILE@x.io")
+    result = repo.save_many(batch)
+    assert result.saved == 2 and [f.index for f in result.failures] == [2]
+    assert repo.exists_many(["ÉMILE@X.IO", "éMILE@x.io"]) == {
+        "ÉMILE@X.IO",
+        "éMILE@x.io",
+    }
+
+
+def test_iter_all_pages_by_id(repo):
+    saved = [repo.save(user) for user in users(*(f"u{i}@x.io" for i in range(10)))]
+    assert list(repo.iter_all(page_size=3)) == saved
+    assert list(repo.iter_all(page_size=3, after_id=saved[3].id)) == saved[4:]
+    assert list(repo.iter_all(page_size=4, after_id=saved[1].id, limit=5)) == saved[2:7]
+    assert list(repo.iter_all(page_size=5, limit=10)) == saved
+    assert list(repo.iter_all(after_id=saved[-1].id)) == []
+    with pytest.raises(ValueError):
+        next(repo.iter_all(page_size=0))
@@ -0,0 +1,47 @@
+#   tests/test_validation.py
+import pytest
+
+from application.user.dtos import UserCreateDTO
+from application.user.usecases import ValidateUsersUseCase
+from domain.user.entities import User
+from domain.user.validation import DUPLICATE_IN_BATCH, validate_batch
+
+
+@pytest.mark.parametrize(
+    "name, email",
+    [
+        ("Alice Smith", "alice@x.io"),
+        ("", "alice@x.io"),
+        ("Al", "alice@x.io"),
+        ("Alice Smith", ""),
+        ("Alice Smith", "alice.x.io"),
+        ("Al", "alice.x.io"),
+        ("", ""),
+    ],
+)
+def test_validate_batch_agrees_with_user_validate(name, email):
+    #   The batch lists every error of a row; User.validate raises the first
+    messages = validate_batch([name], [email]).by_row().get(0, [])
+    try:
+        User(id=None, name=name, email=email).validate()
+    except ValueError as e:
+        assert messages and messages[0] == str(e)
+    else:
+        assert messages == []
+
+
+def test_validate_finds_duplicates_across_batches():
+    rows = [
+        (line, UserCreateDTO(name=f"User {line}", email=email))
+        for line, email in enumerate(
+            ["a@x.io", "b@x.io", "bad", "B@X.IO", "c@x.io", "a@x.io", "bad"], start=2
+        )
+    ]
+    report = ValidateUsersUseCase().execute(rows, batch_size=2)
+    assert report.checked == 7
+    assert [(f.line, f.reason) for f in report.failures] == [
+        (4, "Invalid email format"),
+        (5, DUPLICATE_IN_BATCH),
+        (7, DUPLICATE_IN_BATCH),
+        (8, "Invalid email format"),
+    ]